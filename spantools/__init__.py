@@ -1,13 +1,14 @@
-# "noqa" setting stops flake8 from flagging unused imports in __init__
+"""
+Modules that import marshmallow, protobuf, bson, yaml or rapidjson are only imported
+when one of their names is first accessed (PEP 562), so processes which only need
+:class:`MimeType`, the headers helpers or the error classes start quickly.
+"""
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
 
 from ._version import __version__  # noqa
 
 from ._mimetype import MimeType
-from ._encoders import EncoderType, DecoderType, DEFAULT_ENCODERS, DEFAULT_DECODERS
-from ._models import Error, PagingReq, PagingResp
-from ._content_dump import encode_content, EncoderIndexType
-from ._content_load import decode_content, DecoderIndexType
-from ._utils import convert_params_headers
 from ._typing import RecordType, MimeTypeTolerant, DataSchemaType
 from ._errors import (
     SpanError,
@@ -18,29 +19,265 @@ from ._errors import (
     InvalidAPIErrorCodeError,
     NoErrorReturnedError,
 )
+from ._headers_view import HeadersView
+from ._utils import convert_params_headers, format_param_value
 
-(
-    MimeType,
-    MimeTypeTolerant,  # type: ignore
-    EncoderType,  # type: ignore
-    DecoderType,  # type: ignore
-    DataSchemaType,
-    encode_content,
-    decode_content,
-    convert_params_headers,
-    SpanError,
-    ContentEncodeError,
-    ContentDecodeError,
-    NoContentError,
-    ContentTypeUnknownError,
-    InvalidAPIErrorCodeError,
-    NoErrorReturnedError,
-    Error,
-    PagingReq,
-    PagingResp,
-    RecordType,
-    DEFAULT_DECODERS,
-    DEFAULT_ENCODERS,
-    EncoderIndexType,
-    DecoderIndexType,
-)
+if TYPE_CHECKING:  # pragma: no cover
+    from ._encoders import (
+        EncoderType,
+        DecoderType,
+        iter_msgpack_records,
+        iter_cbor_sequence,
+        iter_csv_chunks,
+        iter_csv_records,
+        schema_csv_fields,
+    )
+    from ._models import (
+        Error,
+        ErrorBatch,
+        PagingReq,
+        PagingResp,
+        PagingCursorReq,
+        PagingCursorResp,
+        encode_cursor,
+        decode_cursor,
+    )
+    from ._codecs import (
+        CodecRegistry,
+        DEFAULT_CODECS,
+        DEFAULT_ENCODERS,
+        DEFAULT_DECODERS,
+        UNSNIFFABLE_MIMETYPES,
+        codec_key,
+    )
+    from ._content_dump import encode_content, EncoderIndexType
+    from ._content_load import decode_content, DecoderIndexType
+    from ._negotiate import negotiate
+    from ._proto import (
+        ProtoCodec,
+        iter_proto_messages,
+        iter_proto_frames,
+    )
+    from ._compression import (
+        Compressor,
+        GzipCompressor,
+        DeflateCompressor,
+        ZstdCompressor,
+        BrotliCompressor,
+        CompressorIndexType,
+        DEFAULT_COMPRESSORS,
+        COMPRESS_MIN_SIZE,
+        ZSTD_DICTIONARY_ID_HEADER,
+        compress_content,
+        decompress_content,
+    )
+    from ._zstd_training import train_zstd_dictionary
+    from ._schema import CompiledSchema, compile_schema
+    from ._validation import (
+        ValidationPolicy,
+        ValidateNever,
+        ValidateSample,
+        ValidateFirstN,
+        ValidateUnderSize,
+        ValidationStats,
+    )
+    from ._headers import build_response_headers
+    from ._paging import (
+        Page,
+        iter_pages,
+        aiter_pages,
+        fan_out_pages,
+        afan_out_pages,
+        page_requests,
+        FetchType,
+        AsyncFetchType,
+    )
+    from ._numpy import (
+        ndarray_to_bytes,
+        ndarray_from_bytes,
+        NDARRAY_BSON_SUBTYPE,
+        NDARRAY_MAGIC,
+        NDARRAY_MSGPACK_CODE,
+    )
+    from . import errors_api  # noqa: F401
+
+
+_LAZY_ATTRIBUTES: Dict[str, Tuple[str, ...]] = {
+    "._encoders": (
+        "EncoderType",
+        "DecoderType",
+        "iter_msgpack_records",
+        "iter_cbor_sequence",
+        "iter_csv_chunks",
+        "iter_csv_records",
+        "schema_csv_fields",
+    ),
+    "._models": (
+        "Error",
+        "ErrorBatch",
+        "PagingReq",
+        "PagingResp",
+        "PagingCursorReq",
+        "PagingCursorResp",
+        "encode_cursor",
+        "decode_cursor",
+    ),
+    "._codecs": (
+        "CodecRegistry",
+        "DEFAULT_CODECS",
+        "DEFAULT_ENCODERS",
+        "DEFAULT_DECODERS",
+        "UNSNIFFABLE_MIMETYPES",
+        "codec_key",
+    ),
+    "._content_dump": ("encode_content", "EncoderIndexType"),
+    "._content_load": ("decode_content", "DecoderIndexType"),
+    "._negotiate": ("negotiate",),
+    "._proto": ("ProtoCodec", "iter_proto_messages", "iter_proto_frames"),
+    "._compression": (
+        "Compressor",
+        "GzipCompressor",
+        "DeflateCompressor",
+        "ZstdCompressor",
+        "BrotliCompressor",
+        "CompressorIndexType",
+        "DEFAULT_COMPRESSORS",
+        "COMPRESS_MIN_SIZE",
+        "ZSTD_DICTIONARY_ID_HEADER",
+        "compress_content",
+        "decompress_content",
+    ),
+    "._zstd_training": ("train_zstd_dictionary",),
+    "._schema": ("CompiledSchema", "compile_schema"),
+    "._validation": (
+        "ValidationPolicy",
+        "ValidateNever",
+        "ValidateSample",
+        "ValidateFirstN",
+        "ValidateUnderSize",
+        "ValidationStats",
+    ),
+    "._headers": ("build_response_headers",),
+    "._paging": (
+        "Page",
+        "iter_pages",
+        "aiter_pages",
+        "fan_out_pages",
+        "afan_out_pages",
+        "page_requests",
+        "FetchType",
+        "AsyncFetchType",
+    ),
+    "._numpy": (
+        "ndarray_to_bytes",
+        "ndarray_from_bytes",
+        "NDARRAY_BSON_SUBTYPE",
+        "NDARRAY_MAGIC",
+        "NDARRAY_MSGPACK_CODE",
+    ),
+}
+"""Names imported on first access, by the module they are defined in."""
+
+_LAZY_INDEX: Dict[str, str] = {
+    name: module for module, names in _LAZY_ATTRIBUTES.items() for name in names
+}
+
+_LAZY_SUBMODULES = ("errors_api",)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_INDEX.get(name)
+    if module_name is not None:
+        value = getattr(importlib.import_module(module_name, __name__), name)
+        # Cached on the package, so later lookups do not come through here.
+        globals()[name] = value
+        return value
+    elif name in _LAZY_SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_INDEX) | set(_LAZY_SUBMODULES))
+
+
+__all__ = [
+    "MimeType",
+    "MimeTypeTolerant",
+    "EncoderType",
+    "DecoderType",
+    "DataSchemaType",
+    "encode_content",
+    "decode_content",
+    "negotiate",
+    "convert_params_headers",
+    "format_param_value",
+    "build_response_headers",
+    "HeadersView",
+    "SpanError",
+    "ContentEncodeError",
+    "ContentDecodeError",
+    "NoContentError",
+    "ContentTypeUnknownError",
+    "InvalidAPIErrorCodeError",
+    "NoErrorReturnedError",
+    "Error",
+    "ErrorBatch",
+    "PagingReq",
+    "PagingResp",
+    "PagingCursorReq",
+    "PagingCursorResp",
+    "encode_cursor",
+    "decode_cursor",
+    "RecordType",
+    "DEFAULT_DECODERS",
+    "DEFAULT_ENCODERS",
+    "iter_msgpack_records",
+    "iter_cbor_sequence",
+    "iter_csv_chunks",
+    "iter_csv_records",
+    "schema_csv_fields",
+    "EncoderIndexType",
+    "DecoderIndexType",
+    "CodecRegistry",
+    "DEFAULT_CODECS",
+    "UNSNIFFABLE_MIMETYPES",
+    "codec_key",
+    "ProtoCodec",
+    "iter_proto_messages",
+    "iter_proto_frames",
+    "Compressor",
+    "GzipCompressor",
+    "DeflateCompressor",
+    "ZstdCompressor",
+    "BrotliCompressor",
+    "CompressorIndexType",
+    "DEFAULT_COMPRESSORS",
+    "COMPRESS_MIN_SIZE",
+    "ZSTD_DICTIONARY_ID_HEADER",
+    "compress_content",
+    "decompress_content",
+    "train_zstd_dictionary",
+    "CompiledSchema",
+    "compile_schema",
+    "ValidationPolicy",
+    "ValidateNever",
+    "ValidateSample",
+    "ValidateFirstN",
+    "ValidateUnderSize",
+    "ValidationStats",
+    "Page",
+    "iter_pages",
+    "aiter_pages",
+    "fan_out_pages",
+    "afan_out_pages",
+    "page_requests",
+    "FetchType",
+    "AsyncFetchType",
+    "ndarray_to_bytes",
+    "ndarray_from_bytes",
+    "NDARRAY_BSON_SUBTYPE",
+    "NDARRAY_MAGIC",
+    "NDARRAY_MSGPACK_CODE",
+]
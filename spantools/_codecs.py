@@ -0,0 +1,315 @@
+from typing import Any, Dict, Iterator, List, Mapping, MutableMapping, NamedTuple
+from typing import Optional, Tuple, Union
+
+from ._mimetype import MimeType
+from ._typing import MimeTypeTolerant
+from ._encoders import EncoderType, DecoderType, _BUILTIN_ENCODERS, _BUILTIN_DECODERS
+
+
+_INDEX_MAX_SIZE = 1024
+"""Number of distinct unregistered mimetype spellings a registry remembers."""
+
+_CodecKeyType = Union[MimeType, str]
+
+UNSNIFFABLE_MIMETYPES: Tuple[_CodecKeyType, ...] = (
+    MimeType.TEXT,
+    MimeType.PROTO,
+    MimeType.PROTO_STREAM,
+    MimeType.CSV,
+    MimeType.TSV,
+)
+"""Mimetypes whose decoders would accept almost any body, so are never sniffed."""
+
+
+class _Codec(NamedTuple):
+    encoder: Optional[EncoderType]
+    decoder: Optional[DecoderType]
+    sniff_priority: Optional[int]
+
+
+_NO_CODEC = _Codec(None, None, None)
+
+_SniffOrderType = List[Tuple[_CodecKeyType, DecoderType]]
+_SniffCacheType = Tuple[Dict[_CodecKeyType, _Codec], _SniffOrderType]
+_EncoderMimetypesCacheType = Tuple[
+    Dict[_CodecKeyType, _Codec], Tuple[_CodecKeyType, ...]
+]
+
+
+def codec_key(mimetype: Union[MimeType, str]) -> _CodecKeyType:
+    """
+    Normalizes ``mimetype`` to the key codecs are registered under: the
+    :class:`MimeType` it names, or else its lowercased ``type/subtype`` with any
+    ``x-`` prefixes and parameters removed.
+    """
+    if isinstance(mimetype, MimeType):
+        return mimetype
+
+    try:
+        return MimeType.from_name(mimetype)
+    except ValueError:
+        return MimeType._clean_text(mimetype).strip()
+
+
+class CodecRegistry:
+    """
+    Encoders and decoders by mimetype, for :func:`encode_content` and
+    :func:`decode_content`.
+
+    Mimetypes are normalized with :func:`codec_key` when codecs are registered, so
+    ``"application/x-yaml"``, ``"YAML"`` and ``MimeType.YAML`` all name the same
+    codec. Every spelling a registry is asked for is remembered in a lookup index, so
+    resolving a mimetype is usually a single dict lookup.
+    """
+
+    def __init__(self, parent: Optional["CodecRegistry"] = None):
+        """
+        :param parent: registry to start from. The parent's codecs are shared until
+            either registry registers a codec, at which point it takes its own copy.
+            Codecs registered with ``parent`` after that are not picked up.
+        """
+        # Registering replaces these dicts rather than changing them, so they can be
+        # shared with derived registries and read by other threads without locks.
+        if parent is None:
+            self._codecs: Dict[_CodecKeyType, _Codec] = dict()
+            self._index: Dict[MimeTypeTolerant, _Codec] = dict()
+        else:
+            self._codecs = parent._codecs
+            self._index = parent._index
+        self._sniff_order: Optional[_SniffCacheType] = None
+        self._encoder_mimetypes: Optional[_EncoderMimetypesCacheType] = None
+
+    @classmethod
+    def from_mappings(
+        cls,
+        encoders: Mapping[MimeTypeTolerant, EncoderType],
+        decoders: Mapping[MimeTypeTolerant, DecoderType],
+    ) -> "CodecRegistry":
+        """
+        Builds a registry from encoder and decoder dicts, like
+        :data:`DEFAULT_ENCODERS` and :data:`DEFAULT_DECODERS`. Decoders are sniffed in
+        the order of ``decoders``, except mimetypes in :data:`UNSNIFFABLE_MIMETYPES`.
+        """
+        registry = cls()
+        for mimetype, encoder in encoders.items():
+            # A None key can never be looked up, so is not registered.
+            if mimetype is not None:
+                registry.register(mimetype, encoder=encoder)
+
+        keyed = [(m, decoder) for m, decoder in decoders.items() if m is not None]
+        sniffable = [m for m, _ in keyed if codec_key(m) not in UNSNIFFABLE_MIMETYPES]
+        for mimetype, decoder in keyed:
+            priority = None
+            if mimetype in sniffable:
+                priority = len(sniffable) - sniffable.index(mimetype)
+            registry.register(mimetype, decoder=decoder, sniff_priority=priority)
+
+        return registry
+
+    def register(
+        self,
+        mimetype: Union[MimeType, str],
+        encoder: Optional[EncoderType] = None,
+        decoder: Optional[DecoderType] = None,
+        sniff_priority: Optional[int] = None,
+    ) -> None:
+        """
+        Registers an encoder and / or decoder for ``mimetype``, replacing any
+        registered for the same normalized mimetype. Arguments left as ``None`` keep
+        what is already registered.
+
+        :param mimetype: mimetype, or any alias :class:`MimeType` resolves.
+        :param encoder: encodes data to bytes.
+        :param decoder: decodes bytes to data.
+        :param sniff_priority: if set, ``decoder`` is tried when sniffing bodies with
+            no mimetype, before decoders with a lower priority. Sniffing is only safe
+            for formats which reject bodies in other formats.
+        """
+        key = codec_key(mimetype)
+        codecs = dict(self._codecs)
+
+        registered = codecs.get(key, _NO_CODEC)
+        codecs[key] = _Codec(
+            encoder=encoder if encoder is not None else registered.encoder,
+            decoder=decoder if decoder is not None else registered.decoder,
+            sniff_priority=(
+                sniff_priority
+                if sniff_priority is not None
+                else registered.sniff_priority
+            ),
+        )
+        self._swap_codecs(codecs)
+
+    def _unregister(self, mimetype: MimeTypeTolerant, kind: str) -> None:
+        """
+        Removes the ``kind`` (``"encoder"`` or ``"decoder"``) codec of ``mimetype``.
+
+        :raises KeyError: If no such codec is registered.
+        """
+        if mimetype is None:
+            raise KeyError(mimetype)
+
+        key = codec_key(mimetype)
+        codecs = dict(self._codecs)
+
+        registered = codecs.get(key, _NO_CODEC)
+        if getattr(registered, kind) is None:
+            raise KeyError(mimetype)
+
+        remaining = registered._replace(**{kind: None})
+        if remaining.encoder is None and remaining.decoder is None:
+            del codecs[key]
+        else:
+            codecs[key] = remaining
+        self._swap_codecs(codecs)
+
+    def _swap_codecs(self, codecs: Dict[_CodecKeyType, _Codec]) -> None:
+        # The codecs must be swapped in before the index is reset, so a lookup which
+        # sees the new index also sees the new codecs.
+        self._codecs = codecs
+        self._index = dict()
+        self._sniff_order = None
+        self._encoder_mimetypes = None
+
+    def derive(self) -> "CodecRegistry":
+        """
+        Returns a new registry starting with this registry's codecs, which can be
+        changed without affecting this one. Deriving does not copy any codecs.
+        """
+        return CodecRegistry(parent=self)
+
+    def _resolve(self, mimetype: MimeTypeTolerant) -> _Codec:
+        index = self._index
+        codec = index.get(mimetype)
+        if codec is not None:
+            return codec
+
+        if mimetype is None:
+            return _NO_CODEC
+
+        codec = self._codecs.get(codec_key(mimetype), _NO_CODEC)
+        # Arbitrary header values must not grow the index without bound. If a codec
+        # was registered since the index was read, this lands in the discarded index.
+        if len(index) < _INDEX_MAX_SIZE:
+            index[mimetype] = codec
+        return codec
+
+    def encoder(self, mimetype: MimeTypeTolerant) -> Optional[EncoderType]:
+        """Encoder for ``mimetype``, or ``None`` if none is registered."""
+        return self._resolve(mimetype).encoder
+
+    def decoder(self, mimetype: MimeTypeTolerant) -> Optional[DecoderType]:
+        """Decoder for ``mimetype``, or ``None`` if none is registered."""
+        return self._resolve(mimetype).decoder
+
+    def sniff_decoders(self) -> _SniffOrderType:
+        """
+        (mimetype, decoder) pairs to try when sniffing, highest priority first.
+        Decoders with equal priorities are tried in registration order.
+        """
+        codecs = self._codecs
+        cached = self._sniff_order
+        if cached is not None and cached[0] is codecs:
+            return cached[1]
+
+        # Registration order breaks ties, so keys and decoders are never compared.
+        ranked = sorted(
+            (-codec.sniff_priority, index, key, codec.decoder)
+            for index, (key, codec) in enumerate(codecs.items())
+            if codec.decoder is not None and codec.sniff_priority is not None
+        )
+        order: _SniffOrderType = [(key, decoder) for _, _, key, decoder in ranked]
+        # Cached with the codecs it was ranked from, so an order ranked while another
+        # thread registers a codec is never returned for the new codecs.
+        self._sniff_order = (codecs, order)
+        return order
+
+    def mimetypes(self) -> List[_CodecKeyType]:
+        """Normalized mimetypes with a registered codec, in registration order."""
+        return list(self._codecs)
+
+    def encoder_mimetypes(self) -> Tuple[_CodecKeyType, ...]:
+        """
+        Normalized mimetypes with a registered encoder, in registration order. The
+        same tuple is returned until a codec is registered.
+        """
+        codecs = self._codecs
+        cached = self._encoder_mimetypes
+        if cached is not None and cached[0] is codecs:
+            return cached[1]
+
+        mimetypes = tuple(
+            key for key, codec in codecs.items() if codec.encoder is not None
+        )
+        self._encoder_mimetypes = (codecs, mimetypes)
+        return mimetypes
+
+
+class _CodecView(MutableMapping[MimeTypeTolerant, Any]):
+    """
+    The encoders or decoders of a :class:`CodecRegistry` as a dict. Setting or
+    deleting an entry registers or removes the codec in the registry. Copies are plain
+    dicts.
+    """
+
+    def __init__(self, registry: CodecRegistry, kind: str) -> None:
+        self._registry = registry
+        self._kind = kind
+
+    def __getitem__(self, mimetype: MimeTypeTolerant) -> Any:
+        codec = getattr(self._registry._resolve(mimetype), self._kind)
+        if codec is None:
+            raise KeyError(mimetype)
+        return codec
+
+    def __setitem__(self, mimetype: MimeTypeTolerant, codec: Any) -> None:
+        if mimetype is None:
+            raise KeyError(mimetype)
+
+        # New decoders are sniffed last, like dict entries added after the built-ins.
+        priority = None
+        key = codec_key(mimetype)
+        if (
+            self._kind == "decoder"
+            and self._registry.decoder(key) is None
+            and key not in UNSNIFFABLE_MIMETYPES
+        ):
+            priority = 0
+        self._registry.register(
+            mimetype, **{self._kind: codec}, sniff_priority=priority
+        )
+
+    def __delitem__(self, mimetype: MimeTypeTolerant) -> None:
+        self._registry._unregister(mimetype, self._kind)
+
+    def __iter__(self) -> Iterator[_CodecKeyType]:
+        codecs = self._registry._codecs
+        return (key for key, codec in codecs.items() if getattr(codec, self._kind))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+    def copy(self) -> Dict[MimeTypeTolerant, Any]:
+        return dict(self)
+
+    __copy__ = copy
+
+
+DEFAULT_CODECS = CodecRegistry.from_mappings(_BUILTIN_ENCODERS, _BUILTIN_DECODERS)
+"""
+Registry used by :func:`encode_content` and :func:`decode_content` when no encoders /
+decoders are passed. Derive from it to add codecs for some calls only.
+"""
+
+DEFAULT_ENCODERS: MutableMapping[MimeTypeTolerant, EncoderType] = _CodecView(
+    DEFAULT_CODECS, "encoder"
+)
+"""Encoders of :data:`DEFAULT_CODECS` by mimetype."""
+
+DEFAULT_DECODERS: MutableMapping[MimeTypeTolerant, DecoderType] = _CodecView(
+    DEFAULT_CODECS, "decoder"
+)
+"""Decoders of :data:`DEFAULT_CODECS` by mimetype."""
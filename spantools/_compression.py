@@ -0,0 +1,544 @@
+import abc
+import threading
+import zlib
+from types import ModuleType
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, MutableMapping
+from typing import Optional, Tuple, Type, TYPE_CHECKING
+
+from ._errors import ContentDecodeError, ContentEncodeError
+
+if TYPE_CHECKING:  # pragma: no cover
+    from zstandard import ZstdCompressionDict
+
+zstandard: Optional[ModuleType]
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+
+COMPRESS_MIN_SIZE = 1024
+"""Bodies smaller than this many bytes are not compressed by default."""
+
+ZSTD_DICTIONARY_ID_HEADER = "zstd-dictionary-id"
+"""Header carrying the ID of the dictionary a zstd body was compressed with."""
+
+DECOMPRESS_CHUNK_SIZE = 64 * 1024
+"""Most bytes of output a zlib or brotli decompressor produces per call."""
+
+_ZSTD_HEADER_PREFIX_SIZE = 5
+"""Magic number and frame header descriptor, which give the full frame header size."""
+
+_ZSTD_BLOCK_HEADER_SIZE = 3
+_ZSTD_RLE_BLOCK = 1
+
+
+def _check_size(size: int, max_size: Optional[int], name: str) -> None:
+    if max_size is not None and size > max_size:
+        raise ContentDecodeError(f"decompressed {name} body exceeds {max_size} bytes")
+
+
+class Compressor(abc.ABC):
+    """
+    Compresses and decompresses bodies for a single ``Content-Encoding``.
+
+    Compressors are shared between threads, so implementations must not hold
+    per-call state on the instance.
+    """
+
+    name: str = ""
+    """``Content-Encoding`` token of this compressor."""
+
+    @abc.abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        """Compresses a full body."""
+
+    @abc.abstractmethod
+    def decompress(self, data: bytes, max_size: Optional[int] = None) -> bytes:
+        """
+        Decompresses a full body.
+
+        :param max_size: Most bytes the body may decompress to. Output is produced in
+            bounded chunks, so a small body cannot expand without bound before it is
+            rejected. ``None`` for no limit.
+
+        :raises ContentDecodeError: If ``data`` is corrupt or truncated, or decompresses
+            to more than ``max_size`` bytes.
+        """
+
+    @abc.abstractmethod
+    def iter_compress(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """
+        Yields compressed output as ``chunks`` are consumed, so a body can be
+        compressed while it is being written out.
+        """
+
+    @abc.abstractmethod
+    def iter_decompress(
+        self, chunks: Iterable[bytes], max_size: Optional[int] = None
+    ) -> Iterator[bytes]:
+        """
+        Yields decompressed output as compressed ``chunks`` are consumed.
+
+        :param max_size: See :func:`decompress`.
+
+        :raises ContentDecodeError: If the stream is corrupt or truncated, or
+            decompresses to more than ``max_size`` bytes.
+        """
+
+    def add_to_headers(self, headers: MutableMapping[str, str]) -> None:
+        """
+        Adds any headers, besides ``Content-Encoding``, a receiver needs to decompress
+        bodies compressed by this compressor.
+        """
+
+
+class _ZlibCompressor(Compressor):
+    """Compressor for zlib-based encodings, which differ only by container format."""
+
+    _wbits: int = zlib.MAX_WBITS
+
+    def __init__(self, level: int = 6):
+        """
+        :param level: compression level, from ``0`` to ``9``.
+        """
+        self.level: int = level
+
+    def _compressobj(self) -> Any:
+        # zlib contexts are not reused: copying a template compressobj measures slower
+        # than creating a fresh one.
+        return zlib.compressobj(self.level, zlib.DEFLATED, self._wbits)
+
+    def compress(self, data: bytes) -> bytes:
+        compressor = self._compressobj()
+        return compressor.compress(data) + compressor.flush()
+
+    def decompress(self, data: bytes, max_size: Optional[int] = None) -> bytes:
+        if max_size is not None:
+            return b"".join(self.iter_decompress((data,), max_size))
+
+        decompressor = zlib.decompressobj(self._wbits)
+        try:
+            decompressed = decompressor.decompress(data) + decompressor.flush()
+        except zlib.error:
+            raise ContentDecodeError(f"Error occurred while decompressing {self.name}")
+
+        if not decompressor.eof:
+            raise ContentDecodeError(f"truncated {self.name} body")
+        return decompressed
+
+    def iter_compress(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        compressor = self._compressobj()
+        for chunk in chunks:
+            compressed = compressor.compress(chunk)
+            if compressed:
+                yield compressed
+        yield compressor.flush()
+
+    def iter_decompress(
+        self, chunks: Iterable[bytes], max_size: Optional[int] = None
+    ) -> Iterator[bytes]:
+        decompressor = zlib.decompressobj(self._wbits)
+        size = 0
+        try:
+            for chunk in chunks:
+                while chunk:
+                    decompressed = decompressor.decompress(chunk, DECOMPRESS_CHUNK_SIZE)
+                    chunk = decompressor.unconsumed_tail
+                    if decompressed:
+                        size += len(decompressed)
+                        _check_size(size, max_size, self.name)
+                        yield decompressed
+            tail = decompressor.flush()
+        except zlib.error:
+            raise ContentDecodeError(f"Error occurred while decompressing {self.name}")
+
+        if tail:
+            _check_size(size + len(tail), max_size, self.name)
+            yield tail
+        if not decompressor.eof:
+            raise ContentDecodeError(f"truncated {self.name} body")
+
+
+class GzipCompressor(_ZlibCompressor):
+    """``gzip`` content encoding, through the standard library's zlib."""
+
+    name = "gzip"
+    _wbits = zlib.MAX_WBITS | 16
+
+
+class DeflateCompressor(_ZlibCompressor):
+    """``deflate`` content encoding (zlib container), through the standard library."""
+
+    name = "deflate"
+    _wbits = zlib.MAX_WBITS
+
+
+def _require(module: Optional[ModuleType], package: str) -> ModuleType:
+    if module is None:
+        raise ImportError(
+            f"'{package}' must be installed for this content encoding. Install "
+            f"spantools[compression]."
+        )
+    return module
+
+
+class ZstdCompressor(Compressor):
+    """
+    ``zstd`` content encoding. Requires the ``zstandard`` package.
+
+    zstd contexts are expensive to set up and cannot be shared between threads, so one
+    compression and one decompression context is kept per thread and dictionary, and
+    reused for every full-body call.
+
+    Small bodies sharing the same keys compress far better with a dictionary trained on
+    samples of them (see :func:`train_zstd_dictionary`). Bodies are compressed with
+    ``dictionary`` if set, and its ID is sent in the ``zstd-dictionary-id`` header.
+    Bodies are decompressed with the dictionary whose ID is recorded in their zstd
+    frame, which must be ``dictionary`` or one of ``dictionaries``.
+    """
+
+    name = "zstd"
+
+    def __init__(
+        self,
+        level: int = 3,
+        dictionary: Optional["ZstdCompressionDict"] = None,
+        dictionaries: Iterable["ZstdCompressionDict"] = (),
+    ):
+        """
+        :param level: compression level, from ``1`` to ``22``.
+        :param dictionary: dictionary to compress bodies with.
+        :param dictionaries: additional dictionaries bodies may be decompressed with,
+            such as ones previously used for compression.
+        """
+        self._zstd: ModuleType = _require(zstandard, "zstandard")
+        self.level: int = level
+        self.dictionary: Optional["ZstdCompressionDict"] = dictionary
+
+        self._dictionaries: Dict[int, "ZstdCompressionDict"] = {
+            d.dict_id(): d for d in dictionaries
+        }
+        if dictionary is not None:
+            self._dictionaries[dictionary.dict_id()] = dictionary
+        self._dict_id: int = 0 if dictionary is None else dictionary.dict_id()
+
+        self._local: threading.local = threading.local()
+
+    def _new_contexts(self, dict_id: int) -> Tuple[Any, Any]:
+        if dict_id == 0:
+            dictionary = None
+        else:
+            try:
+                dictionary = self._dictionaries[dict_id]
+            except KeyError:
+                raise ContentDecodeError(f"unknown zstd dictionary id: {dict_id}")
+
+        return (
+            self._zstd.ZstdCompressor(level=self.level, dict_data=dictionary),
+            self._zstd.ZstdDecompressor(dict_data=dictionary),
+        )
+
+    def _contexts(self, dict_id: int) -> Tuple[Any, Any]:
+        try:
+            contexts_by_id = self._local.contexts
+        except AttributeError:
+            contexts_by_id = dict()
+            self._local.contexts = contexts_by_id
+
+        try:
+            return contexts_by_id[dict_id]
+        except KeyError:
+            contexts = self._new_contexts(dict_id)
+            contexts_by_id[dict_id] = contexts
+            return contexts
+
+    def _frame_parameters(self, data: bytes) -> Any:
+        try:
+            return self._zstd.get_frame_parameters(data)
+        except self._zstd.ZstdError:
+            raise ContentDecodeError("Error occurred while decompressing zstd")
+
+    def _header_size(self, data: bytes) -> Optional[int]:
+        """Size of the frame header starting ``data``, if ``data`` holds all of it."""
+        if len(data) < _ZSTD_HEADER_PREFIX_SIZE:
+            return None
+        try:
+            size: int = self._zstd.frame_header_size(data)
+        except self._zstd.ZstdError:
+            raise ContentDecodeError("Error occurred while decompressing zstd")
+        return size if len(data) >= size else None
+
+    def _iter_blocks(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """
+        Regroups the chunks of a zstd frame so each piece ends where a block ends, from
+        the header in front of each block. A block decompresses to at most 128 KB, so
+        feeding a decompressor one piece at a time bounds its output per call, which a
+        single highly compressed chunk would not. The first piece holds the frame
+        header, and anything after the last block is passed through as is.
+        """
+        buffer = bytearray()
+        block_start: Optional[int] = None
+        last_block = False
+
+        for chunk in chunks:
+            if last_block:
+                yield chunk
+                continue
+
+            buffer += chunk
+            if block_start is None:
+                block_start = self._header_size(buffer)
+                if block_start is None:
+                    continue
+
+            while len(buffer) >= block_start + _ZSTD_BLOCK_HEADER_SIZE:
+                header_end = block_start + _ZSTD_BLOCK_HEADER_SIZE
+                header = int.from_bytes(buffer[block_start:header_end], "little")
+                if (header >> 1) & 0b11 == _ZSTD_RLE_BLOCK:
+                    block_size = 1
+                else:
+                    block_size = header >> 3
+
+                block_end = header_end + block_size
+                if len(buffer) < block_end:
+                    break
+
+                yield bytes(buffer[:block_end])
+                del buffer[:block_end]
+                block_start = 0
+                if header & 1:
+                    last_block = True
+                    break
+
+        # A frame header which never completed is left for the caller to report.
+        if buffer and block_start is not None:
+            yield bytes(buffer)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._contexts(self._dict_id)[0].compress(data)
+
+    def decompress(self, data: bytes, max_size: Optional[int] = None) -> bytes:
+        parameters = self._frame_parameters(data)
+        # Frames written by a streaming compressor do not record their size, which then
+        # reads as 2 ** 64 - 1, so are decompressed as a stream when size is limited.
+        if max_size is not None and parameters.content_size > max_size:
+            return b"".join(self.iter_decompress((data,), max_size))
+
+        decompressor = self._contexts(parameters.dict_id)[1]
+        try:
+            return decompressor.decompress(data)
+        except self._zstd.ZstdError:
+            # Without a recorded size, the frame can only be read back through a
+            # streaming decompressor.
+            return b"".join(self.iter_decompress((data,)))
+
+    def iter_compress(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        # Streams hold their context for their whole lifetime, and may be interleaved
+        # on one thread, so they get their own.
+        compressor = self._new_contexts(self._dict_id)[0].compressobj()
+        for chunk in chunks:
+            compressed = compressor.compress(chunk)
+            if compressed:
+                yield compressed
+        yield compressor.flush()
+
+    def iter_decompress(
+        self, chunks: Iterable[bytes], max_size: Optional[int] = None
+    ) -> Iterator[bytes]:
+        decompressor = None
+        size = 0
+        try:
+            for piece in self._iter_blocks(chunks):
+                if decompressor is None:
+                    # The first piece holds the whole frame header, which holds the
+                    # dictionary ID.
+                    dict_id = self._frame_parameters(piece).dict_id
+                    decompressor = self._new_contexts(dict_id)[1].decompressobj()
+                decompressed = decompressor.decompress(piece)
+                if decompressed:
+                    size += len(decompressed)
+                    _check_size(size, max_size, self.name)
+                    yield decompressed
+        except self._zstd.ZstdError:
+            raise ContentDecodeError("Error occurred while decompressing zstd")
+
+        if decompressor is None or not decompressor.eof:
+            raise ContentDecodeError("truncated zstd body")
+
+    def add_to_headers(self, headers: MutableMapping[str, str]) -> None:
+        if self._dict_id:
+            headers[ZSTD_DICTIONARY_ID_HEADER] = str(self._dict_id)
+
+
+class BrotliCompressor(Compressor):
+    """``br`` content encoding. Requires the ``brotli`` package."""
+
+    name = "br"
+
+    def __init__(self, quality: int = 5):
+        """
+        :param quality: compression quality, from ``0`` to ``11``. The brotli default
+            of ``11`` is meant for static content, and is too slow for responses.
+        """
+        self._brotli: ModuleType = _require(brotli, "brotli")
+        self.quality: int = quality
+
+    def compress(self, data: bytes) -> bytes:
+        return self._brotli.compress(data, quality=self.quality)
+
+    def decompress(self, data: bytes, max_size: Optional[int] = None) -> bytes:
+        if max_size is not None:
+            return b"".join(self.iter_decompress((data,), max_size))
+
+        try:
+            return self._brotli.decompress(data)
+        except self._brotli.error:
+            raise ContentDecodeError("Error occurred while decompressing br")
+
+    def iter_compress(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        compressor = self._brotli.Compressor(quality=self.quality)
+        for chunk in chunks:
+            compressed = compressor.process(chunk)
+            if compressed:
+                yield compressed
+        yield compressor.finish()
+
+    def iter_decompress(
+        self, chunks: Iterable[bytes], max_size: Optional[int] = None
+    ) -> Iterator[bytes]:
+        decompressor = self._brotli.Decompressor()
+        size = 0
+        try:
+            for chunk in chunks:
+                # Output past the limit stays buffered in the decompressor, and is
+                # drained by processing empty input.
+                decompressed = decompressor.process(
+                    chunk, output_buffer_limit=DECOMPRESS_CHUNK_SIZE
+                )
+                while decompressed:
+                    size += len(decompressed)
+                    _check_size(size, max_size, self.name)
+                    yield decompressed
+                    if decompressor.is_finished():
+                        break
+                    decompressed = decompressor.process(
+                        b"", output_buffer_limit=DECOMPRESS_CHUNK_SIZE
+                    )
+        except self._brotli.error:
+            raise ContentDecodeError("Error occurred while decompressing br")
+
+        if not decompressor.is_finished():
+            raise ContentDecodeError("truncated br body")
+
+
+CompressorIndexType = Mapping[str, Compressor]
+
+DEFAULT_COMPRESSORS: Dict[str, Compressor] = {
+    GzipCompressor.name: GzipCompressor(),
+    "x-gzip": GzipCompressor(),
+    DeflateCompressor.name: DeflateCompressor(),
+}
+"""
+Compressors by ``Content-Encoding`` token. ``zstd`` and ``br`` are included when their
+optional packages are installed.
+"""
+
+if zstandard is not None:
+    DEFAULT_COMPRESSORS[ZstdCompressor.name] = ZstdCompressor()
+if brotli is not None:
+    DEFAULT_COMPRESSORS[BrotliCompressor.name] = BrotliCompressor()
+
+
+def _parse_encodings(content_encoding: str) -> List[str]:
+    return [
+        token.strip().lower()
+        for token in content_encoding.split(",")
+        if token.strip() and token.strip().lower() != "identity"
+    ]
+
+
+def _get_compressor(
+    name: str, compressors: CompressorIndexType, error: Type[BaseException]
+) -> Compressor:
+    try:
+        return compressors[name]
+    except KeyError:
+        raise error(f"content encoding '{name}' is not supported")
+
+
+def compress_content(
+    content: bytes,
+    content_encoding: Optional[str],
+    headers: Optional[MutableMapping[str, str]] = None,
+    min_size: int = COMPRESS_MIN_SIZE,
+    compressors: Optional[CompressorIndexType] = None,
+) -> bytes:
+    """
+    Compresses an encoded body.
+
+    :param content: encoded body.
+    :param content_encoding: ``Content-Encoding`` token to compress with. If ``None``
+        or ``"identity"``, ``content`` is returned as-is.
+    :param headers: ``Content-Encoding`` is set here if the body is compressed.
+    :param min_size: bodies smaller than this many bytes are returned uncompressed,
+        as compression would cost more than it saves.
+    :param compressors: Custom set of compressors to use.
+    :return: compressed body, or ``content`` if it was not compressed.
+
+    :raises ContentEncodeError: If ``content_encoding`` is not supported.
+    """
+    if content_encoding is None or len(content) < min_size:
+        return content
+    if compressors is None:
+        compressors = DEFAULT_COMPRESSORS
+
+    names = _parse_encodings(content_encoding)
+    for name in names:
+        compressor = _get_compressor(name, compressors, ContentEncodeError)
+        content = compressor.compress(content)
+        if headers is not None:
+            compressor.add_to_headers(headers)
+
+    if names and headers is not None:
+        headers["Content-Encoding"] = ", ".join(names)
+
+    return content
+
+
+def decompress_content(
+    content: bytes,
+    content_encoding: Optional[str],
+    compressors: Optional[CompressorIndexType] = None,
+    max_size: Optional[int] = None,
+) -> bytes:
+    """
+    Decompresses a received body.
+
+    :param content: received body.
+    :param content_encoding: value of the ``Content-Encoding`` header. Multiple
+        comma-separated encodings are undone in reverse order. If ``None``,
+        ``content`` is returned as-is.
+    :param compressors: Custom set of compressors to use.
+    :param max_size: Most bytes the body may decompress to, checked for each encoding
+        as it is undone. ``None`` for no limit.
+    :return: decompressed body.
+
+    :raises ContentDecodeError: If an encoding is not supported, the body is corrupt,
+        or it decompresses to more than ``max_size`` bytes.
+    """
+    if not content_encoding:
+        return content
+    if compressors is None:
+        compressors = DEFAULT_COMPRESSORS
+
+    for name in reversed(_parse_encodings(content_encoding)):
+        compressor = _get_compressor(name, compressors, ContentDecodeError)
+        content = compressor.decompress(content, max_size)
+
+    return content
@@ -1,14 +1,20 @@
 import marshmallow
 import google.protobuf.message
-from typing import Optional, Any, Union, Mapping, MutableMapping, Callable, Type
+from typing import Optional, Any, Union, Mapping, MutableMapping, Type
 
 from ._mimetype import MimeType, MimeTypeTolerant
 from ._errors import ContentTypeUnknownError, ContentEncodeError
-from ._encoders import EncoderType, DEFAULT_ENCODERS
+from ._encoders import EncoderType, _schema_encoder
+from ._codecs import CodecRegistry, DEFAULT_CODECS
 from ._typing import DataSchemaType
+from ._proto import ProtoCodec, _is_proto_stream
+from ._schema import CompiledSchema, compile_schema
+from ._validation import ValidationPolicy
+from ._compression import CompressorIndexType, COMPRESS_MIN_SIZE, compress_content
 
 
 EncoderIndexType = Mapping[MimeTypeTolerant, EncoderType]
+ValidateType = Union[bool, ValidationPolicy]
 
 
 def _auto_mimetype(
@@ -24,7 +30,10 @@ def _auto_mimetype(
         if isinstance(data_schema, type) and issubclass(
             data_schema, google.protobuf.message.Message
         ):
-            mimetype = MimeType.PROTO
+            if isinstance(content, google.protobuf.message.Message):
+                mimetype = MimeType.PROTO
+            else:
+                mimetype = MimeType.PROTO_STREAM
         elif isinstance(data_schema, marshmallow.Schema) or isinstance(
             content, (Mapping, list)
         ):
@@ -55,65 +64,134 @@ class _SchemaDumpEncode:
 
     def __init__(
         self,
-        schema_method: Callable,
+        compiled: CompiledSchema,
         encoder: Optional[EncoderType],
-        validator: Optional[Callable],
+        validate: bool,
+        policy: Optional[ValidationPolicy],
     ):
-        self.schema_method: Callable = schema_method
+        self.compiled: CompiledSchema = compiled
         self.encoder: Optional[EncoderType] = encoder
-        self.validator: Optional[Callable] = validator
-
-    def __call__(self, content: Any) -> bytes:
-        dumped = self.schema_method(content)
-        if self.validator is not None:
-            errors = self.validator(dumped)
-            if errors:
-                raise marshmallow.ValidationError(message=errors)
+        self.validate: bool = validate
+        self.policy: Optional[ValidationPolicy] = policy
 
+    def _encode(self, dumped: Any) -> bytes:
         if self.encoder is not None:
             return self.encoder(dumped)
         else:
             return dumped.encode()
 
+    def _dump(self, content: Any, validate: bool) -> Any:
+        # Validation is folded into the dump pass by the compiled schema.
+        if validate:
+            return self.compiled.dump_validated(content)
+        else:
+            return self.compiled.dump(content)
+
+    def _call_policy(self, policy: ValidationPolicy, content: Any) -> bytes:
+        schema = self.compiled.schema
+        validate = policy.should_validate(schema, None)
+
+        try:
+            dumped = self._dump(content, validate)
+        except marshmallow.ValidationError as error:
+            policy.record(schema, validated=validate, failed=True)
+            raise error
+
+        policy.record(schema, validated=validate, failed=False)
+        return self._encode(dumped)
+
+    def _call_policy_sized(self, policy: ValidationPolicy, content: Any) -> bytes:
+        # The body has to be encoded before the policy can make its call, so
+        # validation here is a second pass over the dumped data.
+        schema = self.compiled.schema
+        # A list of records for many=True schemas, which schema.validate accepts.
+        dumped: Any = self.compiled.dump(content)
+        encoded = self._encode(dumped)
+
+        if not policy.should_validate(schema, len(encoded)):
+            policy.record(schema, validated=False, failed=False)
+            return encoded
+
+        errors = schema.validate(dumped)
+        policy.record(schema, validated=True, failed=bool(errors))
+        if errors:
+            raise marshmallow.ValidationError(message=errors)
+
+        return encoded
+
+    def __call__(self, content: Any) -> bytes:
+        policy = self.policy
+        if policy is None:
+            return self._encode(self._dump(content, self.validate))
+        elif policy.uses_size:
+            return self._call_policy_sized(policy, content)
+        else:
+            return self._call_policy(policy, content)
+
 
 def _generate_schema_encoder(
     data_schema: marshmallow.Schema,
-    validate: bool,
+    validate: ValidateType,
     mimetype_encoder: Optional[EncoderType],
 ) -> EncoderType:
-    schema_method = data_schema.dump
-    validator = None
-
-    if validate is True:
-        validator = data_schema.validate
+    if isinstance(validate, ValidationPolicy):
+        policy: Optional[ValidationPolicy] = validate
+        validate = True
+    else:
+        policy = None
 
     schema_encoder = _SchemaDumpEncode(
-        schema_method=schema_method, encoder=mimetype_encoder, validator=validator
+        compiled=compile_schema(data_schema),
+        encoder=mimetype_encoder,
+        validate=validate,
+        policy=policy,
     )
     return schema_encoder
 
 
+def _validation_requested(validate: ValidateType) -> bool:
+    """Whether ``validate`` may result in content being validated."""
+    if isinstance(validate, ValidationPolicy):
+        return validate.may_validate()
+    else:
+        return validate is True
+
+
 def _byte_pass_through(content: Union[bytes, str]) -> bytes:
     if isinstance(content, str):
         content = content.encode()
     return content
 
 
-def _get_mimetype_encoder(
-    content: Optional[Any],
-    mimetype: MimeTypeTolerant,
-    validate: bool,
-    encoders: EncoderIndexType,
-) -> EncoderType:
+def _find_encoder(
+    mimetype: MimeTypeTolerant, encoders: EncoderIndexType
+) -> Optional[EncoderType]:
+    # Custom encoders registered under a string key win over the built-in codec the
+    # string resolves to.
+    if not isinstance(mimetype, MimeType) and mimetype in encoders:
+        return encoders[mimetype]
+
     try:
         mimetype = MimeType.from_name(mimetype)
     except ValueError:
         pass
 
-    try:
-        encoder = encoders[mimetype]
-    except KeyError:
-        if validate is True:
+    return encoders.get(mimetype)
+
+
+def _get_mimetype_encoder(
+    content: Optional[Any],
+    mimetype: MimeTypeTolerant,
+    validate: ValidateType,
+    encoders: Union[EncoderIndexType, CodecRegistry],
+) -> EncoderType:
+    if isinstance(encoders, CodecRegistry):
+        encoder = encoders.encoder(mimetype)
+    else:
+        encoder = _find_encoder(mimetype, encoders)
+
+    if encoder is None:
+        if _validation_requested(validate):
             raise marshmallow.ValidationError("Unknown mimetype could not be validated")
 
         _check_unknown_mimetype_content(content, mimetype)
@@ -123,17 +201,13 @@ def _get_mimetype_encoder(
 
 
 def _generate_protobuf_encoder(
-    data_schema: Type[google.protobuf.message.Message],
+    data_schema: Type[google.protobuf.message.Message], mimetype: MimeTypeTolerant
 ) -> EncoderType:
-    def encoder(content: Any) -> bytes:
-        if not isinstance(content, data_schema):
-            raise ContentEncodeError(
-                f"proto type expected: {data_schema}, got: {type(content)}"
-            )
-
-        return content.SerializeToString()
-
-    return encoder
+    codec = ProtoCodec.for_message(data_schema)
+    if _is_proto_stream(mimetype):
+        return codec.encode_delimited
+    else:
+        return codec.encode
 
 
 def _encode_known_mimetype(
@@ -141,8 +215,8 @@ def _encode_known_mimetype(
     mimetype: MimeTypeTolerant,
     headers: MutableMapping[str, str],
     data_schema: Optional[DataSchemaType],
-    validate: bool,
-    encoders: EncoderIndexType,
+    validate: ValidateType,
+    encoders: Union[EncoderIndexType, CodecRegistry],
 ) -> bytes:
     # Otherwise if this is a mimetype known to spanreed, we can serialize it.
     if content is None:
@@ -156,10 +230,12 @@ def _encode_known_mimetype(
     if data_schema is not None:
         if isinstance(data_schema, marshmallow.Schema):
             encoder = _generate_schema_encoder(
-                data_schema=data_schema, validate=validate, mimetype_encoder=encoder
+                data_schema=data_schema,
+                validate=validate,
+                mimetype_encoder=_schema_encoder(encoder, data_schema),
             )
         else:
-            encoder = _generate_protobuf_encoder(data_schema)
+            encoder = _generate_protobuf_encoder(data_schema, mimetype)
 
     try:
         content = encoder(content)
@@ -176,8 +252,11 @@ def encode_content(
     mimetype: MimeTypeTolerant = None,
     headers: Optional[MutableMapping[str, str]] = None,
     data_schema: Optional[DataSchemaType] = None,
-    validate: bool = False,
-    encoders: Optional[EncoderIndexType] = None,
+    validate: ValidateType = False,
+    encoders: Optional[Union[EncoderIndexType, CodecRegistry]] = None,
+    content_encoding: Optional[str] = None,
+    compress_min_size: int = COMPRESS_MIN_SIZE,
+    compressors: Optional[CompressorIndexType] = None,
 ) -> bytes:
     """
     Encodes content object to bytes using encoder / schema.
@@ -185,17 +264,28 @@ def encode_content(
     :param content: Object to be encoded.
     :param mimetype: Content-Type to serialize to.
     :param headers: Request headers to which content information should be added.
-    :param data_schema: Marshmallow schema. Will be used to dump / validate content
-        before encoding.
-    :param validate: Whether to validate content after dumping. This may come with a big
-        performance penalty.
-    :param encoders: Custom set of encoders to use for encoding content.
+    :param data_schema: Marshmallow schema or protobuf message class. Will be used to
+        dump / validate content before encoding. Iterables of messages are encoded as
+        a length-delimited ``MimeType.PROTO_STREAM``.
+    :param validate: Whether to validate content while dumping. Schemas are compiled
+        on first use so validation is done in the same pass as the dump where possible,
+        but this still comes with a performance penalty. A :class:`ValidationPolicy`
+        may be passed instead to validate only some bodies and count the results.
+    :param encoders: :class:`CodecRegistry`, or dict of encoders by mimetype, to use
+        for encoding content. Defaults to :data:`DEFAULT_CODECS`.
+    :param content_encoding: ``Content-Encoding`` to compress the encoded body with,
+        like ``"gzip"``. ``Content-Encoding`` is added to ``headers`` if the body is
+        compressed.
+    :param compress_min_size: Encoded bodies smaller than this many bytes are not
+        compressed.
+    :param compressors: Custom set of compressors to use.
 
     :return: Encoded content for request.
 
     :raises ContentTypeUnknownError: If a method for serializing / validating the
         content is unknown and the content is not already bytes.
-    :raises ContentEncodeError: If error occurs when encoding content.
+    :raises ContentEncodeError: If error occurs when encoding content, or
+        ``content_encoding`` is not supported.
     :raises marshmallow.ValidationError: If raised while dumping / validating content
         via ``data_schema``.
     """
@@ -205,11 +295,20 @@ def encode_content(
     if headers is None:
         headers = dict()
     if encoders is None:
-        encoders = DEFAULT_ENCODERS
+        encoders = DEFAULT_CODECS
 
     mimetype = _auto_mimetype(content, mimetype, data_schema)
     content = _encode_known_mimetype(
         content, mimetype, headers, data_schema, validate, encoders
     )
 
+    if content_encoding is not None:
+        content = compress_content(
+            content,
+            content_encoding,
+            headers,
+            min_size=compress_min_size,
+            compressors=compressors,
+        )
+
     return content
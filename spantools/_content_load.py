@@ -1,23 +1,35 @@
 import marshmallow
-from typing import Any, Union, Optional, Tuple, Mapping
+import google.protobuf.message
+from typing import Any, Union, Optional, Tuple, Mapping, Sequence, Type
 
 from ._mimetype import MimeType, MimeTypeTolerant
 from ._errors import ContentDecodeError, ContentTypeUnknownError, NoContentError
-from ._encoders import DecoderType, DEFAULT_DECODERS
+from ._encoders import DecoderType, _schema_records
+from ._codecs import CodecRegistry, DEFAULT_CODECS, UNSNIFFABLE_MIMETYPES
 from ._typing import DataSchemaType
+from ._proto import ProtoCodec, iter_proto_messages, _is_proto_stream
+from ._compression import CompressorIndexType, decompress_content
 
 
 DecoderIndexType = Mapping[MimeTypeTolerant, DecoderType]
 
 
-def _sniff_content(content: bytes, decoders: DecoderIndexType) -> Any:
-    content_mapping = None
-
-    for mimetype, decoder in decoders.items():
-        # both text and protobuf are non-sniffable.
-        if mimetype in (MimeType.TEXT, MimeType.PROTO):
-            continue
+def _sniff_content(
+    content: bytes, decoders: Union[DecoderIndexType, CodecRegistry]
+) -> Any:
+    candidates: Sequence[Tuple[MimeTypeTolerant, DecoderType]]
+    if isinstance(decoders, CodecRegistry):
+        candidates = decoders.sniff_decoders()
+    else:
+        # text, protobuf and delimited text are non-sniffable.
+        candidates = [
+            (mimetype, decoder)
+            for mimetype, decoder in decoders.items()
+            if mimetype not in UNSNIFFABLE_MIMETYPES
+        ]
 
+    content_mapping = None
+    for _, decoder in candidates:
         try:
             content_mapping = decoder(content)
         except BaseException:
@@ -31,17 +43,31 @@ def _sniff_content(content: bytes, decoders: DecoderIndexType) -> Any:
     return content_mapping
 
 
+def _find_decoder(
+    mimetype: Union[str, MimeType], decoders: DecoderIndexType
+) -> Optional[DecoderType]:
+    # Custom decoders registered under a string key win over the built-in codec the
+    # string resolves to.
+    if isinstance(mimetype, MimeType) or mimetype not in decoders:
+        try:
+            mimetype = MimeType.from_name(mimetype)
+        except ValueError:
+            pass
+
+    return decoders.get(mimetype)
+
+
 def _load_content_by_mimetype(
-    content: bytes, mimetype: Union[str, MimeType], decoders: DecoderIndexType
+    content: bytes,
+    mimetype: Union[str, MimeType],
+    decoders: Union[DecoderIndexType, CodecRegistry],
 ) -> Any:
-    try:
-        mimetype = MimeType.from_name(mimetype)
-    except ValueError:
-        pass
+    if isinstance(decoders, CodecRegistry):
+        deserializer = decoders.decoder(mimetype)
+    else:
+        deserializer = _find_decoder(mimetype, decoders)
 
-    try:
-        deserializer = decoders[mimetype]
-    except KeyError:
+    if deserializer is None:
         raise ContentTypeUnknownError(f"Unknown mimetype: {mimetype}")
 
     try:
@@ -50,28 +76,57 @@ def _load_content_by_mimetype(
         raise ContentDecodeError(f"Error occurred while decoding content as {mimetype}")
 
 
+def _load_protobuf(
+    content: bytes,
+    mimetype: MimeTypeTolerant,
+    data_schema: Type[google.protobuf.message.Message],
+) -> Any:
+    """
+    Loads a single message, or a lazy iterator of messages for length-delimited
+    streams.
+    """
+    if _is_proto_stream(mimetype):
+        return iter_proto_messages(content, data_schema)
+    else:
+        return ProtoCodec.for_message(data_schema).decode(content)
+
+
 def decode_content(
     content: bytes,
     mimetype: MimeTypeTolerant = None,
     data_schema: Optional[DataSchemaType] = None,
     allow_sniff: bool = False,
-    decoders: Optional[DecoderIndexType] = None,
+    decoders: Optional[Union[DecoderIndexType, CodecRegistry]] = None,
+    content_encoding: Optional[str] = None,
+    compressors: Optional[CompressorIndexType] = None,
+    max_decompressed_size: Optional[int] = None,
 ) -> Tuple[Optional[Any], Optional[Any]]:
     """
     Loads content by decoder / schema from received mimetype.
 
     :param content: Received binary body.
     :param mimetype: mimetype info if known.
-    :param data_schema: marshmallow schema to use to load data to model / object
+    :param data_schema: marshmallow schema or protobuf message class to use to load
+        data to model / object. Protobuf streams are loaded to a lazy iterator of
+        messages. Arrow, csv and tsv bodies are loaded as a list of records, or as
+        a single record if the schema is not ``many`` and the body has one row.
     :param allow_sniff: If mimetype is unavailable, whether to attempt to load content
         anyway.
-    :param decoders: Custom set of decoders to use.
+    :param decoders: :class:`CodecRegistry`, or dict of decoders by mimetype, to use.
+        Defaults to :data:`DEFAULT_CODECS`.
+    :param content_encoding: value of the ``Content-Encoding`` header. The body is
+        decompressed before it is decoded.
+    :param compressors: Custom set of compressors to use for decompression.
+    :param max_decompressed_size: Most bytes a compressed body may decompress to.
+        ``None`` for no limit.
     :return: (loaded data object, loaded mimetype) tuple.
 
     :raises ContentTypeUnknownError: If a method for decoding / validating the
         content is unknown or unregistered, and ``allow_sniff`` is False.
     :raises ContentDecodeError: If error occurs when decoding content or no registered.
-        decoders succeed if ``allow_sniff`` is True
+        decoders succeed if ``allow_sniff`` is True. Also raised if
+        ``content_encoding`` is not supported, the body fails to decompress or it
+        decompresses to more than ``max_decompressed_size`` bytes.
     :raises NoContentError: If no content is passed to be decoded. This error is
         inherited from ContentDecodeError, so catching ContentDecodeError also catches
         NoContentError.
@@ -81,8 +136,15 @@ def decode_content(
     if content == b"":
         raise NoContentError("No content to decode.")
 
+    content = decompress_content(
+        content,
+        content_encoding,
+        compressors=compressors,
+        max_size=max_decompressed_size,
+    )
+
     if decoders is None:
-        decoders = DEFAULT_DECODERS
+        decoders = DEFAULT_CODECS
 
     # If no mimetype was passed, we can go through and attempt to load it blind (sniff).
     if mimetype is None and allow_sniff:
@@ -99,10 +161,11 @@ def decode_content(
     # Use the marshmallow schema to load the data object.
     if data_schema is not None:
         if isinstance(data_schema, marshmallow.Schema):
-            content_loaded = data_schema.load(content_mimetype)
+            content_loaded = data_schema.load(
+                _schema_records(content_mimetype, mimetype, data_schema.many)
+            )
         else:
-            content_loaded = data_schema()
-            content_loaded.ParseFromString(content)
+            content_loaded = _load_protobuf(content, mimetype, data_schema)
     else:
         content_loaded = content_mimetype
 
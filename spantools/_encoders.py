@@ -5,15 +5,60 @@ import bson
 import yaml
 import rapidjson
 import decimal
-from bson.raw_bson import RawBSONDocument
-from typing import Any, Union, Mapping, List, Dict, Callable, Optional
+import io
+import csv
+import functools
+import sys
+import threading
+from bson.raw_bson import RawBSONDocument, DEFAULT_RAW_BSON_OPTIONS
+from bson.codec_options import DEFAULT_CODEC_OPTIONS, TypeDecoder, TypeRegistry
+import google.protobuf.message
+from typing import Any, Union, Mapping, List, Dict, Callable, Optional, Iterable
+from typing import AbstractSet, BinaryIO, IO, Iterator, Sequence, Tuple, Type, cast
+from types import ModuleType
 
 from ._mimetype import MimeType, MimeTypeTolerant
+from ._errors import ContentDecodeError
+from ._proto import iter_proto_frames
+from ._numpy import (
+    NDARRAY_BSON_SUBTYPE,
+    NDARRAY_MSGPACK_CODE,
+    _load_ndarray,
+    _numpy_types,
+    ndarray_to_bytes,
+)
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
+
+cbor2: Optional[ModuleType]
+try:
+    import cbor2
+except ImportError:  # pragma: no cover
+    cbor2 = None
 
 
 EncoderType = Callable[[Any], bytes]
 DecoderType = Callable[[bytes], Any]
-DATETIME_FIELD: marshmallow.fields.DateTime = marshmallow.fields.DateTime()
+
+
+_DATETIME_LOCAL = threading.local()
+
+
+def _datetime_field() -> marshmallow.fields.DateTime:
+    """
+    The calling thread's own field datetimes are formatted with, built on first use.
+    Fields are configured once and then only read, but like :func:`_json_encoder`,
+    each thread gets its own to avoid contending on one shared object.
+    """
+    try:
+        return _DATETIME_LOCAL.field
+    except AttributeError:
+        field = marshmallow.fields.DateTime()
+        _DATETIME_LOCAL.field = field
+        return field
 
 
 def _convert_bson_doc(data: RawBSONDocument) -> Dict[str, Any]:
@@ -34,22 +79,44 @@ class SpanJSONEncoder(rapidjson.Encoder):
             obj = obj.to_decimal()
 
         if isinstance(obj, datetime.datetime):
-            return DATETIME_FIELD._serialize(obj, "none", SpanJSONEncoder.EMPTY)
+            return _datetime_field()._serialize(obj, "none", SpanJSONEncoder.EMPTY)
         elif isinstance(obj, bytes):
             return obj.hex()
         elif isinstance(obj, RawBSONDocument):
             return _convert_bson_doc(obj)
         elif isinstance(obj, decimal.Decimal):
             return str(obj)
+        elif isinstance(obj, _numpy_types()):
+            return obj.tolist()
         else:
             raise ValueError(
                 f"Value {obj} or type {obj.__class__} is not JSON-Serializable"
             )
 
 
-JSON_ENCODER = SpanJSONEncoder(
-    uuid_mode=rapidjson.UM_CANONICAL, bytes_mode=rapidjson.BM_NONE
-)
+def _new_json_encoder() -> SpanJSONEncoder:
+    return SpanJSONEncoder(
+        uuid_mode=rapidjson.UM_CANONICAL, bytes_mode=rapidjson.BM_NONE
+    )
+
+
+JSON_ENCODER = _new_json_encoder()
+
+_JSON_LOCAL = threading.local()
+
+
+def _json_encoder() -> SpanJSONEncoder:
+    """
+    The calling thread's own :class:`SpanJSONEncoder`. Encoders hold no state between
+    calls, but on free-threaded builds every thread touching the same object contends
+    on its reference count, so each thread encodes with its own instance.
+    """
+    try:
+        return _JSON_LOCAL.encoder
+    except AttributeError:
+        encoder = _new_json_encoder()
+        _JSON_LOCAL.encoder = encoder
+        return encoder
 
 
 DataMappingType = Optional[Union[Mapping[str, Any], List[Mapping[str, Any]]]]
@@ -58,7 +125,7 @@ DataMappingType = Optional[Union[Mapping[str, Any], List[Mapping[str, Any]]]]
 def json_encode(media: DataMappingType) -> bytes:
     if media is None:
         return b""
-    return JSON_ENCODER(media).encode()
+    return _json_encoder()(media).encode()
 
 
 def json_decode(content: bytes) -> DataMappingType:
@@ -96,7 +163,7 @@ def _yaml_represent_decimal_bson(dumper: yaml.Dumper, data: bson.Decimal128) ->
 
 
 def _yaml_represent_datetime(dumper: yaml.Dumper, data: bson.Decimal128) -> str:
-    string = DATETIME_FIELD._serialize(data, "none", SpanJSONEncoder.EMPTY)
+    string = _datetime_field()._serialize(data, "none", SpanJSONEncoder.EMPTY)
     return dumper.represent_str(string)
 
 
@@ -104,18 +171,28 @@ class SpanYamlEncoder(yaml.SafeDumper):
     pass
 
 
-SpanYamlEncoder.add_representer(RawBSONDocument, _yaml_represent_raw_bson_document)
-SpanYamlEncoder.add_representer(bytes, _yaml_represent_bytes)
-SpanYamlEncoder.add_representer(uuid.UUID, _yaml_represent_uuid)
-SpanYamlEncoder.add_representer(decimal.Decimal, _yaml_represent_decimal)
-SpanYamlEncoder.add_representer(bson.Decimal128, _yaml_represent_decimal_bson)
-SpanYamlEncoder.add_representer(datetime.datetime, _yaml_represent_datetime)
+_YAML_REPRESENTERS: Tuple[Tuple[type, Callable[[Any, Any], Any]], ...] = (
+    (RawBSONDocument, _yaml_represent_raw_bson_document),
+    (bytes, _yaml_represent_bytes),
+    (uuid.UUID, _yaml_represent_uuid),
+    (decimal.Decimal, _yaml_represent_decimal),
+    (bson.Decimal128, _yaml_represent_decimal_bson),
+    (datetime.datetime, _yaml_represent_datetime),
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _yaml_dumper() -> Type[SpanYamlEncoder]:
+    """:class:`SpanYamlEncoder`, with its representers added on first use."""
+    for data_type, representer in _YAML_REPRESENTERS:
+        SpanYamlEncoder.add_representer(data_type, representer)
+    return SpanYamlEncoder
 
 
 def yaml_encode(media: DataMappingType) -> bytes:
     if media is None:
         return b""
-    return yaml.dump(media, Dumper=SpanYamlEncoder).encode()
+    return yaml.dump(media, Dumper=_yaml_dumper()).encode()
 
 
 def yaml_decode(content: bytes) -> DataMappingType:
@@ -131,11 +208,42 @@ ENCODE_TYPES = Optional[
 ]
 
 
+def _bson_fallback_encoder(value: Any) -> Any:
+    """
+    Encodes numpy arrays as binary with dtype / shape metadata, and numpy scalars as
+    their python equivalent.
+    """
+    if isinstance(value, _numpy_types()):
+        if value.ndim == 0:
+            return value.item()
+        return bson.Binary(ndarray_to_bytes(value), NDARRAY_BSON_SUBTYPE)
+    return value
+
+
+class _NDArrayBSONDecoder(TypeDecoder):
+    bson_type = bson.Binary
+
+    def transform_bson(self, value: bson.Binary) -> Any:
+        if value.subtype == NDARRAY_BSON_SUBTYPE:
+            array = _load_ndarray(value)
+            if array is not None:
+                return array
+        return value
+
+
+BSON_ENCODE_OPTIONS = DEFAULT_CODEC_OPTIONS.with_options(
+    type_registry=TypeRegistry(fallback_encoder=_bson_fallback_encoder)
+)
+BSON_DECODE_OPTIONS = DEFAULT_RAW_BSON_OPTIONS.with_options(
+    type_registry=TypeRegistry([_NDArrayBSONDecoder()])
+)
+
+
 def _bson_encode_single(data: Union[RawBSONDocument, dict]) -> bytes:
     if isinstance(data, RawBSONDocument):
         return data.raw
     else:
-        return bson.BSON.encode(data)
+        return bson.BSON.encode(data, codec_options=BSON_ENCODE_OPTIONS)
 
 
 def bson_encode(data: ENCODE_TYPES) -> bytes:
@@ -161,7 +269,7 @@ def bson_decode_list(content: bytes) -> List[RawBSONDocument]:
     loaded_list: List[RawBSONDocument] = list()
 
     for record_raw in record_raw_list:
-        loaded_list.append(RawBSONDocument(record_raw))
+        loaded_list.append(RawBSONDocument(record_raw, BSON_DECODE_OPTIONS))
 
     return loaded_list
 
@@ -173,7 +281,479 @@ def bson_decode(content: bytes) -> Union[RawBSONDocument, List[RawBSONDocument]]
     if content.startswith(BSON_RECORD_DELIM):
         return bson_decode_list(content)
     else:
-        return RawBSONDocument(content)
+        return RawBSONDocument(content, BSON_DECODE_OPTIONS)
+
+
+MSGPACK_READ_SIZE = 64 * 1024
+
+
+def _require_msgpack() -> None:
+    if msgpack is None:
+        raise ImportError(
+            "'msgpack' must be installed for MimeType.MSGPACK. Install "
+            "spantools[msgpack]."
+        )
+
+
+def _msgpack_default(obj: Any) -> Any:
+    """
+    Converts types msgpack cannot pack, following ``SpanJSONEncoder``'s conventions.
+    ``bytes`` are packed natively as msgpack bin.
+    """
+    if isinstance(obj, bson.Decimal128):
+        obj = obj.to_decimal()
+
+    if isinstance(obj, datetime.datetime):
+        return _datetime_field()._serialize(obj, "none", SpanJSONEncoder.EMPTY)
+    elif isinstance(obj, uuid.UUID):
+        return str(obj)
+    elif isinstance(obj, RawBSONDocument):
+        return _convert_bson_doc(obj)
+    elif isinstance(obj, decimal.Decimal):
+        return str(obj)
+    elif isinstance(obj, _numpy_types()):
+        if obj.ndim == 0:
+            return obj.item()
+        return msgpack.ExtType(NDARRAY_MSGPACK_CODE, ndarray_to_bytes(obj))
+    else:
+        raise TypeError(
+            f"Value {obj} or type {obj.__class__} is not MessagePack-Serializable"
+        )
+
+
+def _msgpack_ext_hook(code: int, data: bytes) -> Any:
+    if code == NDARRAY_MSGPACK_CODE:
+        array = _load_ndarray(data)
+        if array is not None:
+            return array
+    return msgpack.ExtType(code, data)
+
+
+def msgpack_encode(data: Any) -> bytes:
+    if data is None:
+        return b""
+    _require_msgpack()
+    return msgpack.packb(data, default=_msgpack_default, use_bin_type=True)
+
+
+def msgpack_decode(content: bytes) -> DataMappingType:
+    _require_msgpack()
+    loaded = msgpack.unpackb(content, raw=False, ext_hook=_msgpack_ext_hook)
+    if not isinstance(loaded, (dict, list)):
+        raise ValueError("msgpack did not decode to list or map")
+    return loaded
+
+
+def iter_msgpack_records(
+    stream: Union[bytes, bytearray, memoryview, BinaryIO],
+    read_size: int = MSGPACK_READ_SIZE,
+) -> Iterator[Any]:
+    """
+    Lazily loads the records of a ``MimeType.MSGPACK`` body holding a list, one record
+    at a time.
+
+    :param stream: Body content, or a binary file-like object to read it from.
+    :param read_size: Number of bytes to read from ``stream`` at a time.
+
+    :raises ContentDecodeError: If the body is not a list, is truncated, or cannot be
+        unpacked.
+    """
+    _require_msgpack()
+
+    if isinstance(stream, (bytes, bytearray, memoryview)):
+        unpacker = msgpack.Unpacker(raw=False, ext_hook=_msgpack_ext_hook)
+        unpacker.feed(stream)
+    else:
+        unpacker = msgpack.Unpacker(
+            stream, raw=False, read_size=read_size, ext_hook=_msgpack_ext_hook
+        )
+
+    try:
+        size = unpacker.read_array_header()
+        for _ in range(size):
+            yield unpacker.unpack()
+    except msgpack.OutOfData:
+        raise ContentDecodeError("truncated msgpack body")
+    except (msgpack.UnpackException, ValueError):
+        raise ContentDecodeError("Error occurred while decoding msgpack records")
+
+
+def _require_cbor() -> ModuleType:
+    if cbor2 is None:
+        raise ImportError(
+            "'cbor2' must be installed for MimeType.CBOR. Install spantools[cbor]."
+        )
+    return cbor2
+
+
+def _cbor_default(encoder: Any, obj: Any) -> None:
+    """
+    Encodes types cbor2 has no tag for. ``datetime``, ``UUID``, ``Decimal``, ``bytes``
+    and big ints are encoded natively with their standard CBOR tags.
+    """
+    if isinstance(obj, bson.Decimal128):
+        encoder.encode(obj.to_decimal())
+    elif isinstance(obj, RawBSONDocument):
+        encoder.encode(_convert_bson_doc(obj))
+    else:
+        raise TypeError(f"Value {obj} or type {obj.__class__} is not CBOR-Serializable")
+
+
+def cbor_encode(data: Any) -> bytes:
+    if data is None:
+        return b""
+    cbor = _require_cbor()
+    # Naive datetimes are treated as UTC, like BSON does.
+    return cbor.dumps(data, default=_cbor_default, timezone=datetime.timezone.utc)
+
+
+def cbor_decode(content: bytes) -> DataMappingType:
+    loaded = _require_cbor().loads(content)
+    if not isinstance(loaded, (dict, list)):
+        raise ValueError("cbor did not decode to list or map")
+    return loaded
+
+
+class _CountingReader(io.RawIOBase):
+    """
+    Tracks how many bytes have been read from ``stream``, so the end of a CBOR
+    sequence can be told apart from a truncated item.
+    """
+
+    def __init__(self, stream: BinaryIO):
+        self._stream = stream
+        self.position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        chunk = self._stream.read(len(buffer))
+        size = len(chunk)
+        buffer[:size] = chunk
+        self.position += size
+        return size
+
+
+def iter_cbor_sequence(
+    stream: Union[bytes, bytearray, memoryview, BinaryIO]
+) -> Iterator[Any]:
+    """
+    Lazily loads the items of a CBOR sequence (RFC 8742): CBOR items concatenated
+    back to back, one item at a time.
+
+    :param stream: Body content, or a binary file-like object to read it from.
+
+    :raises ContentDecodeError: If the last item is truncated, or an item cannot be
+        decoded.
+    """
+    cbor = _require_cbor()
+
+    if isinstance(stream, (bytes, bytearray, memoryview)):
+        stream = io.BytesIO(stream)
+
+    reader = _CountingReader(stream)
+    # Not buffered: read-ahead would hide where each item ends.
+    decoder = cbor.CBORDecoder(cast(IO[bytes], reader))
+
+    while True:
+        start = reader.position
+        try:
+            yield decoder.decode()
+        except cbor.CBORDecodeEOF:
+            if reader.position == start:
+                return
+            raise ContentDecodeError("truncated cbor sequence")
+        except cbor.CBORDecodeError:
+            raise ContentDecodeError("Error occurred while decoding cbor sequence")
+
+
+ARROW_BATCH_SIZE = 64 * 1024
+"""Maximum number of rows per record batch in ``MimeType.ARROW`` streams."""
+
+
+def _require_arrow() -> Any:
+    """
+    Imports pyarrow on first use rather than with spantools, as it is slow to import
+    and loads numpy.
+    """
+    try:
+        import pyarrow
+        import pyarrow.ipc
+    except ImportError:  # pragma: no cover
+        raise ImportError(
+            "'pyarrow' must be installed for MimeType.ARROW. Install spantools[arrow]."
+        )
+    return pyarrow
+
+
+def _arrow_value(value: Any) -> Any:
+    """
+    Converts bson types arrow cannot infer, following ``SpanJSONEncoder``'s
+    conventions.
+    """
+    if isinstance(value, bson.Decimal128):
+        return value.to_decimal()
+    elif isinstance(value, RawBSONDocument):
+        return {
+            key: _arrow_value(item) for key, item in _convert_bson_doc(value).items()
+        }
+    elif isinstance(value, Mapping):
+        return {key: _arrow_value(item) for key, item in value.items()}
+    elif isinstance(value, list):
+        return [_arrow_value(item) for item in value]
+    return value
+
+
+def _arrow_table(pyarrow: Any, data: Any) -> Any:
+    if isinstance(data, pyarrow.Table):
+        return data
+    elif isinstance(data, pyarrow.RecordBatch):
+        return pyarrow.Table.from_batches([data])
+    elif isinstance(data, Mapping):
+        data = [data]
+
+    try:
+        return pyarrow.Table.from_pylist(data)
+    except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+        # Only walk the records when they hold bson values, which is the rare case.
+        return pyarrow.Table.from_pylist([_arrow_value(record) for record in data])
+
+
+def arrow_encode(data: Any) -> bytes:
+    """
+    Encodes a list of records, or an arrow ``Table`` / ``RecordBatch``, to an arrow
+    IPC stream. Column types are inferred from the records.
+    """
+    if data is None:
+        return b""
+    pyarrow = _require_arrow()
+
+    table = _arrow_table(pyarrow, data)
+    sink = pyarrow.BufferOutputStream()
+    with pyarrow.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table, max_chunksize=ARROW_BATCH_SIZE)
+    return sink.getvalue().to_pybytes()
+
+
+def arrow_decode(content: bytes) -> Any:
+    """
+    Decodes an arrow IPC stream to a ``Table``. Columns reference ``content``'s
+    memory rather than copying it.
+    """
+    pyarrow = _require_arrow()
+    with pyarrow.ipc.open_stream(pyarrow.py_buffer(content)) as reader:
+        return reader.read_all()
+
+
+CSV_CHUNK_SIZE = 64 * 1024
+"""Approximate size in bytes of the chunks yielded by :func:`iter_csv_chunks`."""
+
+
+def _csv_value(value: Any) -> str:
+    """
+    Formats a single cell, following ``SpanJSONEncoder``'s conventions for
+    datetimes, decimals, bytes and bson types. Nested containers are written as JSON.
+    """
+    if isinstance(value, str):
+        return value
+    elif value is None:
+        return ""
+    elif isinstance(value, bool):
+        return "true" if value else "false"
+    elif isinstance(value, (int, float, uuid.UUID)):
+        return str(value)
+    # Encoders only return None when writing to a stream.
+    encoder = _json_encoder()
+    if isinstance(value, (Mapping, list, tuple)):
+        return cast(str, encoder(value))
+
+    formatted = encoder.default(value)
+    if isinstance(formatted, str):
+        return formatted
+    return cast(str, encoder(formatted))
+
+
+def schema_csv_fields(data_schema: marshmallow.Schema) -> List[str]:
+    """
+    Column names for records dumped by ``data_schema``, in the order its fields are
+    declared.
+    """
+    dump_fields = data_schema.dump_fields
+    return [
+        dump_fields[name].data_key or name
+        for name in data_schema.declared_fields
+        if name in dump_fields
+    ]
+
+
+def iter_csv_chunks(
+    records: Union[Mapping[str, Any], Iterable[Any]],
+    fields: Optional[Sequence[str]] = None,
+    data_schema: Optional[marshmallow.Schema] = None,
+    delimiter: str = ",",
+    chunk_size: int = CSV_CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """
+    Lazily encodes ``records`` to a ``MimeType.CSV`` body with a header row, yielding
+    chunks of roughly ``chunk_size`` bytes.
+
+    :param records: Record mappings, or objects to dump through ``data_schema``. A
+        single mapping is written as one row. Records are consumed one at a time, so
+        this may be a generator.
+    :param fields: Column order. Defaults to the field order of ``data_schema``, or
+        the keys of the first record.
+    :param data_schema: marshmallow schema to dump each record with as it is
+        written.
+    :param delimiter: Cell delimiter. ``"\\t"`` writes ``MimeType.TSV``.
+    :param chunk_size: Approximate size of each yielded chunk.
+
+    :raises ValueError: If a record has a key not in ``fields``.
+    """
+    if isinstance(records, Mapping):
+        records = [records]
+    rows = iter(records)
+
+    if data_schema is not None:
+        rows = (data_schema.dump(record, many=False) for record in rows)
+        if fields is None:
+            fields = schema_csv_fields(data_schema)
+
+    if fields is None:
+        fields, rows = _peek_csv_fields(rows)
+        if fields is None:
+            return
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, delimiter=delimiter, lineterminator="\r\n")
+    writer.writerow(fields)
+    field_set = set(fields)
+
+    for row in rows:
+        writer.writerow(_csv_row(row, fields, field_set))
+
+        if buffer.tell() >= chunk_size:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def _chain_first(first: Any, rest: Iterator[Any]) -> Iterator[Any]:
+    yield first
+    yield from rest
+
+
+def _peek_csv_fields(
+    rows: Iterator[Mapping[str, Any]]
+) -> Tuple[Optional[List[str]], Iterator[Mapping[str, Any]]]:
+    """Takes the columns from the keys of the first row, without consuming it."""
+    try:
+        first = next(rows)
+    except StopIteration:
+        return None, rows
+    return list(first), _chain_first(first, rows)
+
+
+def _csv_row(
+    row: Mapping[str, Any], fields: Sequence[str], field_set: AbstractSet[str]
+) -> List[str]:
+    extra = row.keys() - field_set
+    if extra:
+        raise ValueError(f"record has fields not in columns: {sorted(extra)}")
+    return [_csv_value(row.get(name)) for name in fields]
+
+
+def iter_csv_records(
+    stream: Union[bytes, bytearray, memoryview, BinaryIO], delimiter: str = ","
+) -> Iterator[Dict[str, Optional[str]]]:
+    """
+    Lazily loads the rows of a ``MimeType.CSV`` body with a header row, one record at
+    a time. Cells are loaded as strings, and empty cells as ``None``. Pass the records
+    through a marshmallow schema to load typed values.
+
+    :param stream: Body content, or a binary file-like object to read it from.
+    :param delimiter: Cell delimiter. ``"\\t"`` reads ``MimeType.TSV``.
+
+    :raises ContentDecodeError: If the body is not valid utf-8, cannot be parsed, or a
+        row has more or fewer cells than the header. Blank lines are skipped.
+    """
+    if isinstance(stream, (bytes, bytearray, memoryview)):
+        stream = io.BytesIO(stream)
+
+    text = io.TextIOWrapper(stream, encoding="utf-8", newline="")
+    try:
+        reader = csv.reader(text, delimiter=delimiter, strict=True)
+        fields = next(reader, None)
+        if fields is None:
+            return
+        for row in reader:
+            if not row:
+                continue
+            if len(row) != len(fields):
+                raise ContentDecodeError(
+                    f"csv row on line {reader.line_num} has {len(row)} cells, "
+                    f"but the header has {len(fields)}"
+                )
+            yield {name: value or None for name, value in zip(fields, row)}
+    except (csv.Error, UnicodeDecodeError):
+        raise ContentDecodeError("Error occurred while decoding csv records")
+    finally:
+        # The caller owns the stream.
+        text.detach()
+
+
+def csv_encode(
+    data: Any, fields: Optional[Sequence[str]] = None, delimiter: str = ","
+) -> bytes:
+    return b"".join(iter_csv_chunks(data, fields=fields, delimiter=delimiter))
+
+
+def csv_decode(content: bytes, delimiter: str = ",") -> List[Dict[str, Optional[str]]]:
+    return list(iter_csv_records(content, delimiter=delimiter))
+
+
+tsv_encode = functools.partial(csv_encode, delimiter="\t")
+tsv_decode = functools.partial(csv_decode, delimiter="\t")
+
+
+def _schema_encoder(
+    encoder: EncoderType, data_schema: marshmallow.Schema
+) -> EncoderType:
+    """
+    Fixes the column order of the default csv / tsv encoders to the field order of
+    ``data_schema``.
+    """
+    if encoder is csv_encode:
+        return functools.partial(csv_encode, fields=schema_csv_fields(data_schema))
+    elif encoder is tsv_encode:
+        return functools.partial(
+            csv_encode, fields=schema_csv_fields(data_schema), delimiter="\t"
+        )
+    return encoder
+
+
+_TABULAR_MIMETYPES = (MimeType.ARROW, MimeType.CSV, MimeType.TSV)
+
+
+def _schema_records(loaded: Any, mimetype: MimeTypeTolerant, many: bool) -> Any:
+    """
+    Prepares decoded tabular bodies for schema loading. Arrow tables are converted to a
+    list of records, and if the schema loads a single record, the only row of a
+    one-row body is unwrapped.
+    """
+    # Tables can only have been decoded if pyarrow is already imported.
+    pyarrow = sys.modules.get("pyarrow")
+    if pyarrow is not None and isinstance(loaded, pyarrow.Table):
+        loaded = loaded.to_pylist()
+    elif not any(MimeType.is_mimetype(mimetype, m) for m in _TABULAR_MIMETYPES):
+        return loaded
+
+    if not many and len(loaded) == 1:
+        return loaded[0]
+    return loaded
 
 
 # The proto encoders and decoders will just pass bytes through, since marshalling and
@@ -186,18 +766,37 @@ def proto_decode(content: bytes) -> bytes:
     return content
 
 
-DEFAULT_ENCODERS: Dict[MimeTypeTolerant, EncoderType] = {
+def proto_stream_encode(data: Iterable[google.protobuf.message.Message]) -> bytes:
+    """
+    Encodes ``data`` messages to a varint length-delimited stream.
+    """
+    return b"".join(iter_proto_frames(data))
+
+
+_BUILTIN_ENCODERS: Dict[MimeTypeTolerant, EncoderType] = {
     MimeType.JSON: json_encode,
     MimeType.BSON: bson_encode,
     MimeType.YAML: yaml_encode,
     MimeType.TEXT: lambda x: x.encode(),
     MimeType.PROTO: proto_encode,
+    MimeType.PROTO_STREAM: proto_stream_encode,
+    MimeType.MSGPACK: msgpack_encode,
+    MimeType.CBOR: cbor_encode,
+    MimeType.ARROW: arrow_encode,
+    MimeType.CSV: csv_encode,
+    MimeType.TSV: tsv_encode,
 }
 
-DEFAULT_DECODERS: Dict[MimeTypeTolerant, DecoderType] = {
+_BUILTIN_DECODERS: Dict[MimeTypeTolerant, DecoderType] = {
     MimeType.JSON: json_decode,
     MimeType.BSON: bson_decode,
     MimeType.YAML: yaml_decode,
     MimeType.TEXT: lambda x: x.decode(),
     MimeType.PROTO: proto_decode,
+    MimeType.PROTO_STREAM: proto_decode,
+    MimeType.MSGPACK: msgpack_decode,
+    MimeType.CBOR: cbor_decode,
+    MimeType.ARROW: arrow_decode,
+    MimeType.CSV: csv_decode,
+    MimeType.TSV: tsv_decode,
 }
@@ -0,0 +1,52 @@
+from typing import MutableMapping, Optional
+
+from ._mimetype import MimeType
+from ._models import Error, PagingResp, _PAGING_RESP_HEADER_KEYS
+from ._typing import MimeTypeTolerant
+
+
+def build_response_headers(
+    headers: MutableMapping[str, str],
+    mimetype: MimeTypeTolerant = None,
+    error: Optional[Error] = None,
+    paging: Optional[PagingResp] = None,
+    data_mimetype: MimeTypeTolerant = None,
+    max_data_size: Optional[int] = None,
+) -> Optional[bytes]:
+    """
+    Adds content type, error and paging headers for a response to ``headers`` in-place.
+
+    :param headers: mapping to add headers to.
+    :param mimetype: mimetype of the response body. Skipped if ``None``.
+    :param error: error to add. Skipped if ``None``.
+    :param paging: paging info to add. Skipped if ``None``.
+    :param data_mimetype: How to encode ``error.data``. See :func:`Error.to_headers`.
+    :param max_data_size: Max size of the ``"error-data"`` header value. See
+        :func:`Error.to_headers`.
+    :return: Encoded error data to send as the response body if it exceeded
+        ``max_data_size``, otherwise ``None``.
+
+    :raises ValueError: If ``data_mimetype`` is not ``None``, JSON or BSON.
+
+    Writes the same headers as :func:`MimeType.add_to_headers`, :func:`Error.to_headers`
+    and :func:`PagingResp.to_headers`, with paging headers written from precomputed
+    header keys.
+    """
+    if isinstance(mimetype, MimeType):
+        headers["Content-Type"] = mimetype.value
+    elif mimetype is not None:
+        headers["Content-Type"] = MimeType.to_string(mimetype)
+
+    body = None
+    if error is not None:
+        body = error.to_headers(
+            headers, data_mimetype=data_mimetype, max_data_size=max_data_size
+        )
+
+    if paging is not None:
+        for name, key in _PAGING_RESP_HEADER_KEYS:
+            value = getattr(paging, name)
+            if value is not None:
+                headers[key] = str(value)
+
+    return body
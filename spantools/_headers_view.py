@@ -0,0 +1,89 @@
+from typing import Dict, Iterator, Mapping, Optional, TypeVar, Union
+
+
+_DefaultType = TypeVar("_DefaultType")
+
+
+class HeadersView(Mapping[str, str]):
+    """
+    Read-only, case-insensitive view of a header mapping. Values are not copied.
+
+    Lookups try the key as given first, so headers already in the expected casing, or
+    mappings which are case-insensitive themselves, cost a single lookup. On the first
+    miss, an index of lowercased keys is built and used for every later lookup.
+
+    The wrapped mapping should not be modified while the view is in use.
+
+    Every ``from_headers`` method in spantools reads headers through this view, so
+    headers may be passed in whatever casing a framework hands them over in.
+    """
+
+    __slots__ = ("_headers", "_folded")
+
+    def __init__(self, headers: Mapping[str, str]):
+        """
+        :param headers: mapping of header names to values.
+        """
+        self._headers: Mapping[str, str] = headers
+        self._folded: Optional[Dict[str, str]] = None
+
+    @classmethod
+    def wrap(cls, headers: Mapping[str, str]) -> "HeadersView":
+        """
+        Returns ``headers`` if it is already a :class:`HeadersView`, otherwise wraps it.
+        """
+        if isinstance(headers, HeadersView):
+            return headers
+        return cls(headers)
+
+    def _fold(self) -> Dict[str, str]:
+        folded = self._folded
+        if folded is None:
+            folded = {key.lower(): key for key in self._headers}
+            self._folded = folded
+        return folded
+
+    def _original_key(self, key: str) -> Optional[str]:
+        folded = self._fold()
+        original = folded.get(key)
+        if original is None:
+            original = folded.get(key.lower())
+        return original
+
+    def __getitem__(self, key: str) -> str:
+        if self._folded is None:
+            value = self._headers.get(key)
+            if value is not None:
+                return value
+
+        original = self._original_key(key)
+        if original is None:
+            raise KeyError(key)
+        return self._headers[original]
+
+    def get(  # type: ignore
+        self, key: str, default: Optional[_DefaultType] = None
+    ) -> Union[str, _DefaultType, None]:
+        if self._folded is None:
+            value = self._headers.get(key)
+            if value is not None:
+                return value
+
+        original = self._original_key(key)
+        if original is None:
+            return default
+        return self._headers[original]
+
+    def __contains__(self, key: object) -> bool:
+        if key in self._headers:
+            return True
+        return isinstance(key, str) and key.lower() in self._fold()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._headers)
+
+    def __len__(self) -> int:
+        return len(self._headers)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._headers!r})"
@@ -3,6 +3,7 @@ from enum import Enum
 from typing import Mapping, MutableMapping, cast
 
 
+from ._headers_view import HeadersView
 from ._typing import MimeTypeTolerant
 
 
@@ -10,8 +11,14 @@ class MimeType(Enum):
     JSON = "application/json"
     YAML = "application/yaml"
     BSON = "application/bson"
+    MSGPACK = "application/msgpack"
+    CBOR = "application/cbor"
+    ARROW = "application/vnd.apache.arrow.stream"
     PROTO = "application/protobuf"
+    PROTO_STREAM = "application/protobuf-stream"
     TEXT = "text/plain"
+    CSV = "text/csv"
+    TSV = "text/tab-separated-values"
 
     @staticmethod
     def _clean_text(text: str) -> str:
@@ -55,6 +62,7 @@ class MimeType(Enum):
                 mimetype.value.endswith(cleaned)
                 or mimetype.value.startswith(cleaned)
                 or cleaned == mimetype
+                or _ALIASES.get(cleaned) is mimetype
             )
 
     @classmethod
@@ -104,6 +112,8 @@ class MimeType(Enum):
         """
         if mimetype is None:
             return
+        elif isinstance(mimetype, MimeType):
+            headers["Content-Type"] = mimetype.value
         else:
             headers["Content-Type"] = MimeType.to_string(mimetype)
 
@@ -116,10 +126,14 @@ class MimeType(Enum):
         :return: mimetype.
 
         If known mimetype, enum value will be returned. If 'Content-Type' is not in
-        headers, None is returned.
+        headers, None is returned. Header names are matched case-insensitively.
         """
-        name = headers.get("Content-Type")
+        name = HeadersView.wrap(headers).get("Content-Type")
         try:
             return cls.from_name(name)
         except ValueError:
             return name
+
+
+_ALIASES: Mapping[str, MimeType] = {"tsv": MimeType.TSV}
+"""Short names for mimetypes which are not a prefix or suffix of their value."""
@@ -1,12 +1,93 @@
 import uuid
 import json
+import base64
+import bson
+import rapidjson
+import decimal
+import datetime
+from bson.raw_bson import RawBSONDocument
+from bson.codec_options import CodecOptions
 from dataclasses import dataclass, field, fields
-from typing import Optional, Tuple, Mapping, Dict, Type, MutableMapping
+from typing import Optional, Tuple, Mapping, Dict, Type, MutableMapping, Callable
+from typing import Any, List, Union, cast
+
+from .errors_api import APIError, ERRORS_INDEXED, ErrorRegistry
+from ._errors import NoErrorReturnedError, InvalidAPIErrorCodeError, NoContentError
+from ._encoders import json_encode
+from ._mimetype import MimeType
+from ._headers_view import HeadersView
+from ._typing import MimeTypeTolerant
+
+
+def _lazy_property(name: str, factory: Callable[[], Any]) -> property:
+    """
+    Property for a field stored in slot ``_<name>``. If the stored value is ``None``
+    when the field is first read, it is generated by ``factory``.
+    """
+    slot = f"_{name}"
+
+    def getter(self: Any) -> Any:
+        value = getattr(self, slot)
+        if value is None:
+            value = factory()
+            setattr(self, slot, value)
+        return value
+
+    def setter(self: Any, value: Any) -> None:
+        setattr(self, slot, value)
+
+    return property(getter, setter)
+
+
+def _getstate_realized(self: Any) -> Tuple[None, Dict[str, Any]]:
+    # Read fields through their properties so lazy values are generated before a copy
+    # or pickle is made, rather than separately by each copy.
+    state = {f.name: getattr(self, f.name) for f in fields(self)}
+    return None, state
+
+
+def _slotted(
+    lazy: Optional[Mapping[str, Callable[[], Any]]] = None
+) -> Callable[[type], type]:
+    """
+    Rebuilds a dataclass with ``__slots__`` for the fields it declares, the way
+    ``dataclass(slots=True)`` does on python 3.10+.
+
+    :param lazy: field name -> factory for fields that should be generated on first
+        read instead of at init when left as ``None``.
+    """
+    lazy_fields = dict() if lazy is None else lazy
+
+    def wrap(cls: type) -> type:
+        cls_dict = dict(cls.__dict__)
+        own_fields = cls_dict.get("__annotations__", dict())
+
+        slots = list()
+        for name in own_fields:
+            # Class-level defaults would shadow the slot descriptors. They are already
+            # baked into the generated __init__.
+            cls_dict.pop(name, None)
+            if name in lazy_fields:
+                slots.append(f"_{name}")
+                cls_dict[name] = _lazy_property(name, lazy_fields[name])
+            else:
+                slots.append(name)
+
+        if lazy_fields:
+            cls_dict["__getstate__"] = _getstate_realized
+
+        cls_dict["__slots__"] = tuple(slots)
+        cls_dict.pop("__dict__", None)
+        cls_dict.pop("__weakref__", None)
 
-from .errors_api import APIError, ERRORS_INDEXED
-from ._errors import NoErrorReturnedError, InvalidAPIErrorCodeError
+        slotted = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+        slotted.__qualname__ = cls.__qualname__
+        return slotted
 
+    return wrap
 
+
+@_slotted(lazy={"id": uuid.uuid4})
 @dataclass
 class Error:
     """Model for error information."""
@@ -23,8 +104,11 @@ class Error:
     data: Optional[dict] = None
     """Arbitrary data dict with information about the error."""
 
-    id: uuid.UUID = field(default_factory=uuid.uuid4)
-    """UUID for specific instance of raised error for bug fixing."""
+    id: uuid.UUID = field(default=cast(uuid.UUID, None))
+    """
+    UUID for specific instance of raised error for bug fixing. Generated on first access
+    if not supplied.
+    """
 
     @classmethod
     def from_exception(cls, exc: BaseException) -> Tuple["Error", APIError]:
@@ -54,18 +138,24 @@ class Error:
         return error_data, exc
 
     @classmethod
-    def from_headers(cls, headers: Mapping[str, str]) -> "Error":
+    def from_headers(
+        cls, headers: Mapping[str, str], content: Optional[bytes] = None
+    ) -> "Error":
         """
         Creates Error object from mapping of response headers.
 
         :param headers:
+        :param content: response body. Only needed if error data was moved to the body
+            by :func:`Error.to_headers`.
         :return:
+
+        :raises NoContentError: If error data was sent in the body but ``content`` is
+            not supplied.
+
+        Header names are matched case-insensitively.
         """
-        data = headers.get("error-data", None)
-        if data is not None:
-            data_loaded = json.loads(data)
-        else:
-            data_loaded = None
+        headers = HeadersView.wrap(headers)
+        data_loaded = _load_error_data(headers, content)
 
         try:
             error_data = cls(
@@ -81,12 +171,15 @@ class Error:
         return error_data
 
     def to_exception(
-        self, errors_additional: Optional[Dict[int, Type[APIError]]] = None
+        self, errors_additional: Optional[Mapping[int, Type[APIError]]] = None
     ) -> APIError:
         """
         Generate APIError object for given error information.
 
         :param errors_additional: Additional custom APIError classes for possible raise.
+            Pass an :class:`ErrorRegistry` to resolve the class with a single lookup.
+            Built-in errors take precedence over classes in plain mappings. The
+            mapping is not modified.
 
         :return: BaseException instance with message, .api_code, .error_data and
             .error_id
@@ -94,14 +187,14 @@ class Error:
         :raises InvalidErrorCodeError: when error class with correct api_code not
             supplied.
         """
+        if isinstance(errors_additional, ErrorRegistry):
+            error_class = errors_additional.get(self.code)
+        else:
+            error_class = ERRORS_INDEXED.get(self.code)
+            if error_class is None and errors_additional is not None:
+                error_class = errors_additional.get(self.code)
 
-        if errors_additional is None:
-            errors_additional = dict()
-        errors_additional.update(ERRORS_INDEXED)
-
-        try:
-            error_class = errors_additional[self.code]
-        except KeyError:
+        if error_class is None:
             raise InvalidAPIErrorCodeError(
                 f"Error class with code {self.code} not supplied."
             )
@@ -110,12 +203,26 @@ class Error:
 
         return error
 
-    def to_headers(self, headers: MutableMapping) -> None:
+    def to_headers(
+        self,
+        headers: MutableMapping,
+        data_mimetype: MimeTypeTolerant = None,
+        max_data_size: Optional[int] = None,
+    ) -> Optional[bytes]:
         """
         Adds error info to response headers in-place.
 
         :param headers:
-        :return:
+        :param data_mimetype: How to encode ``data``. ``None`` uses ``json.dumps``,
+            ``MimeType.JSON`` uses the faster spantools JSON encoder and
+            ``MimeType.BSON`` sends base64-encoded BSON.
+        :param max_data_size: Max size of the ``"error-data"`` header value. Larger data
+            is not added to the headers, and is returned to be sent as the response
+            body instead.
+        :return: Encoded error data to send as the response body if it exceeded
+            ``max_data_size``, otherwise ``None``.
+
+        :raises ValueError: If ``data_mimetype`` is not ``None``, JSON or BSON.
 
         All values are converted to strings before being added. Optional fields whose
         values are None are skipped.
@@ -127,10 +234,73 @@ class Error:
         headers["error-message"] = self.message
         headers["error-id"] = str(self.id)
         headers["error-code"] = str(self.code)
-        if self.data:
-            headers["error-data"] = json.dumps(self.data)
+        if not self.data:
+            return None
+
+        if data_mimetype is None:
+            header_value = json.dumps(self.data)
+        else:
+            data_mimetype = MimeType.from_name(data_mimetype)
+            if data_mimetype not in _ERROR_DATA_MIMETYPES:
+                raise ValueError(f"error data cannot be encoded as {data_mimetype}")
+
+            encoded = _dump_error_data(self.data, data_mimetype)
+            header_value = _to_header_value(encoded, data_mimetype)
+            headers["error-data-type"] = data_mimetype.value
+
+        if max_data_size is not None and len(header_value) > max_data_size:
+            headers["error-data-location"] = "body"
+            if data_mimetype is None:
+                headers["error-data-type"] = MimeType.JSON.value
+                return header_value.encode()
+            return encoded
+
+        headers["error-data"] = header_value
+        return None
 
 
+_ERROR_DATA_MIMETYPES = (MimeType.JSON, MimeType.BSON)
+
+
+def _dump_error_data(data: dict, data_mimetype: MimeType) -> bytes:
+    if data_mimetype is MimeType.BSON:
+        return bson.BSON.encode(data)
+    else:
+        return json_encode(data)
+
+
+def _to_header_value(encoded: bytes, data_mimetype: MimeType) -> str:
+    if data_mimetype is MimeType.BSON:
+        return base64.b64encode(encoded).decode()
+    else:
+        return encoded.decode()
+
+
+def _load_error_data(
+    headers: Mapping[str, str], content: Optional[bytes]
+) -> Optional[dict]:
+    data_type = headers.get("error-data-type")
+
+    if headers.get("error-data-location") == "body":
+        if not content:
+            raise NoContentError("error data sent in body, but no content supplied")
+        encoded: Union[str, bytes] = content
+    else:
+        header_value = headers.get("error-data")
+        if header_value is None:
+            return None
+        elif MimeType.is_mimetype(data_type, MimeType.BSON):
+            encoded = base64.b64decode(header_value)
+        else:
+            encoded = header_value
+
+    if MimeType.is_mimetype(data_type, MimeType.BSON):
+        return bson.BSON(encoded).decode()
+    else:
+        return rapidjson.loads(encoded)
+
+
+@_slotted()
 @dataclass
 class PagingReq:
     """Paging info for requests."""
@@ -192,6 +362,7 @@ class PagingReq:
         return cls(offset=offset, limit=limit)
 
 
+@_slotted()
 @dataclass
 class PagingResp(PagingReq):
     """Paging info for responses."""
@@ -224,11 +395,8 @@ class PagingResp(PagingReq):
         All header keys are prefixed with ``"paging-"`` and underscores are replaces
         with hyphens.
         """
-
-        for paging_field in fields(self):
-
-            value = getattr(self, paging_field.name)
-            key = f"paging-{paging_field.name.replace('_', '-')}"
+        for name, key in _PAGING_RESP_HEADER_KEYS:
+            value = getattr(self, name)
 
             if value is None:
                 continue
@@ -242,7 +410,10 @@ class PagingResp(PagingReq):
 
         :param headers:
         :return:
+
+        Header names are matched case-insensitively.
         """
+        headers = HeadersView.wrap(headers)
         previous_url = headers.get("paging-previous")
         next_url = headers.get("paging-next")
 
@@ -269,3 +440,284 @@ class PagingResp(PagingReq):
         )
 
         return paging_data
+
+
+@_slotted()
+@dataclass
+class ErrorBatch:
+    """
+    Errors for the individual items of a batch request, indexed by item position.
+    Sent as the body of a batch response so failed items do not need their own round
+    trip.
+    """
+
+    errors: Dict[int, Error] = field(default_factory=dict)
+    """Error for each failed item, by position of the item in the batch."""
+
+    def add_exception(self, index: int, exc: BaseException) -> APIError:
+        """
+        Records ``exc`` as the error for the item at ``index``.
+
+        :param index: position of the failed item in the batch.
+        :param exc: raised exception. Handled like :func:`Error.from_exception`.
+        :return: APIError recorded for the item.
+        """
+        error, api_error = Error.from_exception(exc)
+        self.errors[index] = error
+        return api_error
+
+    def to_content(
+        self,
+        mimetype: MimeTypeTolerant = MimeType.JSON,
+        headers: Optional[MutableMapping[str, str]] = None,
+    ) -> bytes:
+        """
+        Encodes the batch errors as a list of records, one per failed item.
+
+        :param mimetype: Content-Type to encode to. Must be a mimetype with a registered
+            encoder, such as JSON or BSON.
+        :param headers: response headers to add the Content-Type to.
+        :return: encoded response body.
+        """
+        # Imported here so loading the models does not load the content codecs.
+        from ._content_dump import encode_content
+
+        records = [_error_to_record(i, e) for i, e in self.errors.items()]
+        return encode_content(records, mimetype=mimetype, headers=headers)
+
+    @classmethod
+    def from_content(cls, content: bytes, mimetype: MimeTypeTolerant) -> "ErrorBatch":
+        """
+        Loads batch errors from a body encoded by :func:`ErrorBatch.to_content`.
+
+        :param content: response body.
+        :param mimetype: Content-Type of ``content``.
+
+        :raises ContentDecodeError: If ``content`` cannot be decoded.
+        """
+        from ._content_load import decode_content
+
+        _, decoded = decode_content(content, mimetype=mimetype)
+        records = cast(List[Dict[str, Any]], decoded)
+
+        batch = cls()
+        for record in records:
+            index, error = _error_from_record(record)
+            batch.errors[index] = error
+
+        return batch
+
+    def to_exceptions(
+        self, errors_additional: Optional[Mapping[int, Type[APIError]]] = None
+    ) -> Dict[int, APIError]:
+        """
+        Generates an APIError for each failed item, by item position.
+
+        :param errors_additional: Passed to :func:`Error.to_exception`.
+
+        :raises InvalidErrorCodeError: when error class with correct api_code not
+            supplied.
+        """
+        return {
+            index: error.to_exception(errors_additional)
+            for index, error in self.errors.items()
+        }
+
+
+def _error_to_record(index: int, error: Error) -> Dict[str, Any]:
+    return {
+        "index": index,
+        "name": error.name,
+        "message": error.message,
+        "code": error.code,
+        "data": error.data,
+        "id": error.id,
+    }
+
+
+def _error_from_record(record: Mapping[str, Any]) -> Tuple[int, Error]:
+    if isinstance(record, RawBSONDocument):
+        record = bson.BSON(record.raw).decode()
+
+    error_id = record["id"]
+    if not isinstance(error_id, uuid.UUID):
+        error_id = uuid.UUID(error_id)
+
+    error = Error(
+        name=record["name"],
+        message=record["message"],
+        code=record["code"],
+        data=record["data"],
+        id=error_id,
+    )
+    return record["index"], error
+
+
+_CURSOR_CODEC_OPTIONS = CodecOptions(tz_aware=True, tzinfo=datetime.timezone.utc)
+
+
+def encode_cursor(keys: Mapping[str, Any]) -> str:
+    """
+    Encodes the keyset of the last item of a page to a compact, url-safe cursor.
+
+    :param keys: sort key name -> value of the last item returned. Values can be any
+        BSON-encodable type, including datetimes, UUIDs, ObjectIds and Decimals.
+    :return: opaque cursor string.
+
+    Cursors are url-safe base64 encoded BSON. Datetimes are rounded to milliseconds.
+    """
+    converted = {
+        key: bson.Decimal128(value) if isinstance(value, decimal.Decimal) else value
+        for key, value in keys.items()
+    }
+    encoded = bson.BSON.encode(converted, codec_options=_CURSOR_CODEC_OPTIONS)
+    return base64.urlsafe_b64encode(encoded).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """
+    Decodes a cursor made by :func:`encode_cursor` back to its keys.
+
+    :raises ValueError: If ``cursor`` is not a valid cursor.
+    """
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        encoded = base64.urlsafe_b64decode(padded)
+        keys = bson.BSON(encoded).decode(codec_options=_CURSOR_CODEC_OPTIONS)
+    except (ValueError, bson.InvalidBSON):
+        raise ValueError(f"invalid paging cursor: {cursor}")
+
+    return {
+        key: value.to_decimal() if isinstance(value, bson.Decimal128) else value
+        for key, value in keys.items()
+    }
+
+
+@_slotted()
+@dataclass
+class PagingCursorReq:
+    """Cursor (keyset) paging info for requests."""
+
+    cursor: Optional[str]
+    """
+    Cursor sent to params of request, marking the position to page from. ``None`` for
+    the first page.
+    """
+
+    limit: int
+    """Limit sent to params of request."""
+
+    def to_params(self, params: MutableMapping[str, str]) -> None:
+        """
+        Adds paging info to URL params for request.
+
+        :param params:
+        :return:
+
+        All values are converted to strings before being added. The cursor is skipped
+        if it is None.
+
+        All param names are prefixed with ``"paging-"``.
+        """
+        if self.cursor is not None:
+            params["paging-cursor"] = self.cursor
+        params["paging-limit"] = str(self.limit)
+
+    @classmethod
+    def from_params(
+        cls, params: Mapping[str, str], default_limit: Optional[int] = None
+    ) -> "PagingCursorReq":
+        """
+        Creates PagingCursorReq object from mapping of request url params.
+
+        :param params:
+        :param default_limit: limit to use if None is supplied
+        :return:
+
+        :raises KeyError: If limit is not supplied and no default is given.
+        """
+        try:
+            limit = int(params["paging-limit"])
+        except KeyError as error:
+            if default_limit is None:
+                raise error
+            else:
+                limit = default_limit
+
+        return cls(cursor=params.get("paging-cursor"), limit=limit)
+
+
+@_slotted()
+@dataclass
+class PagingCursorResp(PagingCursorReq):
+    """Cursor (keyset) paging info for responses."""
+
+    next_cursor: Optional[str]
+    """Cursor for the next page. ``None`` if this is the last page."""
+
+    previous_cursor: Optional[str]
+    """Cursor for the previous page. ``None`` if this is the first page."""
+
+    next: Optional[str]
+    """Next page url"""
+
+    previous: Optional[str]
+    """Previous page url."""
+
+    def to_headers(self, headers: MutableMapping[str, str]) -> None:
+        """
+        Adds paging info to request headers in-place.
+
+        :param headers:
+        :return:
+
+        All values are converted to strings before being added. Optional fields whose
+        values are None are skipped.
+
+        All header keys are prefixed with ``"paging-"`` and underscores are replaces
+        with hyphens.
+        """
+        for name, key in _PAGING_CURSOR_RESP_HEADER_KEYS:
+            value = getattr(self, name)
+
+            if value is None:
+                continue
+
+            headers[key] = str(value)
+
+    @classmethod
+    def from_headers(cls, headers: Mapping[str, str]) -> "PagingCursorResp":
+        """
+        Creates PagingCursorResp object from mapping of response headers.
+
+        :param headers:
+        :return:
+
+        Header names are matched case-insensitively.
+        """
+        headers = HeadersView.wrap(headers)
+        paging_data = cls(
+            cursor=headers.get("paging-cursor"),
+            limit=int(headers["paging-limit"]),
+            next_cursor=headers.get("paging-next-cursor"),
+            previous_cursor=headers.get("paging-previous-cursor"),
+            next=headers.get("paging-next"),
+            previous=headers.get("paging-previous"),
+        )
+
+        return paging_data
+
+
+def _header_keys(model: type, prefix: str) -> Tuple[Tuple[str, str], ...]:
+    """
+    Precomputes (attribute name, header key) pairs for the fields of ``model``.
+    Underscores in field names are replaced with hyphens.
+    """
+    return tuple(
+        (model_field.name, f"{prefix}{model_field.name.replace('_', '-')}")
+        for model_field in fields(model)
+    )
+
+
+_PAGING_RESP_HEADER_KEYS = _header_keys(PagingResp, "paging-")
+_PAGING_CURSOR_RESP_HEADER_KEYS = _header_keys(PagingCursorResp, "paging-")
@@ -0,0 +1,173 @@
+import functools
+from typing import Iterable, List, Optional, Tuple, Union
+
+from ._mimetype import MimeType
+from ._codecs import CodecRegistry, DEFAULT_CODECS
+from ._typing import MimeTypeTolerant
+
+
+_NEGOTIATE_CACHE_SIZE = 1024
+"""Number of distinct (Accept header, available mimetypes) results kept."""
+
+_AcceptRangesType = List[Tuple[str, float]]
+_AvailableType = Tuple[MimeTypeTolerant, ...]
+
+_MIMETYPE_VALUES = {MimeType._clean_text(m.value): m.value for m in MimeType}
+"""MimeType values by their spelling without ``x-`` prefixes."""
+
+_last_keys: Tuple[_AvailableType, Tuple[str, ...]] = ((), ())
+"""The last available tuple negotiated against, and its canonical keys."""
+
+
+def _canonical(mimetype: MimeTypeTolerant) -> str:
+    """
+    Lowercased ``type/subtype`` for ``mimetype``, without parameters or ``x-``
+    prefixes. Only exact spellings of a :class:`MimeType` value resolve to it, so
+    names without a subtype never match a mimetype.
+    """
+    if isinstance(mimetype, MimeType):
+        return mimetype.value
+
+    cleaned = MimeType._clean_text(str(mimetype)).strip()
+    return _MIMETYPE_VALUES.get(cleaned, cleaned)
+
+
+def _canonical_keys(available: _AvailableType) -> Tuple[str, ...]:
+    """
+    Canonical spellings of ``available``, which key the negotiation cache. Strings
+    hash faster than :class:`MimeType` members, and keys for the mimetypes last
+    negotiated against are reused. Servers usually pass the same mimetypes on every
+    request, and comparing tuples compares their members by identity first.
+    """
+    global _last_keys
+
+    last = _last_keys
+    if last[0] is available or last[0] == available:
+        return last[1]
+
+    keys = tuple(_canonical(mimetype) for mimetype in available)
+    _last_keys = (available, keys)
+    return keys
+
+
+def _parse_quality(params: List[str]) -> float:
+    """q-value from the parameters of a media range."""
+    quality = 1.0
+    for param in params:
+        name, _, value = param.partition("=")
+        if name.strip().lower() != "q":
+            continue
+        try:
+            quality = float(value.strip())
+        except ValueError:
+            # Malformed ranges are ignored rather than failing the request.
+            quality = 0.0
+
+    # q-values above 1 are malformed too. NaN fails the comparison as well.
+    if not 0.0 <= quality <= 1.0:
+        return 0.0
+    return quality
+
+
+def _parse_accept(accept_header: str) -> _AcceptRangesType:
+    """Parses an Accept header into (media range, q-value) pairs."""
+    ranges: _AcceptRangesType = list()
+
+    for part in accept_header.split(","):
+        media_range, *params = part.split(";")
+        media_range = media_range.strip().lower()
+        if not media_range:
+            continue
+
+        quality = _parse_quality(params)
+        if media_range == "*":
+            media_range = "*/*"
+        elif "/" not in media_range:
+            # Not a media range, so it matches nothing.
+            continue
+        elif not media_range.endswith("/*"):
+            media_range = _canonical(media_range)
+
+        ranges.append((media_range, quality))
+
+    return ranges
+
+
+def _quality(ranges: _AcceptRangesType, canonical: str) -> float:
+    """
+    q-value of the most specific media range matching ``canonical``, or ``0.0`` if no
+    range matches.
+    """
+    best_specificity = -1
+    quality = 0.0
+
+    for media_range, range_quality in ranges:
+        if media_range == canonical:
+            specificity = 2
+        elif media_range == "*/*":
+            specificity = 0
+        elif media_range.endswith("/*") and canonical.startswith(media_range[:-1]):
+            specificity = 1
+        else:
+            continue
+
+        if specificity > best_specificity:
+            best_specificity = specificity
+            quality = range_quality
+
+    return quality
+
+
+@functools.lru_cache(maxsize=_NEGOTIATE_CACHE_SIZE)
+def _negotiate_cached(accept_header: str, keys: Tuple[str, ...]) -> Optional[int]:
+    """Index of the acceptable key with the highest q-value, if any."""
+    ranges = _parse_accept(accept_header)
+
+    chosen: Optional[int] = None
+    chosen_quality = 0.0
+    for index, key in enumerate(keys):
+        quality = _quality(ranges, key)
+        if quality > chosen_quality:
+            chosen = index
+            chosen_quality = quality
+
+    return chosen
+
+
+def negotiate(
+    accept_header: Optional[str],
+    available: Union[Iterable[MimeTypeTolerant], CodecRegistry, None] = None,
+) -> MimeTypeTolerant:
+    """
+    Picks the mimetype to encode a response to from a request's ``Accept`` header.
+
+    :param accept_header: value of the ``Accept`` header.
+    :param available: mimetypes the response can be encoded to, in order of server
+        preference. Mappings offer their keys, and a :class:`CodecRegistry` the
+        mimetypes it has encoders for. Defaults to :data:`DEFAULT_CODECS`.
+    :return: the entry of ``available`` with the highest q-value, or ``None`` if none
+        are acceptable. If ``accept_header`` is empty or ``None``, the first entry.
+
+    Media ranges are matched by specificity (``type/subtype``, then ``type/*``, then
+    ``*/*``). Ranges match the exact ``type/subtype`` of a mimetype, ignoring case,
+    parameters and ``x-`` prefixes, so ``application/x-yaml`` matches ``MimeType.YAML``
+    but ``application`` or ``yaml`` match nothing. Ranges with a q-value outside
+    ``0`` to ``1`` are ignored. Ties are broken by the order of ``available``, so
+    servers can list cheaper codecs first.
+
+    Results are memoized per distinct Accept header and ``available`` mimetypes, so
+    repeat headers skip parsing entirely.
+    """
+    available_tuple: _AvailableType
+    if available is None:
+        available = DEFAULT_CODECS
+    if isinstance(available, CodecRegistry):
+        available_tuple = available.encoder_mimetypes()
+    else:
+        available_tuple = tuple(available)
+
+    if not accept_header:
+        return available_tuple[0] if available_tuple else None
+
+    index = _negotiate_cached(accept_header, _canonical_keys(available_tuple))
+    return None if index is None else available_tuple[index]
@@ -0,0 +1,89 @@
+import struct
+import sys
+from typing import Any, Optional, Tuple, Type
+
+from ._errors import ContentDecodeError
+
+
+NDARRAY_BSON_SUBTYPE = 0x80
+"""BSON binary subtype arrays are encoded with (the first user-defined subtype)."""
+
+NDARRAY_MSGPACK_CODE = 0x4E
+"""MessagePack extension type code arrays are encoded with."""
+
+NDARRAY_MAGIC = b"\x93SPNDA"
+"""Prefix of packed arrays, so payloads from other producers are not loaded."""
+
+NDARRAY_FORMAT_VERSION = 1
+
+_HEADER = struct.Struct(f"<{len(NDARRAY_MAGIC)}sBBB")
+
+
+def _numpy_types() -> Tuple[Type[Any], ...]:
+    """
+    ``(numpy.ndarray, numpy.generic)`` if numpy has already been imported, otherwise an
+    empty tuple, which ``isinstance`` never matches. spantools never imports numpy
+    itself just to check whether a value is an array.
+    """
+    numpy = sys.modules.get("numpy")
+    if numpy is None:
+        return ()
+    return numpy.ndarray, numpy.generic
+
+
+def ndarray_to_bytes(array: Any) -> bytes:
+    """
+    Packs a ``numpy.ndarray`` to bytes: a header with :data:`NDARRAY_MAGIC`, the format
+    version, and the array's dtype and shape, followed by its data in C order. This is
+    the payload of arrays in BSON and MessagePack bodies.
+
+    :raises ValueError: If the array holds python objects.
+    """
+    if array.dtype.hasobject:
+        raise ValueError("arrays of python objects cannot be packed to bytes")
+
+    dtype = array.dtype.str.encode()
+    header = _HEADER.pack(NDARRAY_MAGIC, NDARRAY_FORMAT_VERSION, len(dtype), array.ndim)
+    header += dtype
+    shape = struct.pack(f"<{array.ndim}Q", *array.shape)
+    return header + shape + array.tobytes()
+
+
+def ndarray_from_bytes(payload: bytes) -> Any:
+    """
+    Loads an array packed by :func:`ndarray_to_bytes`. The array is a read-only view of
+    ``payload`` made with ``numpy.frombuffer``, so its data is not copied.
+
+    :raises ContentDecodeError: If ``payload`` is not a packed array, or was packed with
+        an unknown format version.
+    """
+    import numpy
+
+    if not payload.startswith(NDARRAY_MAGIC):
+        raise ContentDecodeError("payload is not a packed numpy array")
+
+    try:
+        _, version, dtype_size, ndim = _HEADER.unpack_from(payload)
+        if version != NDARRAY_FORMAT_VERSION:
+            raise ContentDecodeError(f"unknown packed numpy array version {version}")
+        offset = _HEADER.size
+        dtype_end = offset + dtype_size
+        dtype = numpy.dtype(payload[offset:dtype_end].decode())
+        offset = dtype_end
+        shape = struct.unpack_from(f"<{ndim}Q", payload, offset)
+        offset += ndim * 8
+        return numpy.frombuffer(payload, dtype=dtype, offset=offset).reshape(shape)
+    except (struct.error, TypeError, ValueError, UnicodeDecodeError):
+        raise ContentDecodeError("payload is not a packed numpy array")
+
+
+def _load_ndarray(payload: bytes) -> Optional[Any]:
+    """
+    Loads a packed array for decode hooks, or returns ``None`` if numpy is not
+    installed or ``payload`` was packed by something else, so it is passed through
+    unchanged.
+    """
+    try:
+        return ndarray_from_bytes(payload)
+    except (ImportError, ContentDecodeError):
+        return None
@@ -0,0 +1,332 @@
+import asyncio
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Generic,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from ._models import PagingReq, PagingResp
+
+
+DataType = TypeVar("DataType")
+FetchResultType = Tuple[Mapping[str, str], Any]
+FetchType = Callable[[PagingReq, Optional[str]], FetchResultType]
+"""
+Fetches a page. Called with the paging info for the page and, when following
+``PagingResp.next``, the page url. Returns (response headers, page data).
+"""
+AsyncFetchType = Callable[[PagingReq, Optional[str]], Awaitable[FetchResultType]]
+"""Async equivalent of ``FetchType``."""
+_RequestType = Tuple[PagingReq, Optional[str]]
+
+
+@dataclass
+class Page(Generic[DataType]):
+    """A fetched page of results."""
+
+    data: DataType
+    """Page data returned by the fetch callable."""
+
+    paging: PagingResp
+    """Paging info parsed from the page's response headers."""
+
+
+def _end_offset(paging: PagingResp) -> Optional[int]:
+    """Offset one past the last item of the collection, if known."""
+    if paging.total_items is not None:
+        return paging.total_items
+    elif paging.total_pages is not None:
+        pages_left = paging.total_pages - paging.current_page
+        return paging.offset + paging.limit * (pages_left + 1)
+    else:
+        return None
+
+
+class _PagePlanner:
+    """
+    Decides which pages to request next as responses come in. Shared by the sync and
+    async iterators.
+    """
+
+    def __init__(
+        self,
+        first: PagingReq,
+        follow_next: bool,
+        prefetch: int,
+        max_pages: Optional[int],
+    ):
+        self.last: PagingReq = first
+        self.follow_next: bool = follow_next
+        self.depth: int = max(prefetch, 1)
+        self.max_pages: Optional[int] = max_pages
+        self.scheduled: int = 1
+
+    def _next_req(self) -> PagingReq:
+        return PagingReq(
+            offset=self.last.offset + self.last.limit, limit=self.last.limit
+        )
+
+    def plan(self, paging: PagingResp, in_flight: int) -> List[_RequestType]:
+        """
+        Returns the requests to send after receiving ``paging``, while ``in_flight``
+        requests are still pending.
+        """
+        requests: List[_RequestType] = list()
+        end = None if self.follow_next else _end_offset(paging)
+
+        while in_flight + len(requests) < self.depth:
+            if self.max_pages is not None and self.scheduled >= self.max_pages:
+                break
+
+            if end is not None:
+                # The collection size is known, so pages can be requested ahead of the
+                # responses that would link to them.
+                next_req = self._next_req()
+                if next_req.offset >= end:
+                    break
+                request: _RequestType = (next_req, None)
+            elif in_flight or requests or paging.next is None:
+                # Otherwise each page can only be requested once the previous one
+                # says there is a next page.
+                break
+            elif self.follow_next:
+                request = (self._next_req(), paging.next)
+            else:
+                request = (self._next_req(), None)
+
+            requests.append(request)
+            self.last = request[0]
+            self.scheduled += 1
+
+        return requests
+
+
+def iter_pages(
+    fetch: FetchType,
+    first: PagingReq,
+    follow_next: bool = True,
+    prefetch: int = 1,
+    max_pages: Optional[int] = None,
+) -> Iterator[Page]:
+    """
+    Iterates over every page of a paged endpoint, fetching upcoming pages on background
+    threads while the current one is processed.
+
+    :param fetch: fetches a single page. See ``FetchType``.
+    :param first: paging info of the first page to fetch.
+    :param follow_next: If ``True``, pages are fetched from the ``PagingResp.next`` url
+        of the previous page and iteration stops when it is ``None``. If ``False``,
+        ``PagingReq.offset`` is advanced by the page limit until ``total_items`` /
+        ``total_pages`` is reached, or ``next`` is ``None`` if they are unknown.
+    :param prefetch: max number of pages fetched ahead of the page being processed.
+        Following ``next`` urls only ever allows one page ahead. ``0`` fetches each page
+        on the calling thread when it is needed.
+    :param max_pages: stop after this many pages.
+
+    Breaking out of the loop cancels pages which have not started fetching yet.
+    """
+    planner = _PagePlanner(first, follow_next, prefetch, max_pages)
+
+    if prefetch < 1:
+        request: Optional[_RequestType] = (first, None)
+        while request is not None:
+            headers, data = fetch(*request)
+            paging = PagingResp.from_headers(headers)
+            requests = planner.plan(paging, in_flight=0)
+            request = requests[0] if requests else None
+            yield Page(data=data, paging=paging)
+        return
+
+    executor = ThreadPoolExecutor(max_workers=prefetch)
+    pending: Deque[Future] = deque([executor.submit(fetch, first, None)])
+
+    try:
+        while pending:
+            headers, data = pending.popleft().result()
+            paging = PagingResp.from_headers(headers)
+
+            for next_request in planner.plan(paging, in_flight=len(pending)):
+                pending.append(executor.submit(fetch, *next_request))
+
+            yield Page(data=data, paging=paging)
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+async def aiter_pages(
+    fetch: AsyncFetchType,
+    first: PagingReq,
+    follow_next: bool = True,
+    prefetch: int = 1,
+    max_pages: Optional[int] = None,
+) -> AsyncIterator[Page]:
+    """
+    Async version of :func:`iter_pages`. Upcoming pages are fetched as tasks on the
+    running event loop while the current one is processed.
+
+    :param fetch: coroutine function fetching a single page. See ``AsyncFetchType``.
+    :param first: paging info of the first page to fetch.
+    :param follow_next: See :func:`iter_pages`.
+    :param prefetch: See :func:`iter_pages`.
+    :param max_pages: stop after this many pages.
+
+    Breaking out of the loop cancels pages still being fetched.
+    """
+    planner = _PagePlanner(first, follow_next, prefetch, max_pages)
+    pending: Deque[asyncio.Future] = deque([asyncio.ensure_future(fetch(first, None))])
+
+    try:
+        while pending:
+            headers, data = await pending.popleft()
+            paging = PagingResp.from_headers(headers)
+            page = Page(data=data, paging=paging)
+
+            if prefetch < 1:
+                # Without prefetching, the next page is only requested once this one
+                # has been processed.
+                yield page
+
+            for next_request in planner.plan(paging, in_flight=len(pending)):
+                pending.append(asyncio.ensure_future(fetch(*next_request)))
+
+            if prefetch >= 1:
+                yield page
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def page_requests(paging: PagingResp) -> List[PagingReq]:
+    """
+    Returns paging info for every page after the one described by ``paging``.
+
+    :raises ValueError: If neither ``total_items`` nor ``total_pages`` is known.
+    """
+    end = _end_offset(paging)
+    if end is None:
+        raise ValueError("total_items or total_pages required to list pages")
+
+    start = paging.offset + paging.limit
+    return [
+        PagingReq(offset=offset, limit=paging.limit)
+        for offset in range(start, end, paging.limit)
+    ]
+
+
+def fan_out_pages(
+    fetch: FetchType, first: PagingReq, concurrency: int = 8, ordered: bool = True
+) -> Iterator[Page]:
+    """
+    Fetches the first page, then fetches every remaining page of the collection in
+    parallel on up to ``concurrency`` threads.
+
+    :param fetch: fetches a single page. See ``FetchType``. The url passed is always
+        ``None``.
+    :param first: paging info of the first page to fetch.
+    :param concurrency: max number of pages fetched at once.
+    :param ordered: If ``True``, pages are yielded in collection order. If ``False``,
+        pages are yielded as they finish fetching.
+
+    At most ``concurrency`` fetched pages are held waiting to be consumed. Breaking out
+    of the loop cancels pages which have not started fetching yet.
+
+    :raises ValueError: If the first page's response has neither ``total_items`` nor
+        ``total_pages``.
+    """
+    headers, data = fetch(first, None)
+    paging = PagingResp.from_headers(headers)
+    requests = iter(page_requests(paging))
+
+    yield Page(data=data, paging=paging)
+
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    pending: Deque[Future] = deque()
+
+    def submit_next() -> None:
+        for request in requests:
+            pending.append(executor.submit(fetch, request, None))
+            return
+
+    try:
+        for _ in range(concurrency):
+            submit_next()
+
+        while pending:
+            if ordered:
+                future = pending.popleft()
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                future = done.pop()
+                pending.remove(future)
+
+            headers, data = future.result()
+            submit_next()
+            yield Page(data=data, paging=PagingResp.from_headers(headers))
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+async def afan_out_pages(
+    fetch: AsyncFetchType, first: PagingReq, concurrency: int = 8, ordered: bool = True,
+) -> AsyncIterator[Page]:
+    """
+    Async version of :func:`fan_out_pages`. Remaining pages are fetched as up to
+    ``concurrency`` tasks on the running event loop.
+
+    :param fetch: coroutine function fetching a single page. See ``AsyncFetchType``.
+    :param first: paging info of the first page to fetch.
+    :param concurrency: max number of pages fetched at once.
+    :param ordered: See :func:`fan_out_pages`.
+
+    :raises ValueError: If the first page's response has neither ``total_items`` nor
+        ``total_pages``.
+    """
+    headers, data = await fetch(first, None)
+    paging = PagingResp.from_headers(headers)
+    requests = iter(page_requests(paging))
+
+    yield Page(data=data, paging=paging)
+
+    pending: Deque[asyncio.Future] = deque()
+
+    def submit_next() -> None:
+        for request in requests:
+            pending.append(asyncio.ensure_future(fetch(request, None)))
+            return
+
+    try:
+        for _ in range(concurrency):
+            submit_next()
+
+        while pending:
+            if ordered:
+                future = pending.popleft()
+            else:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                future = done.pop()
+                pending.remove(future)
+
+            headers, data = await future
+            submit_next()
+            yield Page(data=data, paging=PagingResp.from_headers(headers))
+    finally:
+        for future in pending:
+            future.cancel()
@@ -0,0 +1,314 @@
+import google.protobuf.message
+from typing import BinaryIO, Dict, Generic, Iterable, Iterator, List, Optional, Tuple
+from typing import Type, TypeVar, Union
+
+from ._errors import ContentDecodeError, ContentEncodeError
+from ._mimetype import MimeType, MimeTypeTolerant
+
+
+MessageType = TypeVar("MessageType", bound=google.protobuf.message.Message)
+BufferType = Union[bytes, bytearray, memoryview]
+STREAM_CHUNK_SIZE = 64 * 1024
+VARINT_MAX_BYTES = 10
+"""Most bytes a varint may span, enough for any 64-bit value."""
+
+
+def _is_proto_stream(mimetype: MimeTypeTolerant) -> bool:
+    """
+    Whether ``mimetype`` names ``MimeType.PROTO_STREAM`` exactly. ``is_mimetype`` would
+    also match ``"application/protobuf"``, which is a prefix of the stream mimetype.
+    """
+    try:
+        return MimeType.from_name(mimetype) is MimeType.PROTO_STREAM
+    except ValueError:
+        return False
+
+
+def encode_varint(value: int) -> bytes:
+    """
+    Encodes a non-negative int as a base 128 varint, the same framing protobuf uses for
+    length-delimited fields.
+    """
+    if value < 0 or value >> 64:
+        raise ValueError("varint value must be a non-negative 64-bit int")
+
+    encoded = bytearray()
+    while value > 0x7F:
+        encoded.append((value & 0x7F) | 0x80)
+        value >>= 7
+    encoded.append(value)
+
+    return bytes(encoded)
+
+
+class _TruncatedVarintError(ContentDecodeError):
+    """The buffer ended before the varint did, so more bytes may complete it."""
+
+
+def decode_varint(buffer: BufferType, position: int = 0) -> Tuple[int, int]:
+    """
+    Decodes a base 128 varint from ``buffer`` starting at ``position``.
+
+    :return: (decoded value, position of first byte after the varint) tuple.
+
+    :raises ContentDecodeError: If the buffer ends in the middle of a varint, or the
+        varint is longer than ``VARINT_MAX_BYTES``.
+    """
+    result = 0
+    shift = 0
+    end = len(buffer)
+    limit = position + VARINT_MAX_BYTES
+
+    while True:
+        if position >= limit:
+            raise ContentDecodeError(
+                f"varint longer than {VARINT_MAX_BYTES} bytes in delimited stream"
+            )
+        if position >= end:
+            raise _TruncatedVarintError("truncated varint in length-delimited stream")
+        byte = buffer[position]
+        position += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, position
+        shift += 7
+
+
+def _frame_bounds(buffer: BufferType, position: int) -> Optional[Tuple[int, int]]:
+    """
+    Returns the (start, stop) bounds of the message framed at ``position``, or ``None``
+    if ``buffer`` does not yet hold the full frame.
+    """
+    try:
+        size, start = decode_varint(buffer, position)
+    except _TruncatedVarintError:
+        return None
+
+    stop = start + size
+    if stop > len(buffer):
+        return None
+
+    return start, stop
+
+
+class ProtoCodec(Generic[MessageType]):
+    """
+    Encoder / decoder for a single protobuf message class. Codecs should be fetched
+    through :func:`ProtoCodec.for_message`, which caches one codec per message class.
+    """
+
+    _CACHE: Dict[type, "ProtoCodec"] = dict()
+
+    def __init__(self, message_class: Type[MessageType], pool_size: int = 16):
+        """
+        :param message_class: protobuf message class to encode / decode.
+        :param pool_size: max number of released message instances kept for reuse.
+        """
+        self.message_class: Type[MessageType] = message_class
+        self.pool_size: int = pool_size
+        self._pool: List[MessageType] = list()
+
+    @classmethod
+    def for_message(cls, message_class: Type[MessageType]) -> "ProtoCodec[MessageType]":
+        """
+        Returns the cached codec for ``message_class``, creating it on first use.
+        """
+        try:
+            return cls._CACHE[message_class]
+        except KeyError:
+            codec: ProtoCodec[MessageType] = cls(message_class)
+            cls._CACHE[message_class] = codec
+            return codec
+
+    def acquire(self) -> MessageType:
+        """
+        Returns a cleared message instance, reusing a released one if available.
+        """
+        try:
+            return self._pool.pop()
+        except IndexError:
+            return self.message_class()
+
+    def release(self, message: MessageType) -> None:
+        """
+        Clears ``message`` and returns it to the pool for reuse by :func:`acquire`.
+        Messages must not be used after they are released.
+        """
+        if len(self._pool) >= self.pool_size:
+            return
+        message.Clear()
+        self._pool.append(message)
+
+    def encode(self, message: MessageType) -> bytes:
+        """
+        Serializes a single message.
+
+        :raises ContentEncodeError: If ``message`` is not of this codec's class.
+        """
+        if not isinstance(message, self.message_class):
+            raise ContentEncodeError(
+                f"proto type expected: {self.message_class}, got: {type(message)}"
+            )
+
+        return message.SerializeToString()
+
+    def decode(
+        self, content: BufferType, message: Optional[MessageType] = None
+    ) -> MessageType:
+        """
+        Loads a single message from ``content``.
+
+        :param content: serialized message.
+        :param message: instance to merge ``content`` into. A new instance is created if
+            not supplied. Fields already set on ``message`` are merged with, not
+            replaced by, the loaded ones; use :func:`acquire` for a cleared instance.
+
+        :raises ContentDecodeError: If ``content`` cannot be parsed.
+        """
+        if message is None:
+            message = self.message_class()
+
+        try:
+            message.MergeFromString(content)
+        except google.protobuf.message.DecodeError:
+            raise ContentDecodeError(
+                f"Error occurred while decoding {self.message_class.__name__}"
+            )
+
+        return message
+
+    def iter_encode_delimited(self, messages: Iterable[MessageType]) -> Iterator[bytes]:
+        """
+        Yields each message serialized and prefixed with its varint-encoded length.
+        """
+        for message in messages:
+            encoded = self.encode(message)
+            yield encode_varint(len(encoded))
+            yield encoded
+
+    def encode_delimited(self, messages: Iterable[MessageType]) -> bytes:
+        """
+        Serializes ``messages`` to a single varint length-delimited stream.
+        """
+        return b"".join(self.iter_encode_delimited(messages))
+
+    def iter_decode_delimited(
+        self, content: BufferType, reuse: bool = False
+    ) -> Iterator[MessageType]:
+        """
+        Yields messages from a varint length-delimited stream without copying
+        ``content``.
+
+        :param content: length-delimited stream.
+        :param reuse: If ``True``, the same message instance is cleared and yielded for
+            every record. Consumers must be done with each record before advancing.
+
+        :raises ContentDecodeError: If the stream is truncated or a message cannot be
+            parsed.
+        """
+        view = memoryview(content)
+        position = 0
+        end = len(view)
+        message: Optional[MessageType] = None
+
+        while position < end:
+            size, position = decode_varint(view, position)
+            stop = position + size
+            if stop > end:
+                raise ContentDecodeError("truncated message in length-delimited stream")
+
+            if reuse and message is not None:
+                message.Clear()
+            else:
+                message = self.message_class()
+
+            yield self.decode(view[position:stop], message)
+            position = stop
+
+    def iter_decode_stream(
+        self,
+        stream: BinaryIO,
+        reuse: bool = False,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> Iterator[MessageType]:
+        """
+        Yields messages from a file-like object holding a varint length-delimited
+        stream. At most one chunk plus one message is held in memory at a time.
+
+        :param stream: binary file-like object with a ``read()`` method.
+        :param reuse: See :func:`iter_decode_delimited`.
+        :param chunk_size: Number of bytes to read from ``stream`` at a time.
+
+        :raises ContentDecodeError: If the stream is truncated or a message cannot be
+            parsed.
+        """
+        buffer = bytearray()
+        position = 0
+        message: Optional[MessageType] = None
+
+        while True:
+            bounds = _frame_bounds(buffer, position)
+
+            if bounds is None:
+                chunk = stream.read(chunk_size)
+                if not chunk:
+                    if position < len(buffer):
+                        raise ContentDecodeError(
+                            "truncated message in length-delimited stream"
+                        )
+                    return
+
+                del buffer[:position]
+                position = 0
+                buffer += chunk
+                continue
+
+            if reuse and message is not None:
+                message.Clear()
+            else:
+                message = self.message_class()
+
+            start, position = bounds
+            yield self.decode(buffer[start:position], message)
+
+    def decode_delimited(self, content: BufferType) -> List[MessageType]:
+        """
+        Loads all messages from a varint length-delimited stream.
+        """
+        return list(self.iter_decode_delimited(content))
+
+
+def iter_proto_frames(
+    messages: Iterable[google.protobuf.message.Message],
+) -> Iterator[bytes]:
+    """
+    Yields varint length prefixes and serialized bodies for ``messages``, which can be
+    written out as they are generated to build a length-delimited stream.
+    """
+    for message in messages:
+        encoded = message.SerializeToString()
+        yield encode_varint(len(encoded))
+        yield encoded
+
+
+def iter_proto_messages(
+    stream: Union[BufferType, BinaryIO],
+    message_class: Type[MessageType],
+    reuse: bool = False,
+) -> Iterator[MessageType]:
+    """
+    Lazily loads messages of ``message_class`` from a varint length-delimited stream.
+
+    :param stream: Stream content, or a binary file-like object to read it from.
+    :param message_class: protobuf message class of every record in the stream.
+    :param reuse: If ``True``, the same message instance is cleared and yielded for
+        every record. Consumers must be done with each record before advancing.
+
+    :raises ContentDecodeError: If the stream is truncated or a message cannot be
+        parsed.
+    """
+    codec = ProtoCodec.for_message(message_class)
+    if isinstance(stream, (bytes, bytearray, memoryview)):
+        return codec.iter_decode_delimited(stream, reuse=reuse)
+    else:
+        return codec.iter_decode_stream(stream, reuse=reuse)
@@ -0,0 +1,204 @@
+import weakref
+import marshmallow
+from marshmallow.decorators import (
+    PRE_DUMP,
+    POST_DUMP,
+    PRE_LOAD,
+    VALIDATES,
+    VALIDATES_SCHEMA,
+)
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+from ._typing import RecordType
+
+
+# Fields whose serialized output always deserializes cleanly. When one of these has no
+# validators, re-loading its dumped value during validation can be skipped.
+_STABLE_FIELDS = (
+    marshmallow.fields.String,
+    marshmallow.fields.Integer,
+    marshmallow.fields.Boolean,
+    marshmallow.fields.UUID,
+)
+
+_DumpPlanType = Tuple[Tuple[str, str, marshmallow.fields.Field, bool], ...]
+
+
+def _has_hooks(schema: marshmallow.Schema, tag: str) -> bool:
+    """
+    Whether ``schema`` has any processors / validators registered for ``tag``. Reads
+    marshmallow 3's private ``_hooks`` registry. If it is missing, hooks are assumed, so
+    the schema falls back to ``schema.dump`` / ``schema.validate``.
+    """
+    hooks = getattr(schema, "_hooks", None)
+    if hooks is None:
+        return True
+
+    for key, attr_names in hooks.items():
+        if not attr_names:
+            continue
+        if key == tag or (isinstance(key, tuple) and key[0] == tag):
+            return True
+    return False
+
+
+def _field_is_stable(field_obj: marshmallow.fields.Field) -> bool:
+    validators: List[Callable] = getattr(field_obj, "validators", [])
+    if validators:
+        return False
+    elif type(field_obj) in _STABLE_FIELDS:
+        return True
+    elif type(field_obj) is marshmallow.fields.DateTime:
+        return getattr(field_obj, "format", None) in (None, "iso")
+    else:
+        return False
+
+
+class CompiledSchema:
+    """
+    Precomputed dump / validation plan for a marshmallow schema. Fetch through
+    :func:`compile_schema`, which caches one plan per schema instance.
+
+    Dumping with validation is done in a single pass: each field is checked as it is
+    serialized, and fields whose dumped values are known to be loadable are not
+    re-loaded. Schemas using dump / pre-load hooks, ``@validates`` methods, schema-level
+    validators, partial loading or asymmetric load / dump fields fall back to
+    ``schema.dump`` followed by ``schema.validate``.
+    """
+
+    def __init__(self, schema: marshmallow.Schema):
+        self.schema: marshmallow.Schema = schema
+        self.many: bool = bool(schema.many)
+
+        self._dict_class: Callable[[], Dict[str, Any]] = schema.dict_class
+        self._accessor: Callable = schema.get_attribute
+
+        dump_keys = {
+            f.data_key if f.data_key is not None else name
+            for name, f in schema.dump_fields.items()
+        }
+        load_keys = {
+            f.data_key if f.data_key is not None else name
+            for name, f in schema.load_fields.items()
+        }
+
+        self.fast_dump: bool = not (
+            _has_hooks(schema, PRE_DUMP) or _has_hooks(schema, POST_DUMP)
+        )
+        self.fast_validate: bool = (
+            self.fast_dump
+            and dump_keys == load_keys
+            and not schema.partial
+            and not _has_hooks(schema, PRE_LOAD)
+            and not _has_hooks(schema, VALIDATES)
+            and not _has_hooks(schema, VALIDATES_SCHEMA)
+        )
+
+        self._plan: _DumpPlanType = tuple(
+            (
+                attr_name,
+                field_obj.data_key if field_obj.data_key is not None else attr_name,
+                field_obj,
+                _field_is_stable(field_obj),
+            )
+            for attr_name, field_obj in schema.dump_fields.items()
+        )
+
+    def _dump_one(self, obj: Any) -> RecordType:
+        dumped = self._dict_class()
+        accessor = self._accessor
+        for attr_name, key, field_obj, _ in self._plan:
+            value = field_obj.serialize(attr_name, obj, accessor=accessor)
+            if value is marshmallow.missing:
+                continue
+            dumped[key] = value
+        return dumped
+
+    def _dump_validated_one(
+        self, obj: Any, errors: Dict[str, Union[List[str], Dict]]
+    ) -> RecordType:
+        dumped = self._dict_class()
+        accessor = self._accessor
+        to_check = list()
+        for attr_name, key, field_obj, stable in self._plan:
+            value = field_obj.serialize(attr_name, obj, accessor=accessor)
+            if value is not marshmallow.missing:
+                dumped[key] = value
+            # Missing and null values go through the field so required / allow_none
+            # errors match the ones ``schema.validate`` would report.
+            if not stable or value is None or value is marshmallow.missing:
+                to_check.append((key, field_obj, value))
+
+        for key, field_obj, value in to_check:
+            try:
+                field_obj.deserialize(value, key, dumped)
+            except marshmallow.ValidationError as error:
+                errors[key] = error.messages
+        return dumped
+
+    def dump(self, obj: Any) -> Union[RecordType, List[RecordType]]:
+        """
+        Dumps ``obj`` the way ``schema.dump(obj)`` would.
+        """
+        if not self.fast_dump:
+            return self.schema.dump(obj)
+        elif self.many:
+            return [self._dump_one(record) for record in obj]
+        else:
+            return self._dump_one(obj)
+
+    def dump_validated(self, obj: Any) -> Union[RecordType, List[RecordType]]:
+        """
+        Dumps ``obj`` and validates the result against the schema.
+
+        :raises marshmallow.ValidationError: If the dumped data does not validate.
+            Error messages are in the same format as ``schema.validate``.
+        """
+        if not self.fast_validate:
+            dumped = self.schema.dump(obj)
+            errors_full = self.schema.validate(dumped)
+            if errors_full:
+                raise marshmallow.ValidationError(message=errors_full)
+            return dumped
+
+        if not self.many:
+            errors: Dict[str, Any] = dict()
+            dumped_one = self._dump_validated_one(obj, errors)
+            if errors:
+                raise marshmallow.ValidationError(message=errors)
+            return dumped_one
+
+        index_errors = self.schema.opts.index_errors
+        errors_many: Dict[Any, Any] = dict()
+        dumped_many = list()
+        for index, record in enumerate(obj):
+            record_errors: Dict[str, Any] = dict()
+            dumped_many.append(self._dump_validated_one(record, record_errors))
+            if not record_errors:
+                continue
+            if index_errors:
+                errors_many[index] = record_errors
+            else:
+                errors_many.update(record_errors)
+
+        if errors_many:
+            raise marshmallow.ValidationError(message=errors_many)
+        return dumped_many
+
+
+_COMPILED: "weakref.WeakKeyDictionary[marshmallow.Schema, CompiledSchema]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def compile_schema(schema: marshmallow.Schema) -> CompiledSchema:
+    """
+    Returns the cached :class:`CompiledSchema` for ``schema``, compiling it on first
+    use.
+    """
+    try:
+        return _COMPILED[schema]
+    except KeyError:
+        compiled = CompiledSchema(schema)
+        _COMPILED[schema] = compiled
+        return compiled
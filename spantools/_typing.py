@@ -1,12 +1,13 @@
-import marshmallow
-import google.protobuf.message
-from typing import Mapping, Any, Union, Type
+from typing import TYPE_CHECKING, Mapping, Any, Union, Type
+
+# Only imported for type checkers, so importing the typing aliases does not load
+# marshmallow or protobuf.
+if TYPE_CHECKING:  # pragma: no cover
+    import marshmallow  # noqa: F401
+    import google.protobuf.message  # noqa: F401
+    from ._mimetype import MimeType  # noqa: F401
 
 
 RecordType = Mapping[str, Any]
 MimeTypeTolerant = Union["MimeType", str, None]
-DataSchemaType = Union[marshmallow.Schema, Type[google.protobuf.message.Message]]
-
-typing_help = False
-if typing_help:
-    from ._mimetype import MimeType  # noqa: F401
+DataSchemaType = Union["marshmallow.Schema", Type["google.protobuf.message.Message"]]
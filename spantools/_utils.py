@@ -1,22 +1,128 @@
-from typing import Optional, MutableMapping, Any
+import datetime
+import enum
+import uuid
+from typing import Any, Callable, Dict, List, MutableMapping, Optional, Union
 
 
-def convert_params_headers(incoming: Optional[MutableMapping[str, Any]]) -> None:
+ParamValueType = Union[str, List[str]]
+_FormatterType = Callable[[Any], ParamValueType]
+
+
+def _format_bool(value: bool) -> str:
+    return "true" if value else "false"
+
+
+def _format_isoformat(value: Union[datetime.datetime, datetime.date]) -> str:
+    return value.isoformat()
+
+
+def _format_enum(value: enum.Enum) -> ParamValueType:
+    return format_param_value(value.value)
+
+
+def _format_many(value: Any) -> List[str]:
+    formatted = list()
+    for item in value:
+        item_formatted = format_param_value(item)
+        if isinstance(item_formatted, list):
+            formatted.extend(item_formatted)
+        else:
+            formatted.append(item_formatted)
+    return formatted
+
+
+_FORMATTERS: Dict[type, _FormatterType] = {
+    str: str,
+    bool: _format_bool,
+    int: str,
+    float: str,
+    uuid.UUID: str,
+    datetime.datetime: _format_isoformat,
+    datetime.date: _format_isoformat,
+    datetime.time: _format_isoformat,
+    enum.Enum: _format_enum,
+    list: _format_many,
+    tuple: _format_many,
+    set: _format_many,
+    frozenset: _format_many,
+}
+"""
+Value formatters by type. Types without an entry use the formatter of their closest base
+class in the table, falling back to ``str()``.
+"""
+
+_FORMATTER_CACHE: Dict[type, _FormatterType] = dict()
+"""Formatters resolved for exact value types."""
+
+
+def _resolve_formatter(value_type: type) -> _FormatterType:
+    formatter: _FormatterType = str
+    if issubclass(value_type, enum.Enum):
+        # Enums with a mixed-in type, like ``class Color(str, Enum)``, have the mixed-in
+        # type before Enum in their MRO.
+        formatter = _format_enum
+    else:
+        for base in value_type.__mro__:
+            try:
+                formatter = _FORMATTERS[base]
+                break
+            except KeyError:
+                continue
+
+    _FORMATTER_CACHE[value_type] = formatter
+    return formatter
+
+
+def format_param_value(value: Any) -> ParamValueType:
+    """
+    Formats a single header / param value. See :func:`convert_params_headers`.
+    """
+    try:
+        formatter = _FORMATTER_CACHE[type(value)]
+    except KeyError:
+        formatter = _resolve_formatter(type(value))
+    return formatter(value)
+
+
+def convert_params_headers(
+    incoming: Optional[MutableMapping[str, Any]], copy: bool = False
+) -> Optional[MutableMapping[str, ParamValueType]]:
     """
     Converts a str, Any mapping to a str, str mapping.
 
     :param incoming:
-    :return:
+    :param copy: If ``True``, converted values are returned in a new dict and
+        ``incoming`` is left untouched.
+    :return: the converted mapping: ``incoming`` itself unless ``copy`` is ``True``.
 
     Useful for converting header and
     param dicts for requests before send, as many libraries require all values be
     strings.
 
-    Dicts are converted in place through running str() on their values. This means that
-    any non-string values should give proper values via str().
+    By default, dicts are converted in place. Values are formatted by type:
+
+        - ``bool``: ``"true"`` / ``"false"``.
+        - ``datetime``, ``date``, ``time``: ``isoformat()``.
+        - ``Enum``: its value, formatted by these same rules.
+        - ``list``, ``tuple``, ``set``, ``frozenset``: list of formatted items, for
+          multi-valued params.
+        - Anything else: ``str()``.
     """
-    if not incoming:
-        return
+    if incoming is None:
+        return None
+
+    converted: MutableMapping[str, Any] = dict(incoming) if copy else incoming
+    cache = _FORMATTER_CACHE
+
+    for key, value in converted.items():
+        value_type = type(value)
+        if value_type is str:
+            continue
+
+        try:
+            formatter = cache[value_type]
+        except KeyError:
+            formatter = _resolve_formatter(value_type)
+        converted[key] = formatter(value)
 
-    for key, value in incoming.items():
-        incoming[key] = str(value)
+    return converted
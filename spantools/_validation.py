@@ -0,0 +1,173 @@
+import random
+import threading
+import weakref
+import marshmallow
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+
+ValidationListenerType = Callable[[marshmallow.Schema, bool, bool], None]
+"""Called with (schema, validated, failed) for every body a policy decides on."""
+
+
+@dataclass
+class ValidationStats:
+    """Counters of validation decisions made by a :class:`ValidationPolicy`."""
+
+    validated: int = 0
+    """Number of bodies validated."""
+
+    skipped: int = 0
+    """Number of bodies encoded without validation."""
+
+    failures: int = 0
+    """Number of validated bodies which failed validation."""
+
+
+class ValidationPolicy:
+    """
+    Decides which bodies passed to :func:`encode_content` with a ``data_schema`` are
+    validated. The base policy validates every body.
+
+    Policies count their decisions in :attr:`stats`, and report each one to listeners
+    registered through :func:`add_listener`. A single policy may be shared by any number
+    of threads and schemas.
+    """
+
+    uses_size: bool = False
+    """
+    Whether :func:`should_validate` needs the size of the encoded body. If ``True``, the
+    body is encoded before validation is decided on, and validation becomes a second
+    pass over the dumped data.
+    """
+
+    def __init__(self) -> None:
+        self.stats: ValidationStats = ValidationStats()
+        self._listeners: List[ValidationListenerType] = list()
+        self._lock: threading.Lock = threading.Lock()
+
+    def should_validate(
+        self, data_schema: marshmallow.Schema, size: Optional[int]
+    ) -> bool:
+        """
+        Whether the body being encoded with ``data_schema`` should be validated.
+
+        :param data_schema: schema the body is being dumped through.
+        :param size: size of the encoded body in bytes. Only passed if
+            :attr:`uses_size` is ``True``, otherwise ``None``.
+        """
+        return True
+
+    def may_validate(self) -> bool:
+        """
+        Whether this policy can validate any body at all. Bodies with an unknown
+        mimetype cannot be validated, so :func:`encode_content` rejects them only if
+        this is ``True``, and otherwise passes them through.
+        """
+        return True
+
+    def add_listener(self, listener: ValidationListenerType) -> None:
+        """
+        Registers a callback which is passed (schema, validated, failed) for every body
+        this policy decides on.
+        """
+        self._listeners.append(listener)
+
+    def record(
+        self, data_schema: marshmallow.Schema, validated: bool, failed: bool
+    ) -> None:
+        """Counts a validation decision and reports it to listeners."""
+        with self._lock:
+            if not validated:
+                self.stats.skipped += 1
+            else:
+                self.stats.validated += 1
+                if failed:
+                    self.stats.failures += 1
+
+        for listener in self._listeners:
+            listener(data_schema, validated, failed)
+
+
+class ValidateNever(ValidationPolicy):
+    """Never validates bodies, but still counts them as skipped."""
+
+    def should_validate(
+        self, data_schema: marshmallow.Schema, size: Optional[int]
+    ) -> bool:
+        return False
+
+    def may_validate(self) -> bool:
+        return False
+
+
+class ValidateSample(ValidationPolicy):
+    """Validates a random sample of bodies."""
+
+    def __init__(
+        self, rate: float, random_func: Callable[[], float] = random.random
+    ) -> None:
+        """
+        :param rate: fraction of bodies to validate, from ``0.0`` to ``1.0``.
+        :param random_func: source of random floats in ``[0.0, 1.0)``.
+        """
+        if not 0.0 <= rate <= 1.0:
+            raise ValueError("sample rate must be between 0.0 and 1.0")
+
+        super().__init__()
+        self.rate: float = rate
+        self._random: Callable[[], float] = random_func
+
+    def should_validate(
+        self, data_schema: marshmallow.Schema, size: Optional[int]
+    ) -> bool:
+        return self._random() < self.rate
+
+    def may_validate(self) -> bool:
+        return self.rate > 0.0
+
+
+class ValidateFirstN(ValidationPolicy):
+    """Validates the first ``n`` bodies encoded with each schema instance."""
+
+    def __init__(self, n: int) -> None:
+        super().__init__()
+        self.n: int = n
+        self._counts: "weakref.WeakKeyDictionary[marshmallow.Schema, int]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def should_validate(
+        self, data_schema: marshmallow.Schema, size: Optional[int]
+    ) -> bool:
+        # Counts only grow, so once a schema is done it is skipped without the lock.
+        if self._counts.get(data_schema, 0) >= self.n:
+            return False
+
+        with self._lock:
+            count = self._counts.get(data_schema, 0)
+            if count >= self.n:
+                return False
+            self._counts[data_schema] = count + 1
+            return True
+
+    def may_validate(self) -> bool:
+        return self.n > 0
+
+
+class ValidateUnderSize(ValidationPolicy):
+    """Validates only bodies whose encoded size is at most ``max_size`` bytes."""
+
+    uses_size = True
+
+    def __init__(self, max_size: int) -> None:
+        super().__init__()
+        self.max_size: int = max_size
+
+    def should_validate(
+        self, data_schema: marshmallow.Schema, size: Optional[int]
+    ) -> bool:
+        return size is not None and size <= self.max_size
+
+    def may_validate(self) -> bool:
+        return self.max_size >= 0
@@ -0,0 +1,52 @@
+from typing import Any, Iterable, List, Optional, Union, TYPE_CHECKING
+
+from ._compression import zstandard, _require
+from ._content_dump import encode_content, EncoderIndexType
+from ._codecs import CodecRegistry
+from ._typing import MimeTypeTolerant, DataSchemaType
+
+if TYPE_CHECKING:  # pragma: no cover
+    from zstandard import ZstdCompressionDict
+
+
+def train_zstd_dictionary(
+    samples: Iterable[Any],
+    dict_size: int = 16 * 1024,
+    mimetype: MimeTypeTolerant = None,
+    data_schema: Optional[DataSchemaType] = None,
+    encoders: Optional[Union[EncoderIndexType, CodecRegistry]] = None,
+) -> "ZstdCompressionDict":
+    """
+    Trains a zstd dictionary for :class:`ZstdCompressor` from sample bodies. Requires
+    the ``zstandard`` package.
+
+    :param samples: sample bodies. ``bytes`` samples are used as-is, any other sample
+        is encoded with :func:`encode_content` first.
+    :param dict_size: max size of the dictionary in bytes.
+    :param mimetype: mimetype to encode samples to.
+    :param data_schema: schema to dump samples through before encoding.
+    :param encoders: Custom registry or set of encoders to encode samples with.
+    :return: trained dictionary. Save it with ``as_bytes()`` and load it again with
+        ``zstandard.ZstdCompressionDict(data)``; its ID is kept.
+
+    :raises ValueError: If a dictionary cannot be trained, usually because there are
+        too few samples.
+
+    Samples should be bodies of a single schema, or a few closely related ones, and
+    there should be at least a few hundred of them.
+    """
+    zstd = _require(zstandard, "zstandard")
+
+    encoded: List[bytes] = [
+        sample
+        if isinstance(sample, bytes)
+        else encode_content(
+            sample, mimetype, data_schema=data_schema, encoders=encoders
+        )
+        for sample in samples
+    ]
+
+    try:
+        return zstd.train_dictionary(dict_size, encoded)
+    except zstd.ZstdError as error:
+        raise ValueError(f"could not train zstd dictionary: {error}")
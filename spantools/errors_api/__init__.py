@@ -8,6 +8,7 @@ from ._classes import (
     ERRORS_INDEXED,
     ERRORS_LIST,
 )
+from ._registry import ErrorRegistry
 
 
 (
@@ -19,4 +20,5 @@ from ._classes import (
     InvalidMethodError,
     ERRORS_INDEXED,
     ERRORS_LIST,
+    ErrorRegistry,
 )
@@ -0,0 +1,84 @@
+from typing import Dict, Iterable, Iterator, Mapping, Optional, Type
+
+from ._classes import APIError, ERRORS_INDEXED
+
+
+class ErrorRegistry(Mapping[int, Type[APIError]]):
+    """
+    Read-only mapping of APIError classes by api code, for resolving errors returned
+    in responses. The built-in errors in ``ERRORS_INDEXED`` are always registered.
+
+    Registries are flat, so resolving a code is a single dict lookup no matter how many
+    registries a registry was derived from.
+    """
+
+    def __init__(
+        self,
+        errors: Iterable[Type[APIError]] = (),
+        parent: Optional["ErrorRegistry"] = None,
+    ):
+        """
+        :param errors: APIError classes to register.
+        :param parent: registry to copy registered errors from. Errors registered with
+            ``parent`` after this registry is created are not picked up.
+
+        :raises ValueError: If two different classes are registered for the same code.
+        """
+        if parent is None:
+            self._index: Dict[int, Type[APIError]] = dict(ERRORS_INDEXED)
+        else:
+            self._index = dict(parent._index)
+
+        for error_class in errors:
+            self.register(error_class)
+
+    def register(self, error_class: Type[APIError]) -> Type[APIError]:
+        """
+        Registers ``error_class`` under its ``api_code``. Returns ``error_class``, so
+        this method can be used as a class decorator.
+
+        :raises ValueError: If a different class is already registered for the code.
+        """
+        code = error_class.api_code
+        registered = self._index.get(code)
+        if registered is not None and registered is not error_class:
+            raise ValueError(
+                f"api code {code} of {error_class.__name__} already registered by "
+                f"{registered.__name__}"
+            )
+
+        self._index[code] = error_class
+        return error_class
+
+    def register_subclasses(self, base: Type[APIError] = APIError) -> None:
+        """
+        Registers every currently imported subclass of ``base`` which declares its own
+        ``api_code``. Subclasses which inherit their code are skipped.
+
+        :raises ValueError: If two different classes declare the same code.
+        """
+        pending = list(base.__subclasses__())
+        while pending:
+            error_class = pending.pop()
+            pending.extend(error_class.__subclasses__())
+            if "api_code" in vars(error_class):
+                self.register(error_class)
+
+    def derive(self, errors: Iterable[Type[APIError]] = ()) -> "ErrorRegistry":
+        """
+        Returns a new registry holding this registry's errors plus ``errors``. This
+        registry is left unchanged.
+        """
+        return ErrorRegistry(errors, parent=self)
+
+    def __getitem__(self, code: int) -> Type[APIError]:
+        return self._index[code]
+
+    def __contains__(self, code: object) -> bool:
+        return code in self._index
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
@@ -0,0 +1,65 @@
+"""
+Benchmarks size and decode cost of homogeneous record lists as JSON, BSON and arrow IPC
+streams, including summing one column, which is what analytics clients do with them.
+
+Run with ``python -m zdevelop.benchmarks.bench_arrow``.
+"""
+import timeit
+from typing import Any, Dict, List
+
+import pyarrow.compute
+
+from spantools import MimeType, encode_content, decode_content
+
+
+NUMBER = 5
+
+
+def make_records(count: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "id": i,
+            "name": f"item {i}",
+            "status": ("active", "pending", "archived")[i % 3],
+            "price": i * 0.25,
+            "quantity": i % 17,
+        }
+        for i in range(count)
+    ]
+
+
+def sum_rows(content: bytes, mimetype: MimeType) -> float:
+    loaded, _ = decode_content(content, mimetype)
+    assert loaded is not None
+    return sum(record["price"] for record in loaded)
+
+
+def sum_column(content: bytes) -> float:
+    loaded, _ = decode_content(content, MimeType.ARROW)
+    assert loaded is not None
+    return pyarrow.compute.sum(loaded.column("price")).as_py()
+
+
+def main() -> None:
+    for count in (10_000, 200_000):
+        records = make_records(count)
+        bodies = {
+            mimetype: encode_content(records, mimetype)
+            for mimetype in (MimeType.JSON, MimeType.BSON, MimeType.ARROW)
+        }
+
+        runs = [
+            ("json", lambda: sum_rows(bodies[MimeType.JSON], MimeType.JSON)),
+            ("bson", lambda: sum_rows(bodies[MimeType.BSON], MimeType.BSON)),
+            ("arrow", lambda: sum_column(bodies[MimeType.ARROW])),
+        ]
+        for (name, func), body in zip(runs, bodies.values()):
+            seconds = min(timeit.repeat(func, number=NUMBER, repeat=3))
+            print(
+                f"{count:>7} records {name:<6} {len(body) / 1024:9.1f} KB "
+                f"{seconds / NUMBER * 1e3:9.3f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
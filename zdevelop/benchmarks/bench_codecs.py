@@ -0,0 +1,75 @@
+"""
+Benchmarks resolving the encoder / decoder for a mimetype, per call, from plain copies
+of ``DEFAULT_ENCODERS`` / ``DEFAULT_DECODERS`` and from :data:`DEFAULT_CODECS`, and
+the cost of a small ``encode_content`` / ``decode_content`` round trip with each.
+
+Run with ``python -m zdevelop.benchmarks.bench_codecs``.
+"""
+import timeit
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+from spantools import (
+    MimeType,
+    DEFAULT_CODECS,
+    DEFAULT_DECODERS,
+    DEFAULT_ENCODERS,
+    encode_content,
+    decode_content,
+    EncoderType,
+    DecoderType,
+)
+from spantools._content_dump import _find_encoder
+from spantools._content_load import _find_decoder
+
+
+NUMBER = 200_000
+
+ENCODERS: Dict[Any, EncoderType] = dict(DEFAULT_ENCODERS)
+DECODERS: Dict[Any, DecoderType] = dict(DEFAULT_DECODERS)
+
+MIMETYPES: List[Union[MimeType, str]] = [
+    MimeType.JSON,
+    "application/json",
+    "application/x-yaml",
+    "application/msgpack; charset=utf-8",
+]
+
+
+def main() -> None:
+    for mimetype in MIMETYPES:
+        runs: List[Tuple[str, Callable[[], Any]]] = [
+            ("dict encoder", lambda: _find_encoder(mimetype, ENCODERS)),
+            ("registry encoder", lambda: DEFAULT_CODECS.encoder(mimetype)),
+            ("dict decoder", lambda: _find_decoder(mimetype, DECODERS)),
+            ("registry decoder", lambda: DEFAULT_CODECS.decoder(mimetype)),
+        ]
+        for name, func in runs:
+            seconds = min(timeit.repeat(func, number=NUMBER, repeat=5))
+            print(f"{str(mimetype):<36} {name:<19} {seconds / NUMBER * 1e6:7.3f} us")
+
+    data = {"id": 1, "name": "item"}
+    body = encode_content(data, "application/json")
+    runs = [
+        (
+            "dict round trip",
+            lambda: decode_content(
+                encode_content(data, "application/json", encoders=ENCODERS),
+                "application/json",
+                decoders=DECODERS,
+            ),
+        ),
+        (
+            "registry round trip",
+            lambda: decode_content(
+                encode_content(data, "application/json"), "application/json"
+            ),
+        ),
+    ]
+    for name, func in runs:
+        seconds = min(timeit.repeat(func, number=NUMBER // 10, repeat=5))
+        print(f"{'application/json':<36} {name:<19} {seconds / NUMBER * 1e7:7.3f} us")
+    assert decode_content(body, MimeType.JSON)[0] == data
+
+
+if __name__ == "__main__":
+    main()
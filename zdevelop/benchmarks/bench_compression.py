@@ -0,0 +1,85 @@
+"""
+Benchmarks compression ratio and latency of 1 - 4 KB JSON / BSON bodies sharing one
+schema, with gzip, plain zstd and zstd with a dictionary trained on other bodies of the
+same schema.
+
+Run with ``python -m zdevelop.benchmarks.bench_compression``.
+"""
+import random
+import timeit
+from typing import Any, Dict, List
+
+from spantools import (
+    MimeType,
+    GzipCompressor,
+    ZstdCompressor,
+    encode_content,
+    train_zstd_dictionary,
+)
+
+
+NUMBER = 2_000
+
+
+def make_record(rng: random.Random) -> Dict[str, Any]:
+    return {
+        "id": rng.randrange(1_000_000),
+        "name": f"item {rng.randrange(10_000)}",
+        "status": rng.choice(["active", "pending", "archived"]),
+        "owner": {
+            "id": rng.randrange(1000),
+            "email": f"user{rng.randrange(1000)}@ex.com",
+        },
+        "line_items": [
+            {
+                "sku": f"SKU-{rng.randrange(100_000):06d}",
+                "quantity": rng.randrange(1, 10),
+                "unit_price": round(rng.uniform(1, 500), 2),
+                "currency": "USD",
+            }
+            for _ in range(rng.randrange(8, 40))
+        ],
+    }
+
+
+def main() -> None:
+    rng = random.Random(1)
+
+    for mimetype in (MimeType.JSON, MimeType.BSON):
+        training = [make_record(rng) for _ in range(1000)]
+        bodies: List[bytes] = [
+            encode_content(make_record(rng), mimetype) for _ in range(200)
+        ]
+        dictionary = train_zstd_dictionary(training, mimetype=mimetype)
+
+        compressors = [
+            ("gzip", GzipCompressor()),
+            ("zstd", ZstdCompressor()),
+            ("zstd + dictionary", ZstdCompressor(dictionary=dictionary)),
+        ]
+
+        raw = sum(len(body) for body in bodies)
+        print(f"{mimetype.name}: {raw / len(bodies):.0f} bytes / body")
+
+        for name, compressor in compressors:
+            compressed = [compressor.compress(body) for body in bodies]
+            ratio = raw / sum(len(body) for body in compressed)
+
+            compress_seconds = timeit.timeit(
+                lambda: [compressor.compress(body) for body in bodies],
+                number=NUMBER // len(bodies),
+            )
+            decompress_seconds = timeit.timeit(
+                lambda: [compressor.decompress(body) for body in compressed],
+                number=NUMBER // len(bodies),
+            )
+
+            print(
+                f"  {name:<18} ratio {ratio:5.2f}"
+                f"  compress {compress_seconds / NUMBER * 1e6:7.2f} us"
+                f"  decompress {decompress_seconds / NUMBER * 1e6:7.2f} us"
+            )
+
+
+if __name__ == "__main__":
+    main()
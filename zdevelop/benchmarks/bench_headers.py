@@ -0,0 +1,81 @@
+"""
+Benchmarks building headers for a response with a content type, an error and paging
+info.
+
+Run with ``python -m zdevelop.benchmarks.bench_headers``.
+"""
+import json
+import timeit
+from dataclasses import fields
+from typing import MutableMapping
+
+from spantools import (
+    MimeType,
+    Error,
+    PagingResp,
+    build_response_headers,
+    errors_api,
+)
+
+
+NUMBER = 100_000
+
+
+def _paging_to_headers_baseline(
+    paging: PagingResp, headers: MutableMapping[str, str]
+) -> None:
+    # PagingResp.to_headers before header keys were precomputed.
+    for paging_field in fields(paging):
+        value = getattr(paging, paging_field.name)
+        key = f"paging-{paging_field.name.replace('_', '-')}"
+        if value is None:
+            continue
+        headers[key] = str(value)
+
+
+def _error_to_headers_baseline(error: Error, headers: MutableMapping[str, str]) -> None:
+    headers["error-name"] = error.name
+    headers["error-message"] = error.message
+    headers["error-id"] = str(error.id)
+    headers["error-code"] = str(error.code)
+    if error.data:
+        headers["error-data"] = json.dumps(error.data)
+
+
+def baseline(error: Error, paging: PagingResp) -> MutableMapping[str, str]:
+    headers: MutableMapping[str, str] = dict()
+    headers["Content-Type"] = MimeType.to_string(MimeType.JSON)
+    _error_to_headers_baseline(error, headers)
+    _paging_to_headers_baseline(paging, headers)
+    return headers
+
+
+def bundled(error: Error, paging: PagingResp) -> MutableMapping[str, str]:
+    headers: MutableMapping[str, str] = dict()
+    build_response_headers(headers, mimetype=MimeType.JSON, error=error, paging=paging)
+    return headers
+
+
+def main() -> None:
+    error, _ = Error.from_exception(
+        errors_api.APILimitError("too many items", error_data={"max": 100})
+    )
+    paging = PagingResp(
+        offset=20,
+        limit=10,
+        total_items=500,
+        current_page=3,
+        previous="www.someapi.com/items?paging-offset=10&paging-limit=10",
+        next="www.someapi.com/items?paging-offset=30&paging-limit=10",
+        total_pages=50,
+    )
+
+    assert baseline(error, paging) == bundled(error, paging)
+
+    for name, func in [("baseline", baseline), ("build_response_headers", bundled)]:
+        seconds = timeit.timeit(lambda: func(error, paging), number=NUMBER)
+        print(f"{name:<24} {seconds / NUMBER * 1e6:8.3f} us / response")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmarks reading a response's content type and paging info from headers in
+framework casing (e.g. ``Paging-Offset``), by lowercasing a copy of the headers first
+and by reading through :class:`HeadersView`.
+
+Run with ``python -m zdevelop.benchmarks.bench_headers_view``.
+"""
+import timeit
+from typing import Dict, Mapping
+
+from spantools import MimeType, Error, PagingResp, HeadersView, errors_api
+
+
+NUMBER = 20_000
+
+
+def read_lowercase_copy(headers: Mapping[str, str]) -> PagingResp:
+    # What callers had to do before from_headers matched names case-insensitively.
+    lowered = {key.lower(): value for key, value in headers.items()}
+    lowered["Content-Type"] = lowered.get("content-type", "")
+    MimeType.from_headers(lowered)
+    return PagingResp.from_headers(lowered)
+
+
+def read_view(headers: Mapping[str, str]) -> PagingResp:
+    view = HeadersView(headers)
+    MimeType.from_headers(view)
+    return PagingResp.from_headers(view)
+
+
+def read_exact(headers: Mapping[str, str]) -> PagingResp:
+    MimeType.from_headers(headers)
+    return PagingResp.from_headers(headers)
+
+
+def make_headers(size: int, title: bool) -> Dict[str, str]:
+    error, _ = Error.from_exception(
+        errors_api.APILimitError("too many items", error_data={"max": 100})
+    )
+    paging = PagingResp(
+        offset=20,
+        limit=10,
+        total_items=500,
+        current_page=3,
+        previous="www.someapi.com/items?paging-offset=10&paging-limit=10",
+        next="www.someapi.com/items?paging-offset=30&paging-limit=10",
+        total_pages=50,
+    )
+    headers: Dict[str, str] = dict()
+    MimeType.add_to_headers(headers, MimeType.JSON)
+    error.to_headers(headers)
+    paging.to_headers(headers)
+    for i in range(size - len(headers)):
+        headers[f"X-Extra-Header-{i}"] = "value"
+    if title:
+        return {key.title(): value for key, value in headers.items()}
+    return headers
+
+
+def main() -> None:
+    for size in (20, 50):
+        headers = make_headers(size, title=True)
+        assert read_lowercase_copy(headers) == read_view(headers)
+
+        runs = [
+            ("lowercase copy", read_lowercase_copy, headers),
+            ("view", read_view, headers),
+            # Headers already in spantools casing: no index is ever built.
+            ("exact casing", read_exact, make_headers(size, title=False)),
+        ]
+        for name, func, run_headers in runs:
+            seconds = min(
+                timeit.repeat(lambda: func(run_headers), number=NUMBER, repeat=5)
+            )
+            print(f"{size:>3} headers {name:<16} {seconds / NUMBER * 1e6:8.3f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmarks memory per instance and construction time of the slotted models against
+plain dataclass equivalents.
+
+Run with ``python -m zdevelop.benchmarks.bench_models``.
+"""
+import uuid
+import timeit
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from spantools import Error, PagingResp
+
+
+NUMBER = 100_000
+
+
+@dataclass
+class ErrorBaseline:
+    name: str
+    message: str
+    code: int
+    data: Optional[dict] = None
+    id: uuid.UUID = field(default_factory=uuid.uuid4)
+
+
+@dataclass
+class PagingRespBaseline:
+    offset: int
+    limit: int
+    total_items: Optional[int]
+    current_page: int
+    previous: Optional[str]
+    next: Optional[str]
+    total_pages: Optional[int]
+
+
+def _bytes_per_instance(factory: Callable[[], Any]) -> float:
+    instances: List[Any] = list()
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    for _ in range(10_000):
+        instances.append(factory())
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # Exclude the list holding the instances.
+    return (end - start - instances.__sizeof__()) / len(instances)
+
+
+def _report(name: str, factory: Callable[[], Any]) -> None:
+    seconds = timeit.timeit(factory, number=NUMBER)
+    print(
+        f"{name:<20} {seconds / NUMBER * 1e6:8.3f} us / init  "
+        f"{_bytes_per_instance(factory):8.1f} bytes / instance"
+    )
+
+
+def main() -> None:
+    kwargs: Dict[str, Any] = dict(
+        offset=20,
+        limit=10,
+        total_items=500,
+        current_page=3,
+        previous=None,
+        next=None,
+        total_pages=50,
+    )
+
+    _report("ErrorBaseline", lambda: ErrorBaseline("name", "message", 1000))
+    _report("Error", lambda: Error("name", "message", 1000))
+    _report("PagingRespBaseline", lambda: PagingRespBaseline(**kwargs))
+    _report("PagingResp", lambda: PagingResp(**kwargs))
+
+
+if __name__ == "__main__":
+    main()
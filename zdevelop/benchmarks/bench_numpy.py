@@ -0,0 +1,61 @@
+"""
+Benchmarks encoding and decoding a point cloud held in a numpy array: converting it
+with ``tolist()`` before encoding, as callers had to before arrays were supported,
+against passing the array itself.
+
+Run with ``python -m zdevelop.benchmarks.bench_numpy``.
+"""
+import timeit
+from typing import Any
+
+import numpy
+
+from spantools import MimeType, encode_content, decode_content
+
+
+NUMBER = 5
+
+
+def main() -> None:
+    for points in (10_000, 200_000):
+        cloud = numpy.random.default_rng(1).random((points, 3), dtype=numpy.float32)
+        as_list = {"points": cloud.tolist()}
+        as_array = {"points": cloud}
+
+        runs = [
+            ("json tolist", MimeType.JSON, as_list),
+            ("json array", MimeType.JSON, as_array),
+            ("bson tolist", MimeType.BSON, as_list),
+            ("bson array", MimeType.BSON, as_array),
+            ("msgpack tolist", MimeType.MSGPACK, as_list),
+            ("msgpack array", MimeType.MSGPACK, as_array),
+        ]
+        for name, mimetype, data in runs:
+            if data is as_list:
+                # Include the conversion callers did themselves.
+                def encode() -> bytes:
+                    return encode_content({"points": cloud.tolist()}, mimetype)
+
+            else:
+
+                def encode() -> bytes:
+                    return encode_content(data, mimetype)
+
+            body = encode()
+
+            def decode() -> Any:
+                loaded, _ = decode_content(body, mimetype)
+                assert loaded is not None
+                return loaded["points"]
+
+            encode_seconds = min(timeit.repeat(encode, number=NUMBER, repeat=3))
+            decode_seconds = min(timeit.repeat(decode, number=NUMBER, repeat=3))
+            print(
+                f"{points:>7} points {name:<15} {len(body) / 1024:9.1f} KB "
+                f"encode {encode_seconds / NUMBER * 1e3:8.3f} ms "
+                f"decode {decode_seconds / NUMBER * 1e3:8.3f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
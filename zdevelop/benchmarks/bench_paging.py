@@ -0,0 +1,63 @@
+"""
+Benchmarks exporting a full paged collection from an endpoint with a fixed response
+latency, serially and with :func:`fan_out_pages`.
+
+Run with ``python -m zdevelop.benchmarks.bench_paging``.
+"""
+import functools
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from spantools import PagingReq, PagingResp, iter_pages, fan_out_pages
+
+
+TOTAL_ITEMS = 1000
+LIMIT = 20
+LATENCY = 0.005
+
+
+def fetch(paging: PagingReq, url: Optional[str]) -> Tuple[Dict[str, str], List[int]]:
+    time.sleep(LATENCY)
+    resp = PagingResp(
+        offset=paging.offset,
+        limit=paging.limit,
+        total_items=TOTAL_ITEMS,
+        current_page=paging.offset // paging.limit + 1,
+        previous=None,
+        next=None,
+        total_pages=None,
+    )
+    headers: Dict[str, str] = dict()
+    resp.to_headers(headers)
+    return headers, list(range(paging.offset, paging.offset + paging.limit))
+
+
+def export_serial() -> int:
+    pages = iter_pages(fetch, PagingReq(offset=0, limit=LIMIT), follow_next=False)
+    return sum(len(page.data) for page in pages)
+
+
+def export_fan_out(concurrency: int) -> int:
+    pages = fan_out_pages(fetch, PagingReq(offset=0, limit=LIMIT), concurrency)
+    return sum(len(page.data) for page in pages)
+
+
+def main() -> None:
+    runs: List[Tuple[str, Callable[[], int]]] = [("iter_pages", export_serial)]
+    for concurrency in (2, 4, 8, 16):
+        runs.append(
+            (
+                f"fan_out_pages x{concurrency}",
+                functools.partial(export_fan_out, concurrency),
+            )
+        )
+
+    for name, func in runs:
+        start = time.perf_counter()
+        assert func() == TOTAL_ITEMS
+        seconds = time.perf_counter() - start
+        print(f"{name:<24} {seconds * 1e3:8.1f} ms / export")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Benchmarks converting typical 20 - 50 entry header / param dicts to string values.
+
+Run with ``python -m zdevelop.benchmarks.bench_params``.
+"""
+import datetime
+import timeit
+import uuid
+from typing import Any, Dict, MutableMapping
+
+from spantools import MimeType, convert_params_headers
+
+
+NUMBER = 20_000
+
+
+def baseline(incoming: MutableMapping[str, Any]) -> None:
+    # convert_params_headers before typed formatting.
+    for key, value in incoming.items():
+        incoming[key] = str(value)
+
+
+def make_headers(size: int) -> Dict[str, Any]:
+    # Mostly strings, as with real request headers, with a mix of typed values.
+    values = [
+        "gzip, deflate",
+        "application/json",
+        "keep-alive",
+        10,
+        uuid.uuid4(),
+        True,
+        datetime.datetime(2020, 1, 2, 3, 4, 5),
+        MimeType.JSON,
+    ]
+    return {f"header-{i}": values[i % len(values)] for i in range(size)}
+
+
+def main() -> None:
+    for size in (20, 50):
+        headers = make_headers(size)
+        runs = [
+            ("baseline", lambda: baseline(dict(headers))),
+            ("convert (in place)", lambda: convert_params_headers(dict(headers))),
+            ("convert (copy)", lambda: convert_params_headers(headers, copy=True)),
+        ]
+        for name, func in runs:
+            seconds = timeit.timeit(func, number=NUMBER)
+            print(f"{size:>3} entries {name:<20} {seconds / NUMBER * 1e6:8.3f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""
+Benchmarks encode / decode / compression throughput of bodies spread over 1 - 8
+threads, and how far a second thread gets while one thread makes a single large native
+call, which shows whether the codec releases the GIL.
+
+Scaling past one thread needs several cores and a backend which releases the GIL, or a
+free-threaded (``3.13t``) interpreter where every imported extension supports running
+without it. The interpreter's GIL state is printed after the codecs are imported, since
+importing an extension which does not support free-threading turns the GIL back on.
+
+Run with ``python -m zdevelop.benchmarks.bench_threads``.
+"""
+import os
+import sys
+import threading
+import time
+import timeit
+from typing import Any, Callable, Dict, List
+
+import marshmallow
+
+from spantools import (
+    MimeType,
+    GzipCompressor,
+    ZstdCompressor,
+    BrotliCompressor,
+    ValidationPolicy,
+    encode_content,
+    decode_content,
+)
+
+
+NUMBER = 4_000
+"""Bodies encoded per measurement, split evenly across the threads."""
+
+THREAD_COUNTS = [1, 2, 4, 8]
+
+
+def make_records(count: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "id": i,
+            "name": f"item {i}",
+            "price": i * 1.25,
+            "tags": ["a", "b", "c"],
+            "owner": {"id": i % 100, "email": f"user{i % 100}@ex.com"},
+        }
+        for i in range(count)
+    ]
+
+
+def run_threads(work: Callable[[], Any], threads: int) -> None:
+    per_thread = NUMBER // threads
+    barrier = threading.Barrier(threads)
+
+    def run() -> None:
+        barrier.wait()
+        for _ in range(per_thread):
+            work()
+
+    started = [threading.Thread(target=run) for _ in range(threads)]
+    for thread in started:
+        thread.start()
+    for thread in started:
+        thread.join()
+
+
+def other_thread_progress(call: Callable[[], Any]) -> float:
+    """
+    Loop iterations per second a second thread manages during ``call``, as a fraction
+    of what it manages alone. Near ``0.0`` means ``call`` holds the GIL throughout.
+    """
+    count = 0
+    running = True
+
+    def spin() -> None:
+        nonlocal count
+        while running:
+            count += 1
+
+    spinner = threading.Thread(target=spin)
+    spinner.start()
+
+    start_count = count
+    alone = timeit.timeit(lambda: time.sleep(0.05), number=1)
+    alone_rate = (count - start_count) / alone
+
+    start_count = count
+    seconds = timeit.timeit(call, number=1)
+    during_rate = (count - start_count) / seconds
+
+    running = False
+    spinner.join()
+    return during_rate / alone_rate
+
+
+def main() -> None:
+    small = make_records(20)
+    large = make_records(100_000)
+    large_json = encode_content(large, MimeType.JSON)
+    policy = ValidationPolicy()
+    schema = marshmallow.Schema()
+
+    gzip = GzipCompressor()
+    zstd = ZstdCompressor()
+    brotli = BrotliCompressor()
+
+    small_json = encode_content(small, MimeType.JSON)
+    small_bson = encode_content(small, MimeType.BSON)
+    small_msgpack = encode_content(small, MimeType.MSGPACK)
+    small_gzip = gzip.compress(small_json)
+    small_zstd = zstd.compress(small_json)
+
+    cases: List[Any] = [
+        ("json encode", lambda: encode_content(small, MimeType.JSON)),
+        ("json decode", lambda: decode_content(small_json, MimeType.JSON)),
+        ("bson encode", lambda: encode_content(small, MimeType.BSON)),
+        ("bson decode", lambda: decode_content(small_bson, MimeType.BSON)),
+        ("msgpack encode", lambda: encode_content(small, MimeType.MSGPACK)),
+        ("msgpack decode", lambda: decode_content(small_msgpack, MimeType.MSGPACK)),
+        ("gzip compress", lambda: gzip.compress(small_json)),
+        ("gzip decompress", lambda: gzip.decompress(small_gzip)),
+        ("zstd compress", lambda: zstd.compress(small_json)),
+        ("zstd decompress", lambda: zstd.decompress(small_zstd)),
+        ("policy record", lambda: policy.record(schema, True, False)),
+    ]
+
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)
+    print(
+        f"python {sys.version.split()[0]}, {os.cpu_count()} cpus,"
+        f" gil {'enabled' if is_gil_enabled() else 'disabled'}"
+    )
+    print(f"{len(small_json)} byte json bodies, throughput in bodies / ms:")
+
+    for name, work in cases:
+        rates = list()
+        for threads in THREAD_COUNTS:
+            seconds = timeit.timeit(lambda: run_threads(work, threads), number=1)
+            rates.append(NUMBER / seconds / 1000)
+
+        columns = "".join(
+            f"  {threads} thr {rate:8.1f} ({rate / rates[0]:4.2f}x)"
+            for threads, rate in zip(THREAD_COUNTS, rates)
+        )
+        print(f"  {name:<16}{columns}")
+
+    print(f"other thread progress during one {len(large_json) // 1024} KB call:")
+    large_calls = [
+        ("json encode", lambda: encode_content(large, MimeType.JSON)),
+        ("json decode", lambda: decode_content(large_json, MimeType.JSON)),
+        ("msgpack encode", lambda: encode_content(large, MimeType.MSGPACK)),
+        ("gzip compress", lambda: gzip.compress(large_json)),
+        ("zstd compress", lambda: zstd.compress(large_json)),
+        ("brotli compress", lambda: brotli.compress(large_json)),
+    ]
+    for name, call in large_calls:
+        print(f"  {name:<16} {other_thread_progress(call):5.2f}")
+
+
+if __name__ == "__main__":
+    main()
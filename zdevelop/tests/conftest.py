@@ -1,5 +1,5 @@
 import pytest
-from spantools import PagingReq, PagingResp
+from spantools import PagingReq, PagingResp, PagingCursorResp, encode_cursor
 
 
 @pytest.fixture
@@ -18,3 +18,15 @@ def paging_resp() -> PagingResp:
         total_pages=5,
         total_items=50,
     )
+
+
+@pytest.fixture
+def paging_cursor_resp() -> PagingCursorResp:
+    return PagingCursorResp(
+        cursor=encode_cursor({"name": "item 20"}),
+        limit=10,
+        next_cursor=encode_cursor({"name": "item 30"}),
+        previous_cursor=encode_cursor({"name": "item 10"}),
+        next="www.someapi.com/items?paging-cursor=abc&paging-limit=10",
+        previous="www.someapi.com/items?paging-cursor=def&paging-limit=10",
+    )
@@ -1,5 +1,7 @@
 import uuid
+import pytest
 from spantools import errors_api
+from spantools.errors_api import ErrorRegistry, APIError, ERRORS_INDEXED
 
 
 class TestAPIErrors:
@@ -15,3 +17,59 @@ class TestAPIErrors:
     def test_set_send_media(self):
         exc = errors_api.APIError("some error", send_media=True)
         assert exc.send_media is True
+
+
+class RegistryError(APIError):
+    api_code = 3001
+
+
+class RegistryErrorChild(RegistryError):
+    api_code = 3002
+
+
+class RegistryErrorInherited(RegistryError):
+    pass
+
+
+class TestErrorRegistry:
+    def test_builtins(self):
+        registry = ErrorRegistry()
+
+        assert dict(registry) == ERRORS_INDEXED
+
+    def test_register_decorator(self):
+        registry = ErrorRegistry()
+
+        returned = registry.register(RegistryError)
+
+        assert returned is RegistryError
+        assert registry[3001] is RegistryError
+        assert 3001 not in ERRORS_INDEXED
+
+    def test_register_conflict(self):
+        class Conflict(APIError):
+            api_code = errors_api.APILimitError.api_code
+
+        with pytest.raises(ValueError):
+            ErrorRegistry([Conflict])
+
+    def test_register_twice(self):
+        registry = ErrorRegistry([RegistryError])
+        registry.register(RegistryError)
+
+        assert registry[3001] is RegistryError
+
+    def test_register_subclasses(self):
+        registry = ErrorRegistry()
+        registry.register_subclasses(RegistryError)
+
+        assert registry[3002] is RegistryErrorChild
+        assert 3001 not in registry
+
+    def test_derive(self):
+        parent = ErrorRegistry([RegistryError])
+        child = parent.derive([RegistryErrorChild])
+
+        assert child[3001] is RegistryError
+        assert child[3002] is RegistryErrorChild
+        assert 3002 not in parent
@@ -0,0 +1,234 @@
+import copy
+
+import pytest
+
+from spantools import (
+    CodecRegistry,
+    DEFAULT_CODECS,
+    DEFAULT_DECODERS,
+    DEFAULT_ENCODERS,
+    MimeType,
+    ContentDecodeError,
+    ContentTypeUnknownError,
+    encode_content,
+    decode_content,
+    codec_key,
+)
+from spantools import _codecs
+
+
+def upper_encode(data: str) -> bytes:
+    return data.upper().encode()
+
+
+def upper_decode(content: bytes) -> str:
+    return content.decode().lower()
+
+
+@pytest.mark.parametrize(
+    "mimetype, expected",
+    [
+        (MimeType.YAML, MimeType.YAML),
+        ("application/x-yaml", MimeType.YAML),
+        ("YAML", MimeType.YAML),
+        ("application/json; charset=utf-8", MimeType.JSON),
+        ("Application/X-Upper", "application/upper"),
+        ("application/upper; charset=utf-8", "application/upper"),
+    ],
+)
+def test_codec_key(mimetype, expected):
+    assert codec_key(mimetype) == expected
+
+
+class TestCodecRegistry:
+    def test_defaults(self):
+        for mimetype, encoder in DEFAULT_ENCODERS.items():
+            assert DEFAULT_CODECS.encoder(mimetype) is encoder
+        for mimetype, decoder in DEFAULT_DECODERS.items():
+            assert DEFAULT_CODECS.decoder(mimetype) is decoder
+
+    def test_aliases(self):
+        registry = CodecRegistry()
+        registry.register("application/upper", upper_encode, upper_decode)
+
+        for alias in ["application/upper", "Application/X-Upper", "application/upper;"]:
+            assert registry.encoder(alias) is upper_encode
+            assert registry.decoder(alias) is upper_decode
+
+    def test_missing(self):
+        assert CodecRegistry().encoder(MimeType.JSON) is None
+        assert DEFAULT_CODECS.decoder("application/unknown") is None
+        assert DEFAULT_CODECS.decoder(None) is None
+
+    def test_register_keeps_other_half(self):
+        registry = DEFAULT_CODECS.derive()
+        registry.register("application/x-json", encoder=upper_encode)
+
+        assert registry.encoder(MimeType.JSON) is upper_encode
+        assert registry.decoder(MimeType.JSON) is DEFAULT_DECODERS[MimeType.JSON]
+        assert registry.sniff_decoders()[0][0] is MimeType.JSON
+
+    def test_derive_copy_on_write(self):
+        parent = CodecRegistry()
+        parent.register("application/upper", upper_encode)
+        child = parent.derive()
+
+        assert child._codecs is parent._codecs
+
+        child.register("application/lower", upper_encode)
+
+        assert child._codecs is not parent._codecs
+        assert parent.encoder("application/lower") is None
+        assert child.encoder("application/upper") is upper_encode
+
+    def test_parent_changes_after_derive(self):
+        parent = CodecRegistry()
+        child = parent.derive()
+
+        parent.register("application/upper", upper_encode)
+
+        assert child.encoder("application/upper") is None
+        assert parent.encoder("application/upper") is upper_encode
+
+    def test_register_clears_index(self):
+        registry = CodecRegistry()
+        assert registry.encoder("application/upper") is None
+
+        registry.register("application/upper", upper_encode)
+
+        assert registry.encoder("application/upper") is upper_encode
+
+    def test_index_bounded(self, monkeypatch):
+        monkeypatch.setattr(_codecs, "_INDEX_MAX_SIZE", 4)
+        registry = DEFAULT_CODECS.derive()
+        registry.register("application/upper", upper_encode)
+
+        for i in range(10):
+            registry.encoder(f"application/json; charset={i}")
+
+        assert len(registry._index) == 4
+        assert registry.encoder("application/json; charset=20") is not None
+
+    def test_default_dicts_view_registry(self):
+        try:
+            DEFAULT_ENCODERS["application/x-upper"] = upper_encode
+            DEFAULT_DECODERS.update({"application/upper": upper_decode})
+
+            assert DEFAULT_CODECS.encoder("Application/Upper") is upper_encode
+            assert DEFAULT_CODECS.sniff_decoders()[-1] == (
+                "application/upper",
+                upper_decode,
+            )
+            encoded = encode_content("text", "application/upper")
+            assert decode_content(encoded, "application/upper")[0] == "text"
+        finally:
+            del DEFAULT_ENCODERS["application/upper"]
+            del DEFAULT_DECODERS["application/upper"]
+
+        assert "application/upper" not in DEFAULT_ENCODERS
+        assert "application/upper" not in DEFAULT_CODECS.mimetypes()
+
+    def test_view_mutations(self):
+        registry = DEFAULT_CODECS.derive()
+        encoders = _codecs._CodecView(registry, "encoder")
+        decoders = _codecs._CodecView(registry, "decoder")
+
+        assert encoders.setdefault("application/upper", upper_encode) is upper_encode
+        decoders["application/upper"] = upper_decode
+        assert encoders.pop("application/upper") is upper_encode
+
+        assert registry.encoder("application/upper") is None
+        assert registry.decoder("application/upper") is upper_decode
+        with pytest.raises(KeyError):
+            del encoders["application/upper"]
+
+        encoders.clear()
+
+        assert len(encoders) == 0
+        assert registry.encoder(MimeType.JSON) is None
+        assert registry.decoder(MimeType.JSON) is not None
+        assert DEFAULT_CODECS.encoder(MimeType.JSON) is not None
+
+    def test_default_dict_copy_plain(self):
+        copied = copy.copy(DEFAULT_ENCODERS)
+        copied["application/upper"] = upper_encode
+
+        assert type(copied) is dict
+        assert copied.keys() == set(DEFAULT_CODECS.encoder_mimetypes()) | {
+            "application/upper"
+        }
+        assert DEFAULT_CODECS.encoder("application/upper") is None
+
+    def test_encoder_mimetypes(self):
+        registry = CodecRegistry()
+        registry.register("application/upper", encoder=upper_encode)
+        registry.register("application/lower", decoder=upper_decode)
+
+        mimetypes = registry.encoder_mimetypes()
+
+        assert mimetypes == ("application/upper",)
+        assert registry.encoder_mimetypes() is mimetypes
+
+        registry.register(MimeType.JSON, encoder=upper_encode)
+        assert registry.encoder_mimetypes() == ("application/upper", MimeType.JSON)
+
+    def test_sniff_priority(self):
+        registry = CodecRegistry()
+        registry.register("application/low", decoder=upper_decode, sniff_priority=1)
+        registry.register("application/none", decoder=upper_decode)
+        registry.register("application/high", decoder=upper_decode, sniff_priority=5)
+        registry.register("application/tie", decoder=upper_decode, sniff_priority=5)
+
+        assert [key for key, _ in registry.sniff_decoders()] == [
+            "application/high",
+            "application/tie",
+            "application/low",
+        ]
+
+    def test_default_sniff_order(self):
+        sniffed = [key for key, _ in DEFAULT_CODECS.sniff_decoders()]
+
+        assert sniffed == [
+            MimeType.JSON,
+            MimeType.BSON,
+            MimeType.YAML,
+            MimeType.MSGPACK,
+            MimeType.CBOR,
+            MimeType.ARROW,
+        ]
+
+
+class TestContent:
+    def test_round_trip(self):
+        registry = DEFAULT_CODECS.derive()
+        registry.register("application/upper", upper_encode, upper_decode)
+        headers = dict()
+
+        encoded = encode_content(
+            "text", "application/x-upper", headers=headers, encoders=registry
+        )
+        loaded, _ = decode_content(
+            encoded, headers["Content-Type"].upper(), decoders=registry
+        )
+
+        assert encoded == b"TEXT"
+        assert loaded == "text"
+
+    def test_defaults_unchanged(self):
+        registry = DEFAULT_CODECS.derive()
+        registry.register("application/upper", upper_encode, upper_decode)
+
+        with pytest.raises(ContentTypeUnknownError):
+            decode_content(b"TEXT", "application/upper")
+
+    def test_sniff(self):
+        registry = CodecRegistry()
+        registry.register("application/upper", decoder=upper_decode, sniff_priority=1)
+
+        loaded, _ = decode_content(b"TEXT", decoders=registry, allow_sniff=True)
+
+        assert loaded == "text"
+
+    def test_sniff_failure(self):
+        with pytest.raises(ContentDecodeError):
+            decode_content(b"TEXT", decoders=CodecRegistry(), allow_sniff=True)
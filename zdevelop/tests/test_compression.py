@@ -0,0 +1,321 @@
+import gzip
+import threading
+import zlib
+import pytest
+import zstandard
+
+from spantools import (
+    encode_content,
+    decode_content,
+    compress_content,
+    decompress_content,
+    MimeType,
+    ContentDecodeError,
+    ContentEncodeError,
+    DEFAULT_COMPRESSORS,
+    Compressor,
+    GzipCompressor,
+    ZstdCompressor,
+    ZSTD_DICTIONARY_ID_HEADER,
+    train_zstd_dictionary,
+)
+
+
+ENCODINGS = ["gzip", "deflate", "zstd", "br"]
+DATA = [{"id": i, "name": f"item {i}", "tags": ["a", "b"]} for i in range(200)]
+BOMB_SIZE = 16 << 20
+
+
+def chunked(data: bytes, size: int = 100):
+    return [data[i : i + size] for i in range(0, len(data), size)]  # noqa: E203
+
+
+@pytest.mark.parametrize("encoding", ENCODINGS)
+class TestCompressors:
+    def test_round_trip(self, encoding: str):
+        compressor = DEFAULT_COMPRESSORS[encoding]
+        content = encode_content(DATA, MimeType.JSON)
+
+        compressed = compressor.compress(content)
+
+        assert len(compressed) < len(content)
+        assert compressor.decompress(compressed) == content
+
+    def test_stream(self, encoding: str):
+        compressor = DEFAULT_COMPRESSORS[encoding]
+        content = encode_content(DATA, MimeType.JSON)
+
+        compressed = b"".join(compressor.iter_compress(chunked(content)))
+
+        assert compressor.decompress(compressed) == content
+        assert b"".join(compressor.iter_decompress(chunked(compressed))) == content
+
+    def test_stream_single_bytes(self, encoding: str):
+        compressor = DEFAULT_COMPRESSORS[encoding]
+        content = encode_content(DATA, MimeType.JSON)
+
+        compressed = compressor.compress(content)
+
+        assert b"".join(compressor.iter_decompress(chunked(compressed, 1))) == content
+
+    def test_corrupt(self, encoding: str):
+        compressor = DEFAULT_COMPRESSORS[encoding]
+
+        with pytest.raises(ContentDecodeError):
+            compressor.decompress(b"not compressed data at all")
+
+    def test_truncated(self, encoding: str):
+        compressor = DEFAULT_COMPRESSORS[encoding]
+        content = encode_content(DATA, MimeType.JSON)
+        compressed = b"".join(compressor.iter_compress(chunked(content)))
+
+        with pytest.raises(ContentDecodeError):
+            list(compressor.iter_decompress([compressed[: len(compressed) // 2]]))
+
+    @pytest.mark.parametrize("streamed", [False, True])
+    def test_max_size(self, encoding: str, streamed: bool):
+        compressor = DEFAULT_COMPRESSORS[encoding]
+        content = bytes(BOMB_SIZE)
+        if streamed:
+            compressed = b"".join(compressor.iter_compress(chunked(content, 1 << 20)))
+        else:
+            compressed = compressor.compress(content)
+
+        assert compressor.decompress(compressed, max_size=BOMB_SIZE) == content
+
+        with pytest.raises(ContentDecodeError, match="exceeds"):
+            compressor.decompress(compressed, max_size=BOMB_SIZE - 1)
+
+    def test_max_size_bounded_chunks(self, encoding: str):
+        compressor = DEFAULT_COMPRESSORS[encoding]
+        compressed = compressor.compress(bytes(BOMB_SIZE))
+        max_size = 1 << 20
+
+        decompressed = list()
+        with pytest.raises(ContentDecodeError, match="exceeds"):
+            for piece in compressor.iter_decompress([compressed], max_size):
+                decompressed.append(piece)
+
+        assert sum(len(piece) for piece in decompressed) <= max_size
+        assert max(len(piece) for piece in decompressed) <= 128 * 1024
+
+
+def test_compressor_abstract():
+    class Partial(Compressor):
+        def compress(self, data: bytes) -> bytes:
+            return data
+
+    with pytest.raises(TypeError):
+        Partial()
+
+
+def test_gzip_interop():
+    content = encode_content(DATA, MimeType.JSON)
+
+    assert gzip.decompress(GzipCompressor().compress(content)) == content
+    assert GzipCompressor().decompress(gzip.compress(content)) == content
+
+
+def test_deflate_interop():
+    content = encode_content(DATA, MimeType.JSON)
+    assert DEFAULT_COMPRESSORS["deflate"].decompress(zlib.compress(content)) == content
+
+
+def test_zstd_contexts_per_thread():
+    compressor = ZstdCompressor()
+    contexts = dict()
+
+    def run(name: str):
+        compressor.compress(b"data")
+        contexts[name] = compressor._contexts(0)
+
+    threads = [threading.Thread(target=run, args=(str(i),)) for i in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert contexts["0"][0] is not contexts["1"][0]
+    assert compressor._contexts(0) is compressor._contexts(0)
+
+
+class TestCompressContent:
+    def test_sets_header(self):
+        headers = dict()
+        content = b"a" * 2000
+
+        compressed = compress_content(content, "gzip", headers)
+
+        assert headers == {"Content-Encoding": "gzip"}
+        assert gzip.decompress(compressed) == content
+
+    def test_min_size(self):
+        headers = dict()
+        content = b"a" * 100
+
+        assert compress_content(content, "gzip", headers) is content
+        assert headers == dict()
+
+    def test_identity(self):
+        headers = dict()
+        content = b"a" * 2000
+
+        assert compress_content(content, "identity", headers) == content
+        assert headers == dict()
+
+    def test_unknown(self):
+        with pytest.raises(ContentEncodeError):
+            compress_content(b"a" * 2000, "unknown")
+
+    def test_decompress_multiple(self):
+        content = b"a" * 2000
+        compressed = DEFAULT_COMPRESSORS["br"].compress(gzip.compress(content))
+
+        assert decompress_content(compressed, "gzip, br") == content
+
+    def test_decompress_unknown(self):
+        with pytest.raises(ContentDecodeError):
+            decompress_content(b"a", "unknown")
+
+    def test_decompress_none(self):
+        assert decompress_content(b"a", None) == b"a"
+
+    def test_decompress_max_size(self):
+        content = b"a" * 2000
+        compressed = DEFAULT_COMPRESSORS["br"].compress(gzip.compress(content))
+
+        assert decompress_content(compressed, "gzip, br", max_size=2000) == content
+        with pytest.raises(ContentDecodeError):
+            decompress_content(compressed, "gzip, br", max_size=1999)
+
+
+@pytest.mark.parametrize("encoding", ENCODINGS)
+def test_encode_decode_content(encoding: str):
+    headers = dict()
+
+    encoded = encode_content(DATA, headers=headers, content_encoding=encoding)
+
+    assert headers["Content-Encoding"] == encoding
+    loaded, _ = decode_content(
+        encoded,
+        mimetype=MimeType.from_headers(headers),
+        content_encoding=headers["Content-Encoding"],
+    )
+    assert loaded == DATA
+
+
+def test_decode_content_max_decompressed_size():
+    headers = dict()
+    encoded = encode_content(DATA, headers=headers, content_encoding="gzip")
+
+    with pytest.raises(ContentDecodeError):
+        decode_content(
+            encoded, MimeType.JSON, content_encoding="gzip", max_decompressed_size=1024,
+        )
+
+
+def test_encode_content_under_min_size():
+    headers = dict()
+
+    encoded = encode_content({"key": "value"}, headers=headers, content_encoding="gzip")
+
+    assert "Content-Encoding" not in headers
+    assert decode_content(encoded, MimeType.JSON)[0] == {"key": "value"}
+
+
+def make_record(i: int) -> dict:
+    return {
+        "id": i,
+        "name": f"item {i}",
+        "description": f"description of item {i} " * (i % 5 + 1),
+        "tags": ["alpha", "beta", "gamma"][: i % 3 + 1],
+        "price": {"amount": i * 3, "currency": "USD"},
+        "available": i % 2 == 0,
+    }
+
+
+@pytest.fixture(scope="module")
+def dictionary():
+    return train_zstd_dictionary(
+        [make_record(i) for i in range(500)], dict_size=4096, mimetype=MimeType.JSON
+    )
+
+
+class TestZstdDictionary:
+    def test_smaller(self, dictionary):
+        content = encode_content(make_record(1000), MimeType.JSON)
+
+        plain = ZstdCompressor().compress(content)
+        trained = ZstdCompressor(dictionary=dictionary).compress(content)
+
+        assert len(trained) < len(plain)
+
+    def test_round_trip(self, dictionary):
+        compressor = ZstdCompressor(dictionary=dictionary)
+        content = encode_content(make_record(1000), MimeType.JSON)
+
+        assert compressor.decompress(compressor.compress(content)) == content
+
+        streamed = b"".join(compressor.iter_compress(chunked(content, 10)))
+        assert compressor.decompress(streamed) == content
+        assert b"".join(compressor.iter_decompress(chunked(streamed, 10))) == content
+        assert b"".join(compressor.iter_decompress(chunked(streamed, 1))) == content
+
+    def test_header(self, dictionary):
+        compressors = dict(DEFAULT_COMPRESSORS)
+        compressors["zstd"] = ZstdCompressor(dictionary=dictionary)
+        headers = dict()
+
+        encoded = encode_content(
+            make_record(1000),
+            headers=headers,
+            content_encoding="zstd",
+            compress_min_size=0,
+            compressors=compressors,
+        )
+
+        assert headers[ZSTD_DICTIONARY_ID_HEADER] == str(dictionary.dict_id())
+        loaded, _ = decode_content(
+            encoded,
+            MimeType.JSON,
+            content_encoding=headers["Content-Encoding"],
+            compressors=compressors,
+        )
+        assert loaded == make_record(1000)
+
+    def test_no_header_without_dictionary(self):
+        headers = dict()
+        compress_content(b"a" * 2000, "zstd", headers)
+        assert ZSTD_DICTIONARY_ID_HEADER not in headers
+
+    def test_decompress_by_frame_id(self, dictionary):
+        content = encode_content(make_record(1000), MimeType.JSON)
+        compressed = ZstdCompressor(dictionary=dictionary).compress(content)
+
+        receiver = ZstdCompressor(dictionaries=[dictionary])
+
+        assert receiver.decompress(compressed) == content
+        # Bodies without a dictionary still decompress.
+        assert receiver.decompress(ZstdCompressor().compress(content)) == content
+
+    def test_unknown_dictionary(self, dictionary):
+        content = encode_content(make_record(1000), MimeType.JSON)
+        compressed = ZstdCompressor(dictionary=dictionary).compress(content)
+
+        with pytest.raises(ContentDecodeError):
+            ZstdCompressor().decompress(compressed)
+
+    def test_reload(self, dictionary):
+        reloaded = zstandard.ZstdCompressionDict(dictionary.as_bytes())
+        content = encode_content(make_record(1000), MimeType.JSON)
+        compressed = ZstdCompressor(dictionary=dictionary).compress(content)
+
+        assert ZstdCompressor(dictionary=reloaded).decompress(compressed) == content
+
+    def test_too_few_samples(self):
+        with pytest.raises(ValueError):
+            train_zstd_dictionary([b"a", b"b"])
+
+    def test_bytes_samples(self):
+        samples = [encode_content(make_record(i), MimeType.JSON) for i in range(500)]
+        assert train_zstd_dictionary(samples, dict_size=4096).dict_id()
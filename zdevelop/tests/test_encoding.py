@@ -1,4 +1,5 @@
 import pytest
+import spantools._encoders
 import uuid
 import datetime
 import pytz
@@ -10,6 +11,9 @@ import io
 import copy
 import fractions
 import decimal
+import msgpack
+import cbor2
+import pyarrow
 from bson import BSON, Decimal128
 from bson.raw_bson import RawBSONDocument
 from dataclasses import dataclass, field
@@ -26,6 +30,11 @@ from spantools import (
     NoContentError,
     DEFAULT_ENCODERS,
     DEFAULT_DECODERS,
+    iter_msgpack_records,
+    iter_cbor_sequence,
+    iter_csv_chunks,
+    iter_csv_records,
+    schema_csv_fields,
 )
 
 
@@ -71,6 +80,13 @@ data_mimetypes_for_parametrize = [
     "x-bson",
     "BSON",
     "bson",
+    MimeType.MSGPACK,
+    "application/msgpack",
+    "application/x-msgpack",
+    "msgpack",
+    MimeType.CBOR,
+    "application/cbor",
+    "cbor",
 ]
 
 
@@ -148,7 +164,6 @@ class TestBasicEncoding:
         encoded = encode_content(
             data, mimetype=mimetype, headers=headers, data_schema=schema
         )
-        print(encoded.decode())
 
         assert isinstance(encoded, bytes)
         header_content_type = headers["Content-Type"]
@@ -392,3 +407,360 @@ class TestErrors:
 
         assert isinstance(raw, bytes)
         assert raw == serialized
+
+
+class TestMsgpack:
+    def test_native_types(self):
+        id_sample = uuid.uuid4()
+        dt = datetime.datetime.now(tz=pytz.UTC)
+        decimal_val = Decimal128(decimal.Decimal("1.2345"))
+
+        data = {
+            "id": id_sample,
+            "dt": dt,
+            "binary": b"Some Bin Data",
+            "decimal": decimal_val,
+            "raw_bson": RawBSONDocument(BSON.encode({"key": "value"})),
+        }
+
+        encoded = encode_content(data, MimeType.MSGPACK)
+        decoded, _ = decode_content(encoded, MimeType.MSGPACK)
+
+        assert decoded["id"] == str(id_sample)
+        assert marshmallow.fields.DateTime()._deserialize(decoded["dt"], "dt", {}) == dt
+        assert decoded["binary"] == b"Some Bin Data"
+        assert decimal.Decimal(decoded["decimal"]) == decimal_val.to_decimal()
+        assert decoded["raw_bson"] == {"key": "value"}
+
+    def test_smaller_than_json(self):
+        data = [{"id": i, "name": f"item {i}", "active": True} for i in range(100)]
+
+        msgpack_encoded = encode_content(data, MimeType.MSGPACK)
+
+        assert len(msgpack_encoded) < len(encode_content(data, MimeType.JSON))
+
+    def test_sniff(self):
+        data = {"key": 10, "binary": b"data"}
+        encoded = encode_content(data, MimeType.MSGPACK)
+
+        loaded, _ = decode_content(encoded, allow_sniff=True)
+
+        assert loaded == data
+
+    def test_scalar_decode_error(self):
+        with pytest.raises(ContentDecodeError):
+            decode_content(msgpack.packb("Some Data"), MimeType.MSGPACK)
+
+    def test_unserializable(self):
+        with pytest.raises(ContentEncodeError):
+            encode_content({"key": fractions.Fraction("1/4")}, MimeType.MSGPACK)
+
+    @pytest.mark.parametrize("as_stream", [True, False])
+    def test_iter_records(self, as_stream: bool):
+        data = [{"id": i, "name": f"item {i}"} for i in range(1000)]
+        encoded = encode_content(data, MimeType.MSGPACK)
+
+        source = io.BytesIO(encoded) if as_stream else encoded
+        records = iter_msgpack_records(source, read_size=64)
+
+        assert next(records) == data[0]
+        assert list(records) == data[1:]
+
+    def test_iter_records_truncated(self):
+        encoded = encode_content([{"id": i} for i in range(10)], MimeType.MSGPACK)
+
+        with pytest.raises(ContentDecodeError):
+            list(iter_msgpack_records(encoded[:-3]))
+
+    def test_iter_records_not_list(self):
+        encoded = encode_content({"key": "value"}, MimeType.MSGPACK)
+
+        with pytest.raises(ContentDecodeError):
+            list(iter_msgpack_records(encoded))
+
+
+class TestCbor:
+    def test_native_types(self):
+        id_sample = uuid.uuid4()
+        dt = datetime.datetime.now(tz=datetime.timezone.utc)
+        decimal_val = Decimal128(decimal.Decimal("1.2345"))
+
+        data = {
+            "id": id_sample,
+            "dt": dt,
+            "naive_dt": dt.replace(tzinfo=None),
+            "binary": b"Some Bin Data",
+            "decimal": decimal_val,
+            "big": 2 ** 100,
+            "raw_bson": RawBSONDocument(BSON.encode({"key": "value"})),
+        }
+
+        encoded = encode_content(data, MimeType.CBOR)
+        decoded, _ = decode_content(encoded, MimeType.CBOR)
+
+        assert decoded["id"] == id_sample
+        assert decoded["dt"] == dt
+        assert decoded["naive_dt"] == dt
+        assert decoded["binary"] == b"Some Bin Data"
+        assert decoded["decimal"] == decimal_val.to_decimal()
+        assert decoded["big"] == 2 ** 100
+        assert decoded["raw_bson"] == {"key": "value"}
+
+    def test_sniff(self):
+        data = {"key": 10, "id": uuid.uuid4()}
+        encoded = encode_content(data, MimeType.CBOR)
+
+        loaded, _ = decode_content(encoded, allow_sniff=True)
+
+        assert loaded == data
+
+    def test_scalar_decode_error(self):
+        with pytest.raises(ContentDecodeError):
+            decode_content(cbor2.dumps("Some Data"), MimeType.CBOR)
+
+    def test_unserializable(self):
+        with pytest.raises(ContentEncodeError):
+            encode_content({"key": object()}, MimeType.CBOR)
+
+    @pytest.mark.parametrize("as_stream", [True, False])
+    def test_iter_sequence(self, as_stream: bool):
+        data = [{"id": i, "name": f"item {i}"} for i in range(100)]
+        encoded = b"".join(encode_content(item, MimeType.CBOR) for item in data)
+
+        source = io.BytesIO(encoded) if as_stream else encoded
+        items = iter_cbor_sequence(source)
+
+        assert next(items) == data[0]
+        assert list(items) == data[1:]
+
+    def test_iter_sequence_empty(self):
+        assert list(iter_cbor_sequence(b"")) == []
+
+    def test_iter_sequence_truncated(self):
+        encoded = b"".join(encode_content({"id": i}, MimeType.CBOR) for i in range(10))
+
+        with pytest.raises(ContentDecodeError):
+            list(iter_cbor_sequence(encoded[:-1]))
+
+
+class TestArrow:
+    def test_round_trip(self):
+        data = [{"id": i, "name": f"item {i}", "score": i / 2} for i in range(100)]
+        headers = dict()
+
+        encoded = encode_content(data, MimeType.ARROW, headers=headers)
+        loaded, _ = decode_content(encoded, MimeType.from_headers(headers))
+
+        assert headers["Content-Type"] == "application/vnd.apache.arrow.stream"
+        assert isinstance(loaded, pyarrow.Table)
+        assert loaded.column_names == ["id", "name", "score"]
+        assert loaded.column("id").to_pylist() == list(range(100))
+        assert loaded.to_pylist() == data
+
+    def test_zero_copy(self):
+        encoded = encode_content([{"id": i} for i in range(100)], MimeType.ARROW)
+        loaded, _ = decode_content(encoded, MimeType.ARROW)
+
+        content_address = pyarrow.py_buffer(encoded).address
+        column_address = loaded.column("id").chunks[0].buffers()[1].address
+
+        assert content_address <= column_address < content_address + len(encoded)
+
+    def test_batches(self, monkeypatch):
+        monkeypatch.setattr(spantools._encoders, "ARROW_BATCH_SIZE", 10)
+
+        encoded = encode_content([{"id": i} for i in range(95)], MimeType.ARROW)
+        loaded, _ = decode_content(encoded, MimeType.ARROW)
+
+        assert loaded.column("id").num_chunks == 10
+        assert loaded.num_rows == 95
+
+    def test_table(self):
+        table = pyarrow.table({"id": [1, 2, 3]})
+
+        loaded, _ = decode_content(
+            encode_content(table, MimeType.ARROW), MimeType.ARROW
+        )
+
+        assert loaded.equals(table)
+
+    def test_bson_types(self):
+        data = [
+            {
+                "decimal": Decimal128(decimal.Decimal("1.5")),
+                "raw_bson": RawBSONDocument(BSON.encode({"key": "value"})),
+                "binary": b"Some Bin Data",
+            }
+        ]
+
+        loaded, _ = decode_content(encode_content(data, MimeType.ARROW), MimeType.ARROW)
+
+        assert loaded.to_pylist() == [
+            {
+                "decimal": decimal.Decimal("1.5"),
+                "raw_bson": {"key": "value"},
+                "binary": b"Some Bin Data",
+            }
+        ]
+
+    @pytest.mark.parametrize("many", [True, False])
+    def test_schema_round_trip(self, many: bool):
+        schema = SchemaToTest(many=many)
+        data = [DataToTest(), DataToTest()] if many else DataToTest()
+
+        encoded = encode_content(data, MimeType.ARROW, data_schema=schema)
+        loaded, table = decode_content(encoded, MimeType.ARROW, data_schema=schema)
+
+        assert isinstance(table, pyarrow.Table)
+        assert loaded == data
+
+    def test_decode_error(self):
+        with pytest.raises(ContentDecodeError):
+            decode_content(b"not arrow", MimeType.ARROW)
+
+    def test_sniff(self):
+        encoded = encode_content([{"id": 1}], MimeType.ARROW)
+
+        loaded, _ = decode_content(encoded, allow_sniff=True)
+
+        assert loaded.to_pylist() == [{"id": 1}]
+
+
+class TestCsv:
+    @pytest.mark.parametrize(
+        "mimetype, delimiter",
+        [
+            (MimeType.CSV, ","),
+            ("text/csv", ","),
+            ("csv", ","),
+            (MimeType.TSV, "\t"),
+            ("text/tab-separated-values", "\t"),
+            ("tsv", "\t"),
+        ],
+    )
+    def test_round_trip(self, mimetype, delimiter: str):
+        data = [{"id": "1", "name": 'a, "quoted"\nname'}, {"id": "2", "name": None}]
+        headers = dict()
+
+        encoded = encode_content(data, mimetype, headers=headers)
+        loaded, _ = decode_content(encoded, mimetype)
+
+        assert encoded.startswith(f"id{delimiter}name\r\n".encode())
+        assert headers["Content-Type"] == MimeType.from_name(mimetype).value
+        assert loaded == data
+
+    def test_value_formatting(self):
+        dt = datetime.datetime(2020, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc)
+        id_sample = uuid.uuid4()
+        data = {
+            "dt": dt,
+            "id": id_sample,
+            "decimal": Decimal128(decimal.Decimal("1.50")),
+            "binary": b"\x01\x02",
+            "flag": True,
+            "nested": {"key": [1, 2]},
+            "raw_bson": RawBSONDocument(BSON.encode({"key": "value"})),
+        }
+
+        loaded, _ = decode_content(encode_content(data, MimeType.CSV), MimeType.CSV)
+
+        assert loaded == [
+            {
+                "dt": "2020-01-02T03:04:05+00:00",
+                "id": str(id_sample),
+                "decimal": "1.50",
+                "binary": "0102",
+                "flag": "true",
+                "nested": '{"key":[1,2]}',
+                "raw_bson": '{"key":"value"}',
+            }
+        ]
+
+    @pytest.mark.parametrize(
+        "mimetype, delimiter", [(MimeType.CSV, ","), (MimeType.TSV, "\t")]
+    )
+    def test_schema_field_order(self, mimetype, delimiter: str):
+        schema = SchemaToTest(many=True)
+        data = [DataToTest(), DataToTest()]
+
+        encoded = encode_content(data, mimetype, data_schema=schema)
+        loaded, _ = decode_content(encoded, mimetype, data_schema=schema)
+
+        assert schema_csv_fields(schema) == ["string", "num", "id", "dt"]
+        assert encoded.startswith(
+            delimiter.join(["string", "num", "id", "dt"]).encode()
+        )
+        assert loaded == data
+
+    def test_schema_single(self):
+        schema = SchemaToTest()
+        data = DataToTest()
+
+        encoded = encode_content(data, MimeType.CSV, data_schema=schema)
+        loaded, _ = decode_content(encoded, MimeType.CSV, data_schema=schema)
+
+        assert loaded == data
+
+    def test_chunks(self):
+        records = ({"id": i, "name": f"item {i}"} for i in range(1000))
+
+        chunks = list(iter_csv_chunks(records, chunk_size=1024))
+
+        assert len(chunks) > 1
+        assert all(len(chunk) < 1100 for chunk in chunks)
+        loaded = list(iter_csv_records(io.BytesIO(b"".join(chunks))))
+        assert loaded[999] == {"id": "999", "name": "item 999"}
+
+    def test_chunks_schema(self):
+        schema = SchemaToTest()
+        data = [DataToTest() for _ in range(3)]
+
+        encoded = b"".join(iter_csv_chunks(iter(data), data_schema=schema))
+
+        assert (
+            decode_content(
+                encoded, MimeType.CSV, data_schema=schema.__class__(many=True)
+            )[0]
+            == data
+        )
+
+    def test_chunks_fields(self):
+        encoded = b"".join(iter_csv_chunks([{"a": 1, "b": 2}], fields=["b", "a"]))
+        assert encoded == b"b,a\r\n2,1\r\n"
+
+    def test_chunks_empty(self):
+        assert list(iter_csv_chunks([])) == []
+
+    def test_extra_field(self):
+        with pytest.raises(ContentEncodeError):
+            encode_content([{"a": 1}, {"a": 2, "b": 3}], MimeType.CSV)
+
+    def test_iter_records_lazy(self):
+        source = io.BytesIO(b"id,name\r\n1,a\r\n2,b\r\n")
+        records = iter_csv_records(source)
+
+        assert next(records) == {"id": "1", "name": "a"}
+        assert source.tell() > 0
+        assert list(records) == [{"id": "2", "name": "b"}]
+        assert not source.closed
+
+    def test_decode_error(self):
+        with pytest.raises(ContentDecodeError):
+            decode_content(b"id,name\r\n\xff\xfe,a", MimeType.CSV)
+
+    @pytest.mark.parametrize("row", [b"1", b"1,a,extra", b"1,a,"])
+    def test_row_cell_count(self, row: bytes):
+        content = b"id,name\r\n0,z\r\n" + row + b"\r\n"
+
+        with pytest.raises(ContentDecodeError, match="line 3 has"):
+            list(iter_csv_records(content))
+        with pytest.raises(ContentDecodeError):
+            decode_content(content, MimeType.CSV)
+
+    def test_blank_lines_skipped(self):
+        loaded, _ = decode_content(b"id,name\r\n\r\n1,a\r\n\r\n", MimeType.CSV)
+        assert loaded == [{"id": "1", "name": "a"}]
+
+    def test_not_sniffed(self):
+        with pytest.raises(ContentDecodeError):
+            decode_content(b"id,name\r\n1,a", allow_sniff=True)
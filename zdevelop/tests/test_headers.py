@@ -0,0 +1,135 @@
+import pytest
+
+from spantools import (
+    MimeType,
+    Error,
+    PagingResp,
+    PagingCursorResp,
+    HeadersView,
+    build_response_headers,
+    errors_api,
+)
+
+
+class TestBuildResponseHeaders:
+    def test_all(self, paging_resp: PagingResp):
+        error, _ = Error.from_exception(
+            errors_api.APILimitError("some error message", error_data={"key": 1})
+        )
+
+        expected = dict()
+        MimeType.add_to_headers(expected, MimeType.JSON)
+        error.to_headers(expected)
+        paging_resp.to_headers(expected)
+
+        headers = dict()
+        body = build_response_headers(
+            headers, mimetype=MimeType.JSON, error=error, paging=paging_resp
+        )
+
+        assert body is None
+        assert headers == expected
+
+    @pytest.mark.parametrize("data_mimetype", [None, MimeType.JSON, MimeType.BSON])
+    def test_error_round_trip(self, data_mimetype: MimeType):
+        error, _ = Error.from_exception(
+            errors_api.APILimitError("some error message", error_data={"key": 1})
+        )
+        headers = dict()
+        build_response_headers(headers, error=error, data_mimetype=data_mimetype)
+
+        assert Error.from_headers(headers) == error
+
+    @pytest.mark.parametrize("data_mimetype", [None, MimeType.JSON, MimeType.BSON])
+    def test_error_data_overflow(self, data_mimetype: MimeType):
+        error, _ = Error.from_exception(
+            errors_api.APILimitError("some error message", error_data={"key": "x" * 64})
+        )
+        expected = dict()
+        expected_body = error.to_headers(
+            expected, data_mimetype=data_mimetype, max_data_size=32
+        )
+
+        headers = dict()
+        body = build_response_headers(
+            headers, error=error, data_mimetype=data_mimetype, max_data_size=32
+        )
+
+        assert body is not None
+        assert body == expected_body
+        assert headers == expected
+        assert headers["error-data-location"] == "body"
+        assert Error.from_headers(headers, content=body) == error
+
+    def test_error_no_data(self):
+        error, _ = Error.from_exception(errors_api.APILimitError("some error message"))
+        headers = dict()
+        build_response_headers(headers, error=error)
+
+        assert "error-data" not in headers
+        assert headers["error-id"] == str(error.id)
+
+    def test_none(self):
+        headers = dict()
+        assert build_response_headers(headers) is None
+        assert headers == dict()
+
+    def test_mimetype_string(self):
+        headers = dict()
+        build_response_headers(headers, mimetype="application/x-yaml")
+        assert headers == {"Content-Type": MimeType.YAML.value}
+
+
+class TestHeadersView:
+    def test_lookup_any_case(self):
+        view = HeadersView({"Content-Type": "application/json", "paging-limit": "10"})
+
+        assert view["content-type"] == "application/json"
+        assert view["CONTENT-TYPE"] == "application/json"
+        assert view["Paging-Limit"] == "10"
+        assert view.get("PAGING-LIMIT") == "10"
+        assert "content-type" in view
+        assert "Paging-Limit" in view
+
+    def test_missing(self):
+        view = HeadersView({"Content-Type": "application/json"})
+
+        assert view.get("paging-limit") is None
+        assert view.get("paging-limit", "default") == "default"
+        assert "paging-limit" not in view
+        with pytest.raises(KeyError):
+            _ = view["paging-limit"]
+
+    def test_mapping(self):
+        headers = {"Content-Type": "application/json", "Paging-Limit": "10"}
+        view = HeadersView(headers)
+
+        assert len(view) == 2
+        assert list(view) == list(headers)
+        assert dict(view) == headers
+
+    def test_wrap(self):
+        view = HeadersView({})
+        assert HeadersView.wrap(view) is view
+        assert isinstance(HeadersView.wrap({}), HeadersView)
+
+    def test_from_headers(self, paging_resp: PagingResp):
+        error, _ = Error.from_exception(
+            errors_api.APILimitError("some error message", error_data={"key": 1})
+        )
+        headers = dict()
+        build_response_headers(
+            headers, mimetype=MimeType.JSON, error=error, paging=paging_resp
+        )
+        headers_upper = {key.upper(): value for key, value in headers.items()}
+
+        assert MimeType.from_headers(headers_upper) is MimeType.JSON
+        assert Error.from_headers(headers_upper) == error
+        assert PagingResp.from_headers(headers_upper) == paging_resp
+
+    def test_from_headers_cursor(self, paging_cursor_resp: PagingCursorResp):
+        headers = dict()
+        paging_cursor_resp.to_headers(headers)
+        headers_title = {key.title(): value for key, value in headers.items()}
+
+        assert PagingCursorResp.from_headers(headers_title) == paging_cursor_resp
@@ -0,0 +1,123 @@
+import ast
+import pathlib
+import subprocess
+import sys
+from typing import Dict
+
+import pytest
+
+import spantools
+
+
+HEAVY_MODULES = [
+    "marshmallow",
+    "google.protobuf",
+    "bson",
+    "yaml",
+    "rapidjson",
+    "numpy",
+    "pyarrow",
+]
+
+
+def import_times(code: str) -> Dict[str, int]:
+    """
+    Runs ``code`` in a fresh interpreter with ``-X importtime`` and returns the
+    cumulative import time in microseconds of every module it imported.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        check=True,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+    )
+
+    times: Dict[str, int] = dict()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")  # noqa: E203
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_import_skips_codecs():
+    imported = import_times("import spantools")
+
+    loaded = [
+        heavy
+        for heavy in HEAVY_MODULES
+        if any(name == heavy or name.startswith(heavy + ".") for name in imported)
+    ]
+    assert loaded == []
+
+
+def test_import_time():
+    times = import_times("import spantools; import spantools._content_dump")
+
+    # Guards against a module-level import of a codec sneaking back into the package:
+    # importing spantools should be a small fraction of loading the codecs.
+    assert times["spantools"] * 3 < times["spantools._content_dump"]
+
+
+def test_codecs_load_on_access():
+    code = (
+        "import sys, spantools; "
+        "assert 'rapidjson' not in sys.modules; "
+        "spantools.encode_content; "
+        "assert 'rapidjson' in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_codec_helpers_built_on_first_use():
+    code = (
+        "from spantools import _encoders; "
+        "assert not hasattr(_encoders._DATETIME_LOCAL, 'field'); "
+        "assert _encoders._yaml_dumper.cache_info().currsize == 0; "
+        "import datetime; _encoders.yaml_encode({'at': datetime.datetime.now()}); "
+        "assert hasattr(_encoders._DATETIME_LOCAL, 'field')"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_models_skip_content_codecs():
+    code = (
+        "import sys, spantools._models; "
+        "assert 'spantools._content_dump' not in sys.modules; "
+        "assert 'spantools._content_load' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+@pytest.mark.parametrize("name", spantools.__all__)
+def test_all_resolve(name: str):
+    assert getattr(spantools, name) is not None
+    assert name in dir(spantools)
+
+
+def test_errors_api():
+    assert spantools.errors_api.APIError.__name__ == "APIError"
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError):
+        spantools.not_a_name
+
+
+def test_type_checking_imports_match():
+    tree = ast.parse(pathlib.Path(spantools.__file__).read_text())
+    block = next(
+        node
+        for node in tree.body
+        if isinstance(node, ast.If) and getattr(node.test, "id", "") == "TYPE_CHECKING"
+    )
+
+    imported = {
+        alias.name: "." + node.module
+        for node in block.body
+        if isinstance(node, ast.ImportFrom) and node.module
+        for alias in node.names
+    }
+
+    assert imported == spantools._LAZY_INDEX
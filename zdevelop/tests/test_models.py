@@ -1,12 +1,23 @@
 import json
+import uuid
+import decimal
+import datetime
+import pickle
 import pytest
 from spantools import (
+    MimeType,
+    NoContentError,
     Error,
+    ErrorBatch,
     NoErrorReturnedError,
     InvalidAPIErrorCodeError,
     errors_api,
     PagingReq,
     PagingResp,
+    PagingCursorReq,
+    PagingCursorResp,
+    encode_cursor,
+    decode_cursor,
 )
 
 
@@ -85,6 +96,64 @@ class TestError:
 
         assert from_headers == error_info
 
+    @pytest.mark.parametrize("data_mimetype", [None, MimeType.JSON, MimeType.BSON])
+    def test_error_data_mimetype_round_trip(self, data_mimetype):
+        data = {"key": "value", "nested": {"items": [1, 2, 3]}}
+        exc = CustomError("some error message", error_data=data)
+        headers = dict()
+
+        error_info, _ = Error.from_exception(exc)
+        returned = error_info.to_headers(headers, data_mimetype=data_mimetype)
+
+        assert returned is None
+        assert Error.from_headers(headers) == error_info
+
+    def test_error_data_fast_json(self):
+        exc = CustomError("some error message", error_data={"key": "value"})
+        headers = dict()
+
+        error_info, _ = Error.from_exception(exc)
+        error_info.to_headers(headers, data_mimetype=MimeType.JSON)
+
+        assert headers["error-data"] == '{"key":"value"}'
+
+    @pytest.mark.parametrize("data_mimetype", [None, MimeType.JSON, MimeType.BSON])
+    def test_error_data_in_body(self, data_mimetype):
+        data = {"key": "value" * 100}
+        exc = CustomError("some error message", error_data=data)
+        headers = dict()
+
+        error_info, _ = Error.from_exception(exc)
+        content = error_info.to_headers(
+            headers, data_mimetype=data_mimetype, max_data_size=100
+        )
+
+        assert isinstance(content, bytes)
+        assert "error-data" not in headers
+        assert headers["error-data-location"] == "body"
+
+        assert Error.from_headers(headers, content) == error_info
+
+        with pytest.raises(NoContentError):
+            Error.from_headers(headers)
+
+    def test_error_data_under_max_size(self):
+        exc = CustomError("some error message", error_data={"key": "value"})
+        headers = dict()
+
+        error_info, _ = Error.from_exception(exc)
+        content = error_info.to_headers(headers, max_data_size=100)
+
+        assert content is None
+        assert headers["error-data"] == json.dumps({"key": "value"})
+
+    def test_error_data_mimetype_unsupported(self):
+        exc = CustomError("some error message", error_data={"key": "value"})
+        error_info, _ = Error.from_exception(exc)
+
+        with pytest.raises(ValueError):
+            error_info.to_headers(dict(), data_mimetype=MimeType.YAML)
+
     def test_error_from_headers_no_error(self):
         headers = dict()
 
@@ -117,6 +186,58 @@ class TestError:
         assert exc_generated.error_data == exc.error_data
         assert str(exc_generated) == str(exc)
 
+    def test_slotted(self):
+        error = Error(name="CustomError", message="some error message", code=2001)
+
+        assert not hasattr(error, "__dict__")
+        with pytest.raises(AttributeError):
+            error.unknown = 1
+
+    def test_lazy_id(self):
+        error = Error(name="CustomError", message="some error message", code=2001)
+
+        assert isinstance(error.id, uuid.UUID)
+        assert error.id == error.id
+
+    def test_explicit_id(self):
+        error_id = uuid.uuid4()
+        error = Error(
+            name="CustomError", message="some message", code=2001, id=error_id
+        )
+
+        assert error.id is error_id
+
+    def test_pickle(self):
+        error = Error(name="CustomError", message="some error message", code=2001)
+
+        assert pickle.loads(pickle.dumps(error)) == error
+
+    def test_to_exception_does_not_mutate(self):
+        exc = CustomError("some error message")
+        error_info, _ = Error.from_exception(exc)
+        errors_additional = {CustomError.api_code: CustomError}
+
+        error_info.to_exception(errors_additional=errors_additional)
+
+        assert errors_additional == {CustomError.api_code: CustomError}
+
+    def test_to_exception_registry(self):
+        exc = CustomError("some error message", error_data={"key": "value"})
+        error_info, _ = Error.from_exception(exc)
+        registry = errors_api.ErrorRegistry([CustomError])
+
+        exc_generated = error_info.to_exception(registry)
+        assert type(exc_generated) is CustomError
+
+        builtin_info, _ = Error.from_exception(errors_api.APILimitError("message"))
+        assert type(builtin_info.to_exception(registry)) is errors_api.APILimitError
+
+    def test_to_exception_registry_error(self):
+        error_info, _ = Error.from_exception(CustomError("some error message"))
+
+        with pytest.raises(InvalidAPIErrorCodeError):
+            error_info.to_exception(errors_api.ErrorRegistry())
+
     def test_to_exception_error(self):
         exc = CustomError("some error message", error_data={"key": "value"})
 
@@ -126,6 +247,46 @@ class TestError:
             error_info.to_exception()
 
 
+class TestErrorBatch:
+    @pytest.mark.parametrize("mimetype", [MimeType.JSON, MimeType.BSON])
+    def test_content_round_trip(self, mimetype: MimeType):
+        batch = ErrorBatch()
+        batch.add_exception(3, CustomError("custom", error_data={"nested": {"a": 1}}))
+        batch.add_exception(9999, ValueError("unknown"))
+        headers = dict()
+
+        content = batch.to_content(mimetype=mimetype, headers=headers)
+        assert headers["Content-Type"] == mimetype.value
+
+        loaded = ErrorBatch.from_content(content, mimetype=mimetype)
+
+        assert loaded == batch
+
+    def test_to_exceptions(self):
+        batch = ErrorBatch()
+        batch.add_exception(0, errors_api.APILimitError("limit"))
+        batch.add_exception(7, CustomError("custom"))
+
+        exceptions = batch.to_exceptions({CustomError.api_code: CustomError})
+
+        assert set(exceptions) == {0, 7}
+        assert type(exceptions[0]) is errors_api.APILimitError
+        assert type(exceptions[7]) is CustomError
+        assert exceptions[7].id == batch.errors[7].id
+
+    def test_to_exceptions_unknown_code(self):
+        batch = ErrorBatch()
+        batch.add_exception(0, CustomError("custom"))
+
+        with pytest.raises(InvalidAPIErrorCodeError):
+            batch.to_exceptions()
+
+    def test_empty(self):
+        content = ErrorBatch().to_content()
+
+        assert ErrorBatch.from_content(content, MimeType.JSON) == ErrorBatch()
+
+
 class TestPaging:
     def test_to_params(self, paging_req: PagingReq):
         params = dict()
@@ -194,6 +355,11 @@ class TestPaging:
 
         assert from_headers == paging_resp
 
+    def test_slotted(self, paging_req: PagingReq, paging_resp: PagingResp):
+        assert not hasattr(paging_req, "__dict__")
+        assert not hasattr(paging_resp, "__dict__")
+        assert isinstance(paging_resp, PagingReq)
+
     def test_from_headers(self, paging_resp: PagingResp):
 
         headers = dict()
@@ -202,3 +368,69 @@ class TestPaging:
         from_headers = PagingResp.from_headers(headers)
 
         assert from_headers == paging_resp
+
+
+class TestCursorPaging:
+    def test_cursor_round_trip(self):
+        keys = {
+            "created": datetime.datetime(
+                2020, 1, 2, 3, 4, 5, 6000, tzinfo=datetime.timezone.utc
+            ),
+            "id": uuid.uuid4(),
+            "price": decimal.Decimal("1.25"),
+            "name": "some name",
+            "count": 10,
+        }
+
+        cursor = encode_cursor(keys)
+
+        assert "=" not in cursor
+        assert decode_cursor(cursor) == keys
+
+    @pytest.mark.parametrize("cursor", ["not a cursor", "AAAA", ""])
+    def test_decode_invalid(self, cursor: str):
+        with pytest.raises(ValueError):
+            decode_cursor(cursor)
+
+    def test_params_round_trip(self):
+        paging = PagingCursorReq(cursor=encode_cursor({"id": 10}), limit=10)
+        params = dict()
+        paging.to_params(params)
+
+        assert params["paging-cursor"] == paging.cursor
+        assert params["paging-limit"] == "10"
+        assert PagingCursorReq.from_params(params) == paging
+
+    def test_params_first_page(self):
+        params = dict()
+        PagingCursorReq(cursor=None, limit=10).to_params(params)
+
+        assert params == {"paging-limit": "10"}
+        assert PagingCursorReq.from_params(params).cursor is None
+
+    def test_from_params_default_limit(self):
+        assert PagingCursorReq.from_params(dict(), default_limit=5).limit == 5
+
+        with pytest.raises(KeyError):
+            PagingCursorReq.from_params(dict())
+
+    def test_headers_round_trip(self, paging_cursor_resp: PagingCursorResp):
+        headers = dict()
+        paging_cursor_resp.to_headers(headers)
+
+        assert headers["paging-next-cursor"] == paging_cursor_resp.next_cursor
+        assert headers["paging-previous-cursor"] == paging_cursor_resp.previous_cursor
+        assert PagingCursorResp.from_headers(headers) == paging_cursor_resp
+
+    def test_headers_round_trip_optionals(self, paging_cursor_resp: PagingCursorResp):
+        paging_cursor_resp.cursor = None
+        paging_cursor_resp.next_cursor = None
+        paging_cursor_resp.previous_cursor = None
+        paging_cursor_resp.next = None
+        paging_cursor_resp.previous = None
+
+        headers = dict()
+        paging_cursor_resp.to_headers(headers)
+
+        assert headers == {"paging-limit": "10"}
+        assert PagingCursorResp.from_headers(headers) == paging_cursor_resp
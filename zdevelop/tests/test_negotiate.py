@@ -0,0 +1,91 @@
+import pytest
+
+from spantools import MimeType, negotiate, DEFAULT_CODECS
+from spantools import _negotiate
+
+
+@pytest.mark.parametrize(
+    "accept,expected",
+    [
+        ("application/json", MimeType.JSON),
+        ("application/bson", MimeType.BSON),
+        ("application/x-yaml", MimeType.YAML),
+        ("text/yaml, application/YAML", MimeType.YAML),
+        ("text/plain; charset=utf-8", MimeType.TEXT),
+        ("application/protobuf-stream", MimeType.PROTO_STREAM),
+        # q-values
+        ("application/json;q=0.5, application/bson", MimeType.BSON),
+        ("application/json;q=0.5, application/bson;q=0.8", MimeType.BSON),
+        ("application/json; q=1.0, application/bson;q=0.8", MimeType.JSON),
+        # Wildcards resolve to the first available entry.
+        ("*/*", MimeType.JSON),
+        ("*", MimeType.JSON),
+        ("text/*", MimeType.TEXT),
+        ("application/*;q=0.5, text/*", MimeType.TEXT),
+        # The most specific range wins over wildcards.
+        ("*/*, application/json;q=0", MimeType.BSON),
+        ("application/*;q=0.1, application/bson;q=0.9", MimeType.BSON),
+        # Browser style header.
+        (
+            "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            MimeType.JSON,
+        ),
+        # Nothing acceptable.
+        ("text/html", None),
+        ("application/json;q=0", None),
+        ("application/json;q=bad", None),
+        # Only exact type/subtype spellings and wildcards match.
+        ("application", None),
+        ("text", None),
+        ("json", None),
+        ("application/jso", None),
+        ("text/plain-extra", None),
+        # q-values outside 0 - 1 are ignored.
+        ("application/json;q=2, application/bson;q=0.5", MimeType.BSON),
+        ("application/json;q=-1", None),
+        ("application/json;q=nan", None),
+    ],
+)
+def test_negotiate(accept: str, expected: MimeType):
+    assert negotiate(accept) is expected
+
+
+@pytest.mark.parametrize("accept", [None, ""])
+def test_no_accept(accept):
+    assert negotiate(accept) is DEFAULT_CODECS.encoder_mimetypes()[0]
+    assert negotiate(accept, available=[MimeType.BSON]) is MimeType.BSON
+    assert negotiate(accept, available=[]) is None
+
+
+def test_ties_prefer_available_order():
+    accept = "application/json, application/bson"
+
+    assert negotiate(accept, [MimeType.BSON, MimeType.JSON]) is MimeType.BSON
+    assert negotiate(accept, [MimeType.JSON, MimeType.BSON]) is MimeType.JSON
+
+
+def test_custom_mimetypes():
+    available = ["application/vnd.custom+json", MimeType.JSON]
+
+    assert negotiate("application/vnd.custom+json", available) == available[0]
+    assert negotiate("application/*", available) == available[0]
+    assert negotiate("application/json", available) is MimeType.JSON
+
+
+def test_mapping_changes_respected():
+    encoders = {MimeType.JSON: None}
+    assert negotiate("application/bson", encoders) is None
+
+    encoders[MimeType.BSON] = None
+    assert negotiate("application/bson", encoders) is MimeType.BSON
+
+
+def test_registry_mimetypes(monkeypatch):
+    codecs = DEFAULT_CODECS.derive()
+    codecs.register("application/x-upper", encoder=lambda data: data.upper())
+
+    assert negotiate("application/upper", codecs) == "application/upper"
+    assert negotiate("application/upper") is None
+
+    monkeypatch.setattr(_negotiate, "DEFAULT_CODECS", codecs)
+    assert negotiate("application/x-upper") == "application/upper"
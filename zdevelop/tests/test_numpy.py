@@ -0,0 +1,137 @@
+import subprocess
+import sys
+
+import bson
+import msgpack
+import numpy
+import pytest
+
+from spantools import (
+    encode_content,
+    decode_content,
+    iter_msgpack_records,
+    MimeType,
+    ContentDecodeError,
+    ContentEncodeError,
+    ndarray_to_bytes,
+    ndarray_from_bytes,
+    NDARRAY_BSON_SUBTYPE,
+    NDARRAY_MAGIC,
+    NDARRAY_MSGPACK_CODE,
+)
+from spantools._numpy import _numpy_types
+
+
+ARRAYS = [
+    numpy.arange(12, dtype="<f4").reshape(3, 4),
+    numpy.arange(5, dtype=">i8"),
+    numpy.array([True, False]),
+    numpy.zeros((0, 3)),
+    numpy.arange(6, dtype=numpy.uint8).reshape(2, 3).T,
+]
+
+
+@pytest.mark.parametrize("array", ARRAYS)
+def test_bytes_round_trip(array):
+    loaded = ndarray_from_bytes(ndarray_to_bytes(array))
+
+    assert loaded.dtype == array.dtype
+    assert loaded.shape == array.shape
+    assert numpy.array_equal(loaded, array)
+
+
+def test_from_bytes_zero_copy():
+    payload = ndarray_to_bytes(numpy.arange(1000, dtype=numpy.int64))
+
+    loaded = ndarray_from_bytes(payload)
+
+    assert loaded.base is not None
+    assert not loaded.flags.writeable
+
+
+def test_bytes_magic():
+    assert ndarray_to_bytes(ARRAYS[0]).startswith(NDARRAY_MAGIC)
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        b"not an array",
+        # Parses as a header + data without the magic prefix.
+        b"\x03\x01<f4" + (2).to_bytes(8, "little") + bytes(8),
+        NDARRAY_MAGIC,
+        NDARRAY_MAGIC + b"\x02" + ndarray_to_bytes(ARRAYS[1])[len(NDARRAY_MAGIC) + 1 :],
+    ],
+)
+def test_from_bytes_invalid(payload):
+    with pytest.raises(ContentDecodeError):
+        ndarray_from_bytes(payload)
+
+
+def test_object_array():
+    with pytest.raises(ContentEncodeError):
+        encode_content({"a": numpy.array([object()])}, MimeType.BSON)
+
+
+@pytest.mark.parametrize("mimetype", [MimeType.BSON, MimeType.MSGPACK])
+@pytest.mark.parametrize("array", ARRAYS)
+def test_binary_round_trip(mimetype, array):
+    data = {"array": array, "scalar": numpy.float32(1.5), "count": numpy.int64(3)}
+
+    loaded, _ = decode_content(encode_content(data, mimetype), mimetype)
+
+    assert isinstance(loaded["array"], numpy.ndarray)
+    assert loaded["array"].dtype == array.dtype
+    assert numpy.array_equal(loaded["array"], array)
+    assert loaded["scalar"] == 1.5
+    assert loaded["count"] == 3
+
+
+def test_json_round_trip():
+    data = {"array": ARRAYS[0], "scalar": numpy.float32(1.5), "flag": numpy.bool_(1)}
+
+    loaded, _ = decode_content(encode_content(data, MimeType.JSON), MimeType.JSON)
+
+    assert loaded == {"array": ARRAYS[0].tolist(), "scalar": 1.5, "flag": True}
+
+
+def test_bson_list():
+    data = [{"array": numpy.arange(i + 1)} for i in range(3)]
+
+    loaded, _ = decode_content(encode_content(data, MimeType.BSON), MimeType.BSON)
+
+    assert [record["array"].tolist() for record in loaded] == [[0], [0, 1], [0, 1, 2]]
+
+
+def test_iter_msgpack_records():
+    data = [{"array": numpy.arange(i + 1)} for i in range(3)]
+    encoded = encode_content(data, MimeType.MSGPACK)
+
+    records = list(iter_msgpack_records(encoded))
+
+    assert [record["array"].tolist() for record in records] == [[0], [0, 1], [0, 1, 2]]
+
+
+@pytest.mark.parametrize(
+    "payload", [b"\x00\x01", b"\x03\x01<f4" + (2).to_bytes(8, "little") + bytes(8)],
+)
+@pytest.mark.parametrize("code", [1, NDARRAY_MSGPACK_CODE])
+def test_foreign_payloads_pass_through(payload, code):
+    foreign = bson.Binary(payload, NDARRAY_BSON_SUBTYPE)
+    ext = msgpack.ExtType(code, payload)
+
+    bson_loaded, _ = decode_content(bson.BSON.encode({"a": foreign}), MimeType.BSON)
+    msgpack_loaded, _ = decode_content(msgpack.packb({"a": ext}), MimeType.MSGPACK)
+
+    assert bson_loaded["a"] == foreign
+    assert msgpack_loaded["a"] == ext
+
+
+def test_numpy_not_imported(monkeypatch):
+    monkeypatch.delitem(sys.modules, "numpy")
+    assert _numpy_types() == ()
+
+
+def test_import_does_not_load_numpy():
+    check = "import sys, spantools; assert 'numpy' not in sys.modules"
+    subprocess.run([sys.executable, "-c", check], check=True)
@@ -0,0 +1,351 @@
+import asyncio
+import threading
+import pytest
+from typing import Dict, List, Optional
+
+from spantools import (
+    PagingReq,
+    PagingResp,
+    iter_pages,
+    aiter_pages,
+    fan_out_pages,
+    afan_out_pages,
+    page_requests,
+)
+
+
+URL = "www.someapi.com/items"
+
+
+class FakeAPI:
+    """Serves pages of ``list(range(total_items))`` and records requests made."""
+
+    def __init__(
+        self, total_items: int, send_totals: bool = True, send_next: bool = True
+    ):
+        self.items: List[int] = list(range(total_items))
+        self.send_totals: bool = send_totals
+        self.send_next: bool = send_next
+        self.requests: List[PagingReq] = list()
+        self.urls: List[Optional[str]] = list()
+        self.lock = threading.Lock()
+
+    def headers(self, paging: PagingReq) -> Dict[str, str]:
+        total = len(self.items)
+        next_offset = paging.offset + paging.limit
+        next_url = None
+        if self.send_next and next_offset < total:
+            next_url = f"{URL}?offset={next_offset}&limit={paging.limit}"
+
+        resp = PagingResp(
+            offset=paging.offset,
+            limit=paging.limit,
+            current_page=paging.offset // paging.limit + 1,
+            previous=None,
+            next=next_url,
+            total_items=total if self.send_totals else None,
+            total_pages=None,
+        )
+        headers: Dict[str, str] = dict()
+        resp.to_headers(headers)
+        return headers
+
+    def fetch(self, paging: PagingReq, url: Optional[str]):
+        with self.lock:
+            self.requests.append(paging)
+            self.urls.append(url)
+        data = self.items[paging.offset : paging.offset + paging.limit]  # noqa: E203
+        return self.headers(paging), data
+
+    async def afetch(self, paging: PagingReq, url: Optional[str]):
+        await asyncio.sleep(0)
+        return self.fetch(paging, url)
+
+
+async def collect(pages) -> list:
+    return [page async for page in pages]
+
+
+@pytest.mark.parametrize("prefetch", [0, 1, 4])
+@pytest.mark.parametrize("follow_next", [True, False])
+@pytest.mark.parametrize("send_totals", [True, False])
+def test_iter_pages(prefetch: int, follow_next: bool, send_totals: bool):
+    api = FakeAPI(total_items=95, send_totals=send_totals)
+
+    pages = list(
+        iter_pages(
+            api.fetch,
+            PagingReq(offset=0, limit=10),
+            follow_next=follow_next,
+            prefetch=prefetch,
+        )
+    )
+
+    assert [item for page in pages for item in page.data] == api.items
+    assert [page.paging.offset for page in pages] == list(range(0, 95, 10))
+    # No page past the end is requested.
+    assert len(api.requests) == 10
+
+
+def test_iter_pages_follows_next_url():
+    api = FakeAPI(total_items=30)
+
+    list(iter_pages(api.fetch, PagingReq(offset=0, limit=10)))
+
+    assert api.urls == [
+        None,
+        f"{URL}?offset=10&limit=10",
+        f"{URL}?offset=20&limit=10",
+    ]
+
+
+def test_iter_pages_advance_offset():
+    api = FakeAPI(total_items=30)
+
+    list(iter_pages(api.fetch, PagingReq(offset=0, limit=10), follow_next=False))
+
+    assert api.urls == [None, None, None]
+    assert [r.offset for r in api.requests] == [0, 10, 20]
+
+
+def test_iter_pages_total_pages():
+    api = FakeAPI(total_items=30, send_totals=False, send_next=False)
+
+    def fetch(paging: PagingReq, url: Optional[str]):
+        headers, data = api.fetch(paging, url)
+        headers["paging-total-pages"] = "3"
+        return headers, data
+
+    pages = list(iter_pages(fetch, PagingReq(offset=0, limit=10), follow_next=False))
+
+    assert [item for page in pages for item in page.data] == api.items
+
+
+def test_iter_pages_max_pages():
+    api = FakeAPI(total_items=100)
+
+    pages = list(
+        iter_pages(
+            api.fetch,
+            PagingReq(offset=0, limit=10),
+            follow_next=False,
+            prefetch=4,
+            max_pages=3,
+        )
+    )
+
+    assert len(pages) == 3
+    assert len(api.requests) == 3
+
+
+def test_iter_pages_prefetches():
+    api = FakeAPI(total_items=100)
+    fetched_first = threading.Event()
+
+    def fetch(paging: PagingReq, url: Optional[str]):
+        if paging.offset == 10:
+            fetched_first.set()
+        return api.fetch(paging, url)
+
+    pages = iter_pages(fetch, PagingReq(offset=0, limit=10))
+    next(pages)
+
+    # The second page is requested without advancing the iterator.
+    assert fetched_first.wait(timeout=5)
+    pages.close()
+
+
+def test_iter_pages_early_exit_cancels():
+    api = FakeAPI(total_items=1000)
+    release = threading.Event()
+
+    def fetch(paging: PagingReq, url: Optional[str]):
+        if paging.offset > 0:
+            release.wait(timeout=5)
+        return api.fetch(paging, url)
+
+    pages = iter_pages(
+        fetch, PagingReq(offset=0, limit=10), follow_next=False, prefetch=2
+    )
+    for _ in pages:
+        break
+    pages.close()
+    release.set()
+
+    # Only the pages already running when the loop exited were fetched.
+    assert len(api.requests) <= 3
+
+
+def test_iter_pages_fetch_error():
+    def fetch(paging: PagingReq, url: Optional[str]):
+        raise ConnectionError("failed")
+
+    with pytest.raises(ConnectionError):
+        list(iter_pages(fetch, PagingReq(offset=0, limit=10)))
+
+
+@pytest.mark.parametrize("prefetch", [0, 1, 4])
+@pytest.mark.parametrize("follow_next", [True, False])
+def test_aiter_pages(prefetch: int, follow_next: bool):
+    api = FakeAPI(total_items=95)
+
+    pages = asyncio.run(
+        collect(
+            aiter_pages(
+                api.afetch,
+                PagingReq(offset=0, limit=10),
+                follow_next=follow_next,
+                prefetch=prefetch,
+            )
+        )
+    )
+
+    assert [item for page in pages for item in page.data] == api.items
+    assert len(api.requests) == 10
+
+
+def test_aiter_pages_early_exit_cancels():
+    api = FakeAPI(total_items=1000)
+    cancelled: List[int] = list()
+
+    async def fetch(paging: PagingReq, url: Optional[str]):
+        if paging.offset > 0:
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.append(paging.offset)
+                raise
+        return api.fetch(paging, url)
+
+    async def first_only():
+        pages = aiter_pages(
+            fetch, PagingReq(offset=0, limit=10), follow_next=False, prefetch=3
+        )
+        async for page in pages:
+            # Let the prefetch tasks start before exiting.
+            await asyncio.sleep(0)
+            break
+        await pages.aclose()
+        await asyncio.sleep(0)
+        return page
+
+    page = asyncio.run(first_only())
+
+    assert page.data == list(range(10))
+    assert cancelled == [10, 20, 30]
+    assert len(api.requests) == 1
+
+
+class TestPageRequests:
+    def test_total_items(self, paging_resp: PagingResp):
+        requests = page_requests(paging_resp)
+        assert [(r.offset, r.limit) for r in requests] == [(30, 10), (40, 10)]
+
+    def test_total_pages(self, paging_resp: PagingResp):
+        paging_resp.total_items = None
+        requests = page_requests(paging_resp)
+        assert [(r.offset, r.limit) for r in requests] == [(30, 10), (40, 10)]
+
+    def test_last_page(self, paging_resp: PagingResp):
+        paging_resp.offset = 40
+        paging_resp.current_page = 5
+        assert page_requests(paging_resp) == []
+
+    def test_unknown_totals(self, paging_resp: PagingResp):
+        paging_resp.total_items = None
+        paging_resp.total_pages = None
+        with pytest.raises(ValueError):
+            page_requests(paging_resp)
+
+
+class TestFanOut:
+    @pytest.mark.parametrize("concurrency", [1, 3, 20])
+    def test_ordered(self, concurrency: int):
+        api = FakeAPI(total_items=95)
+
+        pages = list(
+            fan_out_pages(api.fetch, PagingReq(offset=0, limit=10), concurrency)
+        )
+
+        assert [item for page in pages for item in page.data] == api.items
+        assert len(api.requests) == 10
+
+    def test_as_completed(self):
+        api = FakeAPI(total_items=95)
+        slow = threading.Event()
+
+        def fetch(paging: PagingReq, url: Optional[str]):
+            if paging.offset == 10:
+                slow.wait(timeout=5)
+            return api.fetch(paging, url)
+
+        pages = fan_out_pages(
+            fetch, PagingReq(offset=0, limit=10), concurrency=4, ordered=False
+        )
+        offsets = [next(pages).paging.offset, next(pages).paging.offset]
+        slow.set()
+        offsets.extend(page.paging.offset for page in pages)
+
+        # The slow second page does not hold up the pages after it.
+        assert offsets[0] == 0
+        assert offsets[1] in (20, 30, 40)
+        assert sorted(offsets) == list(range(0, 95, 10))
+
+    def test_concurrency_bounded(self):
+        api = FakeAPI(total_items=200)
+        lock = threading.Lock()
+        running = [0, 0]
+
+        def fetch(paging: PagingReq, url: Optional[str]):
+            with lock:
+                running[0] += 1
+                running[1] = max(running)
+            result = api.fetch(paging, url)
+            with lock:
+                running[0] -= 1
+            return result
+
+        list(fan_out_pages(fetch, PagingReq(offset=0, limit=10), concurrency=3))
+
+        assert running[1] <= 3
+
+    def test_unknown_totals(self):
+        api = FakeAPI(total_items=95, send_totals=False)
+        pages = fan_out_pages(api.fetch, PagingReq(offset=0, limit=10))
+
+        with pytest.raises(ValueError):
+            list(pages)
+
+    @pytest.mark.parametrize("ordered", [True, False])
+    def test_async(self, ordered: bool):
+        api = FakeAPI(total_items=95)
+
+        pages = asyncio.run(
+            collect(
+                afan_out_pages(
+                    api.afetch, PagingReq(offset=0, limit=10), 3, ordered=ordered
+                )
+            )
+        )
+
+        offsets = [page.paging.offset for page in pages]
+        if ordered:
+            assert offsets == list(range(0, 95, 10))
+        else:
+            assert sorted(offsets) == list(range(0, 95, 10))
+        assert sorted(item for page in pages for item in page.data) == api.items
+
+    def test_async_concurrency_bounded(self):
+        api = FakeAPI(total_items=200)
+        running = [0, 0]
+
+        async def fetch(paging: PagingReq, url: Optional[str]):
+            running[0] += 1
+            running[1] = max(running)
+            await asyncio.sleep(0)
+            running[0] -= 1
+            return api.fetch(paging, url)
+
+        asyncio.run(collect(afan_out_pages(fetch, PagingReq(offset=0, limit=10), 4)))
+
+        assert running[1] == 4
@@ -0,0 +1,206 @@
+import io
+import pytest
+from typing import Iterator
+from proto import Echo
+
+from spantools import (
+    ProtoCodec,
+    MimeType,
+    ContentDecodeError,
+    ContentEncodeError,
+    encode_content,
+    decode_content,
+    iter_proto_messages,
+    iter_proto_frames,
+)
+from spantools._proto import encode_varint, decode_varint
+
+
+@pytest.mark.parametrize("value", [0, 1, 127, 128, 300, 2 ** 32, 2 ** 64 - 1])
+def test_varint_round_trip(value: int):
+    encoded = encode_varint(value)
+    decoded, position = decode_varint(encoded)
+
+    assert decoded == value
+    assert position == len(encoded)
+
+
+def test_varint_truncated():
+    with pytest.raises(ContentDecodeError):
+        decode_varint(encode_varint(300)[:1])
+
+
+def test_varint_too_long():
+    with pytest.raises(ContentDecodeError, match="longer than 10 bytes"):
+        decode_varint(b"\xff" * 10 + b"\x01")
+
+    with pytest.raises(ValueError):
+        encode_varint(2 ** 64)
+
+
+def test_stream_varint_too_long():
+    codec = ProtoCodec.for_message(Echo)
+    stream = io.BytesIO(b"\xff" * 11 + b"\x01")
+
+    with pytest.raises(ContentDecodeError, match="longer than 10 bytes"):
+        list(codec.iter_decode_stream(stream, chunk_size=1))
+
+
+class TestProtoCodec:
+    def test_cached_per_class(self):
+        assert ProtoCodec.for_message(Echo) is ProtoCodec.for_message(Echo)
+
+    def test_round_trip(self):
+        codec = ProtoCodec.for_message(Echo)
+        encoded = codec.encode(Echo(message="some message"))
+
+        decoded = codec.decode(encoded)
+        assert isinstance(decoded, Echo)
+        assert decoded.message == "some message"
+
+    def test_encode_wrong_type(self):
+        with pytest.raises(ContentEncodeError):
+            ProtoCodec.for_message(Echo).encode("not a message")
+
+    def test_decode_error(self):
+        with pytest.raises(ContentDecodeError):
+            ProtoCodec.for_message(Echo).decode(b"\xff\xff\xff")
+
+    def test_pool_reuse(self):
+        codec = ProtoCodec(Echo, pool_size=1)
+        message = codec.decode(Echo(message="first").SerializeToString())
+
+        codec.release(message)
+        reused = codec.acquire()
+
+        assert reused is message
+        assert reused.message == ""
+
+        codec.decode(Echo(message="second").SerializeToString(), reused)
+        assert reused.message == "second"
+
+    def test_pool_size_bound(self):
+        codec = ProtoCodec(Echo, pool_size=1)
+        first = Echo()
+        codec.release(first)
+        codec.release(Echo())
+
+        assert codec.acquire() is first
+        assert codec.acquire() is not first
+
+    def test_delimited_round_trip(self):
+        codec = ProtoCodec.for_message(Echo)
+        messages = [Echo(message=f"message {i}") for i in range(100)]
+        messages.append(Echo())
+
+        encoded = codec.encode_delimited(messages)
+        decoded = codec.decode_delimited(encoded)
+
+        assert decoded == messages
+
+    def test_delimited_reuse(self):
+        codec = ProtoCodec.for_message(Echo)
+        messages = [Echo(message=f"message {i}") for i in range(10)]
+        encoded = codec.encode_delimited(messages)
+
+        loaded = list()
+        instances = set()
+        for message in codec.iter_decode_delimited(encoded, reuse=True):
+            loaded.append(message.message)
+            instances.add(id(message))
+
+        assert loaded == [m.message for m in messages]
+        assert len(instances) == 1
+
+    def test_delimited_truncated(self):
+        codec = ProtoCodec.for_message(Echo)
+        encoded = codec.encode_delimited([Echo(message="some message")])
+
+        with pytest.raises(ContentDecodeError):
+            codec.decode_delimited(encoded[:-1])
+
+
+class TestProtoStream:
+    @pytest.mark.parametrize("chunk_size", [1, 3, 1024])
+    def test_iter_file_stream(self, chunk_size: int):
+        messages = [Echo(message=f"message {i}" * i) for i in range(50)]
+        stream = io.BytesIO(b"".join(iter_proto_frames(messages)))
+
+        codec = ProtoCodec.for_message(Echo)
+        loaded = list(codec.iter_decode_stream(stream, chunk_size=chunk_size))
+
+        assert loaded == messages
+
+    def test_iter_file_stream_truncated(self):
+        encoded = b"".join(iter_proto_frames([Echo(message="some message")]))
+        stream = io.BytesIO(encoded[:-1])
+
+        with pytest.raises(ContentDecodeError):
+            list(iter_proto_messages(stream, Echo))
+
+    @pytest.mark.parametrize("source", [bytes, io.BytesIO])
+    def test_iter_proto_messages(self, source):
+        messages = [Echo(message=f"message {i}") for i in range(10)]
+        encoded = b"".join(iter_proto_frames(messages))
+
+        loaded = iter_proto_messages(source(encoded), Echo)
+
+        assert isinstance(loaded, Iterator)
+        assert list(loaded) == messages
+
+    @pytest.mark.parametrize(
+        "mimetype", [MimeType.PROTO_STREAM, "application/x-protobuf-stream", None]
+    )
+    def test_content_round_trip(self, mimetype):
+        messages = [Echo(message=f"message {i}") for i in range(10)]
+        headers = dict()
+
+        encoded = encode_content(
+            messages, mimetype=mimetype, headers=headers, data_schema=Echo
+        )
+        assert headers["Content-Type"] == MimeType.PROTO_STREAM.value
+
+        loaded, raw = decode_content(
+            encoded, MimeType.from_headers(headers), data_schema=Echo
+        )
+
+        assert isinstance(loaded, Iterator)
+        assert list(loaded) == messages
+        assert raw == encoded
+
+    def test_encode_no_schema(self):
+        messages = [Echo(message=f"message {i}") for i in range(10)]
+
+        encoded = encode_content(messages, mimetype=MimeType.PROTO_STREAM)
+
+        assert encoded == ProtoCodec.for_message(Echo).encode_delimited(messages)
+
+    def test_single_message_mimetype(self):
+        headers = dict()
+        encode_content(Echo(message="some message"), headers=headers, data_schema=Echo)
+
+        assert headers["Content-Type"] == MimeType.PROTO.value
+
+    @pytest.mark.parametrize(
+        "mimetype", ["application/protobuf", "application/x-protobuf", "protobuf"]
+    )
+    def test_single_message_string_mimetype(self, mimetype):
+        message = Echo(message="some message")
+
+        encoded = encode_content(message, mimetype=mimetype, data_schema=Echo)
+        loaded, _ = decode_content(encoded, mimetype, data_schema=Echo)
+
+        assert encoded == ProtoCodec.for_message(Echo).encode(message)
+        assert loaded == message
+
+    @pytest.mark.parametrize(
+        "mimetype", ["application/protobuf-stream", "application/x-protobuf-stream"]
+    )
+    def test_stream_string_mimetype(self, mimetype):
+        messages = [Echo(message=f"message {i}") for i in range(3)]
+
+        encoded = encode_content(messages, mimetype=mimetype, data_schema=Echo)
+        loaded, _ = decode_content(encoded, mimetype, data_schema=Echo)
+
+        assert isinstance(loaded, Iterator)
+        assert list(loaded) == messages
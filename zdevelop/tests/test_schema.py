@@ -0,0 +1,119 @@
+import uuid
+import datetime
+import pytest
+import pytz
+import marshmallow
+
+from spantools import CompiledSchema, compile_schema, encode_content, MimeType
+
+
+class PlainSchema(marshmallow.Schema):
+    id = marshmallow.fields.UUID(required=True)
+    name = marshmallow.fields.String(required=True)
+    count = marshmallow.fields.Integer(validate=marshmallow.validate.Range(max=10))
+    ratio = marshmallow.fields.Float()
+    created = marshmallow.fields.DateTime()
+    note = marshmallow.fields.String(data_key="noteText", allow_none=True)
+
+
+class HookedSchema(PlainSchema):
+    @marshmallow.validates("count")
+    def must_be_odd(self, value: int, **kwargs):
+        if value % 2 == 0:
+            raise marshmallow.ValidationError("must be odd")
+
+
+def make_record(**kwargs) -> dict:
+    record = {
+        "id": uuid.uuid4(),
+        "name": "some name",
+        "count": 5,
+        "ratio": 0.5,
+        "created": datetime.datetime.now(tz=pytz.UTC),
+        "note": None,
+    }
+    record.update(kwargs)
+    return record
+
+
+class TestCompiledSchema:
+    def test_cached(self):
+        schema = PlainSchema()
+        assert compile_schema(schema) is compile_schema(schema)
+        assert compile_schema(schema) is not compile_schema(PlainSchema())
+
+    def test_fast_path_selection(self):
+        assert compile_schema(PlainSchema()).fast_validate is True
+        assert compile_schema(HookedSchema()).fast_validate is False
+        assert compile_schema(PlainSchema(only=("name",))).fast_validate is True
+        assert compile_schema(PlainSchema(dump_only=("name",))).fast_validate is False
+
+    def test_no_hook_registry_falls_back(self, monkeypatch):
+        schema = PlainSchema()
+        for schema_class in PlainSchema.__mro__:
+            if "_hooks" in vars(schema_class):
+                monkeypatch.delattr(schema_class, "_hooks")
+
+        compiled = CompiledSchema(schema)
+
+        assert compiled.fast_dump is False
+        assert compiled.fast_validate is False
+
+    @pytest.mark.parametrize("schema_class", [PlainSchema, HookedSchema])
+    @pytest.mark.parametrize("many", [True, False])
+    def test_dump_matches_schema(self, schema_class, many: bool):
+        schema = schema_class(many=many)
+        data = [make_record(), make_record(note="text")] if many else make_record()
+
+        assert compile_schema(schema).dump(data) == schema.dump(data)
+        assert compile_schema(schema).dump_validated(data) == schema.dump(data)
+
+    @pytest.mark.parametrize(
+        "record",
+        [
+            make_record(count=11),
+            make_record(name=None),
+            make_record(ratio=float("nan")),
+            {"count": 1},
+        ],
+    )
+    def test_validation_errors_match_schema(self, record: dict):
+        schema = PlainSchema()
+        expected = schema.validate(schema.dump(record))
+        assert expected
+
+        with pytest.raises(marshmallow.ValidationError) as error:
+            compile_schema(schema).dump_validated(record)
+
+        assert error.value.messages == expected
+
+    def test_validation_errors_many(self):
+        schema = PlainSchema(many=True)
+        records = [make_record(), make_record(count=11)]
+        expected = schema.validate(schema.dump(records))
+
+        with pytest.raises(marshmallow.ValidationError) as error:
+            compile_schema(schema).dump_validated(records)
+
+        assert error.value.messages == expected
+        assert list(error.value.messages) == [1]
+
+    def test_fallback_validation(self):
+        compiled = CompiledSchema(HookedSchema())
+
+        with pytest.raises(marshmallow.ValidationError):
+            compiled.dump_validated(make_record(count=4))
+
+    def test_encode_content_validate(self):
+        schema = PlainSchema()
+
+        encode_content(
+            make_record(), mimetype=MimeType.JSON, data_schema=schema, validate=True
+        )
+        with pytest.raises(marshmallow.ValidationError):
+            encode_content(
+                make_record(count=11),
+                mimetype=MimeType.JSON,
+                data_schema=schema,
+                validate=True,
+            )
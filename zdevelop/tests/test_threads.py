@@ -0,0 +1,139 @@
+import threading
+from typing import Any, Callable, List
+
+import marshmallow
+import pytest
+
+from spantools import (
+    MimeType,
+    DEFAULT_CODECS,
+    GzipCompressor,
+    ZstdCompressor,
+    ValidationPolicy,
+    ValidateFirstN,
+    encode_content,
+    decode_content,
+)
+from spantools._encoders import _datetime_field, _json_encoder
+
+
+THREADS = 8
+
+
+def run_threads(target: Callable[[int], Any], threads: int = THREADS) -> List[Any]:
+    """Runs ``target(index)`` on ``threads`` threads at once, returning their results."""
+    barrier = threading.Barrier(threads)
+    results: List[Any] = [None] * threads
+    errors: List[BaseException] = list()
+
+    def run(index: int) -> None:
+        barrier.wait()
+        try:
+            results[index] = target(index)
+        except BaseException as error:
+            errors.append(error)
+
+    started = [threading.Thread(target=run, args=(i,)) for i in range(threads)]
+    for thread in started:
+        thread.start()
+    for thread in started:
+        thread.join()
+
+    if errors:
+        raise errors[0]
+    return results
+
+
+def make_records(seed: int) -> List[dict]:
+    return [{"id": seed * 100 + i, "name": f"item {i}"} for i in range(50)]
+
+
+@pytest.mark.parametrize(
+    "mimetype", [MimeType.JSON, MimeType.BSON, MimeType.MSGPACK, MimeType.CBOR]
+)
+def test_encode_decode_match_single_thread(mimetype):
+    expected = [encode_content(make_records(i), mimetype) for i in range(THREADS)]
+
+    def encode_decode(index: int) -> List[bytes]:
+        encoded = [encode_content(make_records(index), mimetype) for _ in range(20)]
+        for body in encoded:
+            loaded, _ = decode_content(body, mimetype)
+            assert [dict(record) for record in loaded] == make_records(index)
+        return encoded
+
+    for index, encoded in enumerate(run_threads(encode_decode)):
+        assert encoded == [expected[index]] * 20
+
+
+@pytest.mark.parametrize("compressor", [GzipCompressor(), ZstdCompressor()])
+def test_compressors_shared(compressor):
+    bodies = [encode_content(make_records(i), MimeType.JSON) for i in range(THREADS)]
+
+    def round_trip(index: int) -> None:
+        for _ in range(50):
+            compressed = compressor.compress(bodies[index])
+            assert compressor.decompress(compressed) == bodies[index]
+
+    run_threads(round_trip)
+
+
+def test_json_encoder_per_thread():
+    encoders = run_threads(lambda index: (_json_encoder(), _json_encoder()))
+
+    assert all(first is second for first, second in encoders)
+    assert len({id(first) for first, _ in encoders}) == THREADS
+
+
+def test_datetime_field_per_thread():
+    fields = run_threads(lambda index: (_datetime_field(), _datetime_field()))
+
+    assert all(first is second for first, second in fields)
+    assert len({id(first) for first, _ in fields}) == THREADS
+
+
+def test_policy_counts_exact():
+    policy = ValidationPolicy()
+
+    def record(index: int) -> None:
+        for i in range(500):
+            policy.record(None, validated=i % 2 == 0, failed=i % 4 == 0)
+
+    run_threads(record)
+
+    assert policy.stats.validated == THREADS * 250
+    assert policy.stats.skipped == THREADS * 250
+    assert policy.stats.failures == THREADS * 125
+
+
+def test_first_n_exact():
+    policy = ValidateFirstN(100)
+    schema = marshmallow.Schema()
+
+    decisions = run_threads(
+        lambda index: sum(policy.should_validate(schema, None) for _ in range(50))
+    )
+
+    assert sum(decisions) == 100
+
+
+def test_registry_register_while_resolving():
+    codecs = DEFAULT_CODECS.derive()
+    registered = threading.Event()
+
+    def encoder(data: Any) -> bytes:
+        return b"custom"
+
+    def resolve(index: int) -> None:
+        if index == 0:
+            codecs.register("application/x-custom", encoder=encoder)
+            registered.set()
+            return
+
+        while not registered.is_set():
+            codecs.encoder("application/custom")
+            codecs.sniff_decoders()
+
+    run_threads(resolve)
+
+    assert codecs.encoder("application/custom") is encoder
+    assert DEFAULT_CODECS.encoder("application/custom") is None
@@ -1,6 +1,8 @@
+import datetime
+import enum
 import uuid
 
-from spantools import convert_params_headers
+from spantools import MimeType, convert_params_headers, format_param_value
 
 
 class TestConvertHeadersParams:
@@ -17,3 +19,67 @@ class TestConvertHeadersParams:
 
     def test_none(self):
         convert_params_headers(None)
+
+    def test_typed(self):
+        incoming = {
+            "true": True,
+            "false": False,
+            "float": 1.5,
+            "datetime": datetime.datetime(2020, 1, 2, 3, 4, 5),
+            "date": datetime.date(2020, 1, 2),
+            "mimetype": MimeType.JSON,
+            "none": None,
+        }
+
+        convert_params_headers(incoming)
+
+        assert incoming == {
+            "true": "true",
+            "false": "false",
+            "float": "1.5",
+            "datetime": "2020-01-02T03:04:05",
+            "date": "2020-01-02",
+            "mimetype": "application/json",
+            "none": "None",
+        }
+
+    def test_int_enum(self):
+        class Level(enum.IntEnum):
+            HIGH = 2
+
+        incoming = {"level": Level.HIGH}
+        convert_params_headers(incoming)
+        assert incoming == {"level": "2"}
+
+    def test_str_enum(self):
+        class Color(str, enum.Enum):
+            RED = "red"
+
+        incoming = {"color": Color.RED, "colors": [Color.RED]}
+        convert_params_headers(incoming)
+        assert incoming == {"color": "red", "colors": ["red"]}
+
+    def test_multi_valued(self):
+        id_value = uuid.uuid4()
+        incoming = {"ids": [id_value, 2, True], "tags": ("a", "b")}
+
+        convert_params_headers(incoming)
+
+        assert incoming == {"ids": [str(id_value), "2", "true"], "tags": ["a", "b"]}
+
+    def test_copy(self):
+        incoming = {"int": 10, "string": "value"}
+
+        converted = convert_params_headers(incoming, copy=True)
+
+        assert converted == {"int": "10", "string": "value"}
+        assert converted is not incoming
+        assert incoming == {"int": 10, "string": "value"}
+
+    def test_returns_incoming(self):
+        incoming = {"int": 10}
+        assert convert_params_headers(incoming) is incoming
+
+    def test_format_param_value(self):
+        assert format_param_value(False) == "false"
+        assert format_param_value(["a", 1]) == ["a", "1"]
@@ -0,0 +1,144 @@
+import pytest
+import marshmallow
+from typing import List, Optional, Tuple
+
+from spantools import (
+    encode_content,
+    MimeType,
+    ValidationPolicy,
+    ValidateNever,
+    ValidateSample,
+    ValidateFirstN,
+    ValidateUnderSize,
+)
+
+
+class ItemSchema(marshmallow.Schema):
+    name = marshmallow.fields.String(required=True)
+    count = marshmallow.fields.Integer(validate=marshmallow.validate.Range(max=10))
+
+
+VALID = {"name": "item", "count": 1}
+INVALID = {"name": "item", "count": 11}
+
+
+class NeverPolicy(ValidationPolicy):
+    def should_validate(
+        self, data_schema: marshmallow.Schema, size: Optional[int]
+    ) -> bool:
+        return False
+
+    def may_validate(self) -> bool:
+        return False
+
+
+def encode(data: dict, schema: marshmallow.Schema, policy: ValidationPolicy) -> bytes:
+    return encode_content(
+        data, mimetype=MimeType.JSON, data_schema=schema, validate=policy
+    )
+
+
+class TestValidationPolicies:
+    def test_always(self):
+        schema = ItemSchema()
+        policy = ValidationPolicy()
+
+        encode(VALID, schema, policy)
+        with pytest.raises(marshmallow.ValidationError):
+            encode(INVALID, schema, policy)
+
+        assert policy.stats.validated == 2
+        assert policy.stats.failures == 1
+        assert policy.stats.skipped == 0
+
+    def test_never(self):
+        policy = ValidateNever()
+
+        encoded = encode(INVALID, ItemSchema(), policy)
+
+        assert encoded
+        assert policy.stats.skipped == 1
+        assert policy.stats.validated == 0
+
+    @pytest.mark.parametrize(
+        "policy",
+        [
+            ValidateNever(),
+            ValidateSample(0.0),
+            ValidateFirstN(0),
+            ValidateUnderSize(-1),
+            NeverPolicy(),
+        ],
+    )
+    def test_unvalidating_unknown_mimetype(self, policy: ValidationPolicy):
+        encoded = encode_content(
+            "text", mimetype="application/unknown", validate=policy
+        )
+        assert encoded == b"text"
+
+    def test_unknown_mimetype_validation_error(self):
+        with pytest.raises(marshmallow.ValidationError):
+            encode_content(
+                {"key": "value"},
+                mimetype="application/unknown",
+                data_schema=ItemSchema(),
+                validate=ValidateFirstN(1),
+            )
+
+    def test_sample(self):
+        rolls = iter([0.1, 0.9, 0.2, 0.6])
+        policy = ValidateSample(0.5, random_func=lambda: next(rolls))
+        schema = ItemSchema()
+
+        for _ in range(4):
+            encode(VALID, schema, policy)
+
+        assert policy.stats.validated == 2
+        assert policy.stats.skipped == 2
+
+    @pytest.mark.parametrize("rate", [-0.1, 1.1])
+    def test_sample_rate_error(self, rate: float):
+        with pytest.raises(ValueError):
+            ValidateSample(rate)
+
+    def test_first_n_per_schema(self):
+        policy = ValidateFirstN(2)
+        schema_a = ItemSchema()
+        schema_b = ItemSchema()
+
+        encode(VALID, schema_a, policy)
+        encode(VALID, schema_a, policy)
+        encode(INVALID, schema_a, policy)
+
+        with pytest.raises(marshmallow.ValidationError):
+            encode(INVALID, schema_b, policy)
+
+        assert policy.stats.validated == 3
+        assert policy.stats.skipped == 1
+        assert policy.stats.failures == 1
+
+    def test_under_size(self):
+        schema = ItemSchema()
+        small = encode(VALID, schema, ValidationPolicy())
+        policy = ValidateUnderSize(len(small) + 10)
+
+        with pytest.raises(marshmallow.ValidationError):
+            encode(INVALID, schema, policy)
+
+        encode({"name": "item" * 100, "count": 11}, schema, policy)
+
+        assert policy.stats.validated == 1
+        assert policy.stats.failures == 1
+        assert policy.stats.skipped == 1
+
+    def test_listeners(self):
+        calls: List[Tuple[marshmallow.Schema, bool, bool]] = list()
+        policy = ValidationPolicy()
+        policy.add_listener(lambda *args: calls.append(args))
+        schema = ItemSchema()
+
+        encode(VALID, schema, policy)
+        with pytest.raises(marshmallow.ValidationError):
+            encode(INVALID, schema, policy)
+
+        assert calls == [(schema, True, False), (schema, True, True)]